@@ -1,5 +1,5 @@
-from .ui_tk import launch
+from .cli import main
 
 
 if __name__ == "__main__":
-    launch()
+    raise SystemExit(main())
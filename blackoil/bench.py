@@ -0,0 +1,485 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+
+@dataclass
+class BenchResult:
+    name: str
+    seconds: float
+    detail: str = ""
+    ok: bool = True
+
+    def line(self) -> str:
+        status = "ok" if self.ok else "FAIL"
+        return f"{self.name:<24} {self.seconds * 1000:9.1f} ms  {status}  {self.detail}".rstrip()
+
+
+BENCHMARKS: dict[str, Callable[[], BenchResult]] = {}
+
+
+def benchmark(name: str) -> Callable[[Callable[[], BenchResult]], Callable[[], BenchResult]]:
+    def register(func: Callable[[], BenchResult]) -> Callable[[], BenchResult]:
+        BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+def run_benchmarks(names: list[str] | None = None) -> list[BenchResult]:
+    selected = names or list(BENCHMARKS)
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+    return [BENCHMARKS[name]() for name in selected]
+
+
+_HEADLESS_PROBE = (
+    "import sys\n"
+    "from blackoil.cli import main\n"
+    "main(['run', '--days', '1', '--seed', '1', '--quiet'])\n"
+    "print('tkinter' in sys.modules)\n"
+)
+
+
+@benchmark("startup")
+def bench_startup() -> BenchResult:
+    root = Path(__file__).resolve().parent.parent
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", _HEADLESS_PROBE],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    elapsed = time.perf_counter() - started
+    if completed.returncode != 0:
+        return BenchResult("startup", elapsed, completed.stderr.strip().splitlines()[-1], ok=False)
+    imported_tk = completed.stdout.strip().splitlines()[-1] == "True"
+    detail = "headless run imported tkinter" if imported_tk else "headless run without tkinter"
+    return BenchResult("startup", elapsed, detail, ok=not imported_tk)
+
+
+@benchmark("season")
+def bench_season() -> BenchResult:
+    from .headless import find_scenario, run_season
+
+    started = time.perf_counter()
+    result = run_season(find_scenario(None), seed=7)
+    elapsed = time.perf_counter() - started
+    return BenchResult("season", elapsed, f"{result.days} days")
+
+
+@benchmark("heatmap")
+def bench_heatmap() -> BenchResult:
+    from dataclasses import replace
+
+    from .heatmap import HeatmapCache
+    from .state import SCENARIOS, new_game_state
+
+    state = new_game_state(replace(SCENARIOS[0], grid_size=200))
+    cache = HeatmapCache()
+    started = time.perf_counter()
+    cache.layer(state, "reserve", reveal=True)
+    state.touch()
+    cache.layer(state, "reserve", reveal=True)
+    elapsed = time.perf_counter() - started
+    return BenchResult("heatmap", elapsed, "200x200 build + unchanged revision")
+
+
+@benchmark("forecast")
+def bench_forecast() -> BenchResult:
+    from .engine.forecast import FORECAST_HORIZON, FORECAST_PATHS, forecast_prices
+    from .state import SCENARIOS, new_game_state
+
+    state = new_game_state(SCENARIOS[0])
+    started = time.perf_counter()
+    forecast_prices(state)
+    elapsed = time.perf_counter() - started
+    return BenchResult("forecast", elapsed, f"{FORECAST_PATHS} paths x {FORECAST_HORIZON} days")
+
+
+@benchmark("contract-valuation")
+def bench_contract_valuation() -> BenchResult:
+    import random
+
+    from .engine.market import contract_offers
+    from .engine.valuation import VALUATION_PATHS, value_offers
+    from .state import SCENARIOS, new_game_state
+
+    random.seed(11)
+    state = new_game_state(SCENARIOS[1])
+    for tile in state.tiles[:12]:
+        tile.owner = "player"
+        tile.drilled = True
+        tile.pump_level = 2
+    offers = contract_offers(state)
+    started = time.perf_counter()
+    value_offers(state, offers)
+    elapsed = time.perf_counter() - started
+    return BenchResult("contract-valuation", elapsed, f"{len(offers)} offers x {VALUATION_PATHS} paths, 12 wells")
+
+
+@benchmark("order-book")
+def bench_order_book() -> BenchResult:
+    import random
+
+    from .engine.orderbook import OrderBook
+
+    rng = random.Random(3)
+    book = OrderBook("oil")
+    orders = 5000
+    for index in range(orders):
+        book.post_bid(f"buyer-{index}", rng.randint(20, 120), rng.randint(40, 110), 5)
+        book.post_ask(f"seller-{index}", rng.randint(20, 120), rng.randint(35, 100), 5)
+    started = time.perf_counter()
+    fills = book.clear(1)
+    elapsed = time.perf_counter() - started
+    return BenchResult("order-book", elapsed, f"{orders} bids + {orders} asks, {len(fills)} fills")
+
+
+@benchmark("buyer-sampling")
+def bench_buyer_sampling() -> BenchResult:
+    import random
+
+    from .engine.market import trade_offers
+    from .models import Buyer
+    from .state import SCENARIOS, apply_trade, new_game_state
+
+    rng = random.Random(5)
+    state = new_game_state(SCENARIOS[0])
+    state.buyers = [
+        Buyer(f"Buyer {index}", "Company", rng.randint(20, 160), rng.uniform(0.95, 1.12))
+        for index in range(20000)
+    ]
+    rounds = 1000
+    started = time.perf_counter()
+    for day in range(rounds):
+        state.day = day
+        offers = trade_offers(state)
+        apply_trade(state, offers[0], 10, "oil", state.price)
+    elapsed = time.perf_counter() - started
+    return BenchResult("buyer-sampling", elapsed, f"{rounds} offer rounds over 20000 buyers")
+
+
+@benchmark("market-clearing")
+def bench_market_clearing() -> BenchResult:
+    import random
+    from dataclasses import replace
+
+    from .headless import step_day
+    from .models import Competitor
+    from .state import SCENARIOS, new_game_state
+
+    random.seed(9)
+    state = new_game_state(replace(SCENARIOS[0], grid_size=120, max_days=100))
+    state.competitors = [
+        Competitor(f"Rival {index}", 20000, 0.6, "#ef4444", 20, 0.4, 0.3) for index in range(300)
+    ]
+    days = 10
+    started = time.perf_counter()
+    for _ in range(days):
+        step_day(state)
+    elapsed = time.perf_counter() - started
+    cleared = state.market_supply
+    return BenchResult("market-clearing", elapsed, f"{days} days, 300 competitors, 120x120, last supply {cleared}")
+
+
+@benchmark("prospects")
+def bench_prospects() -> BenchResult:
+    from .engine.geology import generate_prospect_batch, portfolio_stats
+
+    count = 1_000_000
+    started = time.perf_counter()
+    batch = generate_prospect_batch(count, seed=42)
+    generated = time.perf_counter()
+    stats = portfolio_stats(batch)
+    elapsed = time.perf_counter() - started
+    return BenchResult(
+        "prospects",
+        elapsed,
+        f"{count:,} prospects, generate {generated - started:.2f}s, risked P50 {stats.p50:,.0f}",
+    )
+
+
+@benchmark("survey-value")
+def bench_survey_value() -> BenchResult:
+    from .engine.exploration import evaluate_surveys
+    from .engine.geology import generate_prospect_batch
+
+    count = 400
+    batch = generate_prospect_batch(count, seed=13)
+    prospects = [batch.prospect(index) for index in range(count)]
+    started = time.perf_counter()
+    evaluate_surveys(prospects, samples=500, seed=13)
+    first = time.perf_counter()
+    evaluate_surveys(prospects, samples=500, seed=13)
+    elapsed = time.perf_counter() - started
+    return BenchResult(
+        "survey-value",
+        elapsed,
+        f"{count} prospects x 3 surveys, cold {first - started:.2f}s, cached {elapsed - (first - started):.4f}s",
+    )
+
+
+@benchmark("worldgen")
+def bench_worldgen() -> BenchResult:
+    from .worldgen import reservoir_field
+
+    size = 1000
+    started = time.perf_counter()
+    field = reservoir_field(size, size, seed=1234)
+    elapsed = time.perf_counter() - started
+    mean = sum(map(sum, field)) / (size * size)
+    return BenchResult("worldgen", elapsed, f"{size}x{size} reservoir field, mean {mean:.2f}")
+
+
+@benchmark("open-world")
+def bench_open_world() -> BenchResult:
+    import random
+    from dataclasses import replace
+
+    from .headless import step_day
+    from .state import SCENARIOS, new_game_state
+
+    random.seed(21)
+    size = 4000
+    started = time.perf_counter()
+    state = new_game_state(replace(SCENARIOS[0], grid_size=size, max_days=100))
+    created = time.perf_counter()
+    for _ in range(10):
+        step_day(state)
+    elapsed = time.perf_counter() - started
+    return BenchResult(
+        "open-world",
+        elapsed,
+        f"{size}x{size} map, start {created - started:.3f}s, 10 days, "
+        f"{state.tiles.chunk_count} chunks / {len(state.tiles)} tiles held",
+    )
+
+
+@benchmark("drainage")
+def bench_drainage() -> BenchResult:
+    import random
+    from dataclasses import replace
+
+    from .engine.drainage import apply_drainage
+    from .state import SCENARIOS, new_game_state
+
+    rng = random.Random(17)
+    size = 500
+    state = new_game_state(replace(SCENARIOS[0], grid_size=size))
+    for tile in rng.sample(state.tiles, len(state.tiles) // 10):
+        tile.owner = "player"
+        tile.drilled = True
+        tile.pump_level = rng.randint(1, 3)
+    days = 5
+    started = time.perf_counter()
+    moved = sum(apply_drainage(state) for _ in range(days))
+    elapsed = time.perf_counter() - started
+    return BenchResult("drainage", elapsed, f"{size}x{size}, 10% pumping, {days} days, {moved:,} barrels moved")
+
+
+@benchmark("scheduler")
+def bench_scheduler() -> BenchResult:
+    import random
+
+    from .engine.scheduler import Scheduler
+
+    rng = random.Random(8)
+    queue = Scheduler()
+    entries = 100_000
+    days = 1000
+    for index in range(entries):
+        queue.schedule(rng.randint(1, days), "bench", index)
+    started = time.perf_counter()
+    fired = sum(len(queue.pop_due(day)) for day in range(1, days + 1))
+    elapsed = time.perf_counter() - started
+    return BenchResult("scheduler", elapsed, f"{entries:,} entries over {days} days, {fired:,} fired")
+
+
+@benchmark("projects")
+def bench_projects() -> BenchResult:
+    import random
+
+    from .engine.projects import start_project
+    from .headless import step_day
+    from .state import SCENARIOS, new_game_state
+
+    random.seed(12)
+    state = new_game_state(SCENARIOS[0])
+    count = 20_000
+    for index in range(count):
+        start_project(state, "bench", f"Site {index}", 10 + index % 500, 0)
+    days = 20
+    started = time.perf_counter()
+    for _ in range(days):
+        step_day(state)
+    elapsed = time.perf_counter() - started
+    return BenchResult("projects", elapsed, f"{count:,} parallel projects, {days} days, {len(state.projects):,} active")
+
+
+@benchmark("incidents")
+def bench_incidents() -> BenchResult:
+    import random
+
+    from .engine.events import sample_fleet
+
+    rng = random.Random(4)
+    wells = 1_000_000
+    started = time.perf_counter()
+    hits = sample_fleet(wells, rng.random)
+    elapsed = time.perf_counter() - started
+    downtime = sum(hit.incident.downtime_days for hit in hits)
+    return BenchResult("incidents", elapsed, f"{wells:,} wells, {len(hits):,} incidents, {downtime:,} down-days")
+
+
+@benchmark("offshore")
+def bench_offshore() -> BenchResult:
+    import random
+
+    from .engine.offshore import availability_forecast, create_offshore_blocks, downtime_probability, fleet_downtime
+    from .state import SCENARIOS, new_game_state
+
+    rng = random.Random(6)
+    blocks = create_offshore_blocks(6, count=6) * 2000
+    probabilities = [downtime_probability(block) for block in blocks]
+    started = time.perf_counter()
+    down = sum(sum(fleet_downtime(probabilities, rng.gauss(0, 1), rng.random)) for _ in range(30))
+    fleet = time.perf_counter()
+    state = new_game_state(SCENARIOS[0])
+    availability_forecast(state)
+    availability_forecast(state)
+    elapsed = time.perf_counter() - started
+    return BenchResult(
+        "offshore",
+        elapsed,
+        f"{len(blocks):,} blocks x 30 days in {fleet - started:.2f}s ({down:,} block-days down), season forecast",
+    )
+
+
+@benchmark("rigs")
+def bench_rigs() -> BenchResult:
+    import random
+
+    from .engine.offshore import RIG_TYPES
+    from .engine.rigs import LAND, LAND_WELL_DAYS, OFFSHORE_WELL_DAYS, WELL, DrillJob, RigPlanner
+
+    rng = random.Random(7)
+    rig_types = [LAND, LAND, LAND, *RIG_TYPES["shallow"], *RIG_TYPES["deep"]]
+    jobs = []
+    for index in range(600):
+        rig_type = rng.choice(rig_types)
+        duration = LAND_WELL_DAYS + rng.randint(0, 2) if rig_type == LAND else OFFSHORE_WELL_DAYS["deep"]
+        jobs.append(DrillJob(WELL, str(index), rig_type, duration, rng.uniform(1.0, 3.0)))
+    planner = RigPlanner()
+    started = time.perf_counter()
+    planner.plan(jobs[:500], day=1)
+    planned = time.perf_counter()
+    for job in jobs[500:]:
+        planner.add(job, day=1)
+    elapsed = time.perf_counter() - started
+    return BenchResult(
+        "rigs",
+        elapsed,
+        f"500 jobs planned in {planned - started:.3f}s, 100 incremental adds "
+        f"(weighted completion {planner.weighted_completion():,.0f})",
+        ok=len(planner.jobs) == len(jobs) and elapsed < 1.0,
+    )
+
+
+@benchmark("routing")
+def bench_routing() -> BenchResult:
+    import random
+    from dataclasses import replace
+
+    from .engine.logistics import ship_oil
+    from .state import SCENARIOS, new_game_state
+
+    rng = random.Random(8)
+    state = new_game_state(replace(SCENARIOS[0], grid_size=100))
+    for tile in state.tiles:
+        tile.owner = "player"
+        tile.capacity = 10_000
+        tile.storage = rng.randint(0, 60)
+    state.transport_hub.level = 3
+    stored = sum(tile.storage for tile in state.tiles)
+    started = time.perf_counter()
+    freight = 0
+    shipped = 0
+    for day in range(30):
+        state.day = day + 1
+        for _ in range(10):
+            routing = ship_oil(state, 150)
+            freight += routing.freight
+            shipped += routing.barrels
+    elapsed = time.perf_counter() - started
+    return BenchResult(
+        "routing",
+        elapsed,
+        f"{len(state.tiles):,} tiles, 300 shipments, {shipped:,} bbl at ${freight / max(1, shipped):.2f}/bbl",
+        ok=shipped == min(stored, 300 * 150),
+    )
+
+
+@benchmark("pipelines")
+def bench_pipelines() -> BenchResult:
+    import random
+
+    from .engine.pipelines import PipelineGraph
+
+    rng = random.Random(9)
+    size = 1000
+    graph = PipelineGraph(size, size * size - 1)
+    feeders = [(rng.randrange(size), rng.randrange(size - 1), rng.random() < 0.5) for _ in range(200_000)]
+    queries = [(rng.randrange(size), rng.randrange(size)) for _ in range(200_000)]
+    started = time.perf_counter()
+    # A trunk up the last column, then feeders joining it as they are laid.
+    for row in range(size - 1):
+        graph.add(graph.node(row, size - 1), graph.node(row + 1, size - 1))
+    for row, col, across in feeders:
+        if across:
+            graph.add(graph.node(row, col), graph.node(row, col + 1))
+        else:
+            graph.add(graph.node(col, row), graph.node(col + 1, row))
+    built = time.perf_counter()
+    connected = sum(graph.connected(row, col) for row, col in queries)
+    elapsed = time.perf_counter() - started
+    return BenchResult(
+        "pipelines",
+        elapsed,
+        f"{size + len(feeders) - 1:,} segments on {size}x{size} in {built - started:.2f}s, "
+        f"{len(queries):,} queries ({connected:,} on the hub network)",
+        ok=elapsed < 2.0,
+    )
+
+
+@benchmark("fiscal")
+def bench_fiscal() -> BenchResult:
+    import random
+
+    from .engine.regulation import FISCAL_REGIMES, assess_ledger
+
+    rng = random.Random(10)
+    regions = list(FISCAL_REGIMES)
+    ledger = []
+    for _ in range(200_000):
+        barrels = rng.randint(1, 40)
+        ledger.append((rng.choice(regions), barrels, barrels * rng.randint(30, 120)))
+    started = time.perf_counter()
+    bill = assess_ledger(ledger)
+    elapsed = time.perf_counter() - started
+    revenue = sum(revenue for _region, _barrels, revenue in ledger)
+    return BenchResult(
+        "fiscal",
+        elapsed,
+        f"{len(ledger):,} ledger entries, take ${bill.total:,} of ${revenue:,} "
+        f"(royalty {bill.royalty:,}, carbon {bill.carbon:,}, tax {bill.tax:,})",
+        ok=0 < bill.total < revenue,
+    )
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Sequence
+
+# Keep module-level imports light: ``play`` is the only path that needs
+# tkinter, and each subcommand imports what it uses inside its handler.
+
+
+def _play(_args: argparse.Namespace) -> int:
+    from .ui_tk import launch
+
+    launch()
+    return 0
+
+
+def _run(args: argparse.Namespace) -> int:
+    from dataclasses import replace
+
+    from .headless import find_scenario, run_season
+
+    scenario = find_scenario(args.scenario)
+    if args.grid_size:
+        scenario = replace(scenario, grid_size=args.grid_size)
+    result = run_season(scenario, days=args.days, seed=args.seed)
+    if not args.quiet:
+        state = result.state
+        print(f"Scenario: {state.scenario.name}")
+        print(f"Days simulated: {result.days} (day {state.day}/{state.scenario.max_days})")
+        print(f"Oil price: ${state.price}/barrel")
+        print(f"Cash: ${state.cash:,}")
+        print(f"Net assets: ${result.net_assets:,}")
+        for competitor in state.competitors:
+            print(f"- {competitor.name}: ${competitor.cash:,}")
+    return 0
+
+
+def _bench(args: argparse.Namespace) -> int:
+    from .bench import run_benchmarks
+
+    results = run_benchmarks(args.names)
+    for result in results:
+        print(result.line())
+    return 0 if all(result.ok for result in results) else 1
+
+
+def _inspect_save(args: argparse.Namespace) -> int:
+    from .headless import well_forecasts
+    from .persistence import load_game
+    from .viewmodel import build_panel
+
+    state = load_game(args.path)
+    panel = build_panel(state)
+    owned = [tile for tile in state.tiles if tile.owner == "player"]
+    print(panel.stats_text)
+    print(f"Owned tiles: {len(owned)} ({sum(1 for tile in owned if tile.has_pump)} pumping)")
+    for (row, col), outlook in sorted(well_forecasts(state).items()):
+        print(f"  Well ({row + 1}, {col + 1}): {outlook.summary()}")
+    print(f"Net assets: ${panel.net_assets:,}")
+    print(panel.competitor_text)
+    print(panel.contract_text)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="blackoil", description="Black Oil - Frontier Drilling")
+    subparsers = parser.add_subparsers(dest="command")
+
+    play = subparsers.add_parser("play", help="launch the Tk game window (default)")
+    play.set_defaults(handler=_play)
+
+    run = subparsers.add_parser("run", help="simulate a season without the UI")
+    run.add_argument("--scenario", help="scenario name (default: first scenario)")
+    run.add_argument("--days", type=int, help="days to simulate (default: rest of season)")
+    run.add_argument("--seed", type=int, help="random seed for a reproducible run")
+    run.add_argument("--grid-size", type=int, help="override the map size (large maps generate lazily)")
+    run.add_argument("--quiet", action="store_true", help="suppress the summary")
+    run.set_defaults(handler=_run)
+
+    bench = subparsers.add_parser("bench", help="run performance benchmarks")
+    bench.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    bench.set_defaults(handler=_bench)
+
+    inspect = subparsers.add_parser("inspect-save", help="summarize a save file")
+    inspect.add_argument("path", help="path to a .json save")
+    inspect.set_defaults(handler=_inspect_save)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    handler = getattr(args, "handler", _play)
+    try:
+        return handler(args)
+    except ValueError as exc:
+        print(exc)
+        return 2
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import random
 
-from .models import EconomySnapshot
+from .engine import decline, drainage, events, logistics, market, offshore, projects, regulation, rigs, scheduler
+from .engine.orderbook import Fill, Order
+from .models import Contract, EconomySnapshot, Tile
 from .state import (
     BASE_DEMAND,
     CONTRACT_PENALTY,
@@ -12,8 +14,12 @@ from .state import (
     PETROL_PRICE_MAX,
     PETROL_PRICE_MIN,
     MAINTENANCE_COST,
+    REPUTATION_MAX,
+    TRADE_MAX_VOLUME,
 )
-from .state import GameState
+from .state import ONSHORE, REFINING, GameState, record_revenue, record_sale
+
+BUYER_DEMAND_RECOVERY = 10
 
 
 def apply_market(state: GameState) -> None:
@@ -33,14 +39,51 @@ def update_market_conditions(state: GameState) -> None:
     state.market_trend = max(-MARKET_TREND_MAX, min(MARKET_TREND_MAX, state.market_trend + shock))
     trend_bias = int(state.market_trend * 18)
     state.market_demand = max(40, BASE_DEMAND + trend_bias + random.randint(-DEMAND_VARIANCE, DEMAND_VARIANCE))
-    state.market_supply = state.last_day_production
+    state.market_supply = market_supply(state)
+
+
+def market_supply(state: GameState) -> int:
+    """Crude every seller delivered since the last price update.
+
+    Spot sales, trades, order-book fills (player and competitors) and
+    contract deliveries are all posted to ``state.sales_today``, so the
+    clearing is one sum over the ledger instead of a walk over agents.
+    """
+    return sum(state.sales_today.values())
+
+
+def sample_well_incidents(state: GameState, snapshot: EconomySnapshot) -> int:
+    """Roll incidents for every running well; hit wells stop for the downtime."""
+    wells = [tile for tile in state.tiles if tile.has_pump and tile.reserve > 0 and tile.down_until <= state.day]
+    hits = events.sample_fleet(len(wells), random.random, events.incident_table(state.scenario.incident_rate))
+    queue = scheduler.scheduler(state)
+    for hit in hits:
+        tile = wells[hit.well]
+        incident = hit.incident
+        tile.down_until = state.day + incident.downtime_days
+        if tile.owner == "player":
+            snapshot.events.append(
+                f"{incident.name} at ({tile.row + 1}, {tile.col + 1}): well down {incident.downtime_days} day(s)."
+            )
+            queue.schedule(tile.down_until, scheduler.WELL_RESTORED, tile)
+    return len(hits)
+
+
+@scheduler.on(scheduler.WELL_RESTORED)
+def announce_well_restored(state: GameState, tile: Tile, snapshot: EconomySnapshot) -> None:
+    if tile.owner == "player" and tile.down_until <= state.day:
+        snapshot.events.append(f"Well at ({tile.row + 1}, {tile.col + 1}) is back online.")
 
 
 def produce_oil(state: GameState, snapshot: EconomySnapshot) -> None:
     state.last_day_production = 0
+    schedules = decline.decline_cache(state)
+    day = state.day
     for tile in state.tiles:
-        if tile.has_pump and tile.reserve > 0 and tile.available_capacity > 0:
-            output = min(tile.current_output, tile.reserve, tile.available_capacity)
+        if tile.has_pump and tile.reserve > 0 and tile.available_capacity > 0 and tile.down_until <= day:
+            # Shut-in days (full storage) do not advance the decline curve.
+            output = min(schedules.output(tile), tile.reserve, tile.available_capacity)
+            tile.pump_age += 1
             tile.reserve -= output
             tile.storage += output
             snapshot.production += output
@@ -69,27 +112,124 @@ def refine_oil(state: GameState, snapshot: EconomySnapshot) -> None:
 def process_contracts(state: GameState, snapshot: EconomySnapshot) -> None:
     if not state.contracts:
         return
-    for contract in list(state.contracts):
+    for contract in state.contracts:
         deliverable = min(contract.remaining, total_storage(state, "player"))
         if deliverable > 0:
-            withdraw_oil(state, deliverable)
+            routing = logistics.ship_oil(state, deliverable)
             contract.delivered += deliverable
             state.total_contract_delivered += deliverable
+            record_sale(state, "player", deliverable)
             bonus = 1 + state.transport_hub.delivery_bonus
-            revenue = int(deliverable * contract.price * bonus)
+            revenue = int(deliverable * contract.price * bonus) - routing.freight
             state.cash += revenue
+            record_revenue(state, ONSHORE, deliverable, revenue)
             snapshot.contract_delivered += deliverable
             snapshot.events.append(
                 f"Delivered {deliverable} barrels to {contract.name} for ${revenue}."
             )
-        contract.days_remaining -= 1
-        if contract.days_remaining <= 0:
-            if contract.remaining > 0:
-                state.cash = max(0, state.cash - CONTRACT_PENALTY)
-                snapshot.events.append(
-                    f"Missed contract with {contract.name}. Penalty: ${CONTRACT_PENALTY}."
-                )
-            state.contracts.remove(contract)
+
+
+@scheduler.on(scheduler.CONTRACT_DEADLINE)
+def settle_contract_deadline(state: GameState, contract: Contract, snapshot: EconomySnapshot) -> None:
+    if not any(held is contract for held in state.contracts):
+        return
+    if contract.remaining > 0:
+        state.cash = max(0, state.cash - CONTRACT_PENALTY)
+        snapshot.events.append(
+            f"Missed contract with {contract.name}. Penalty: ${CONTRACT_PENALTY}."
+        )
+    state.contracts.remove(contract)
+
+
+def clear_order_books(state: GameState, snapshot: EconomySnapshot) -> list[Fill]:
+    buyers = {market.buyer_owner(index): index for index in range(len(state.buyers))}
+    competitors = {competitor.name: competitor for competitor in state.competitors}
+    fills: list[Fill] = []
+    totals: dict[tuple[str, str], list[int]] = {}
+    # Only buyers off the cap recover, and only they (plus those who
+    # trade below) touch the sampler; the rest of the list is left alone.
+    sampler = market.buyer_sampler(state)
+    recovered = list(sampler.off_cap)
+    for index in recovered:
+        buyer = state.buyers[index]
+        buyer.demand = min(TRADE_MAX_VOLUME, buyer.demand + BUYER_DEMAND_RECOVERY)
+        sampler.refresh(buyer)
+    market.mark_bidders(state, recovered)
+    traded: set[int] = set()
+    for commodity in ("oil", "petrol"):
+        market.post_buyer_bids(state, commodity)
+        book = state.order_books.get(commodity)
+        if book is None:
+            continue
+        inventory = _seller_inventory(state, commodity)
+
+        def settle(_bid: Order, ask: Order, volume: int, _price: int) -> int:
+            deliverable = min(volume, inventory.get(ask.owner, 0))
+            inventory[ask.owner] = inventory.get(ask.owner, 0) - deliverable
+            return deliverable
+
+        withdrawals: dict[str, int] = {}
+        for fill in book.clear(state.day, settle):
+            seller = fill.ask.owner
+            withdrawals[seller] = withdrawals.get(seller, 0) + fill.volume
+            if seller == "player":
+                state.cash += fill.value
+            elif seller in competitors:
+                competitors[seller].cash += fill.value
+            index = buyers.get(fill.bid.owner)
+            if index is not None:
+                buyer = state.buyers[index]
+                traded.add(index)
+                buyer.demand = max(0, buyer.demand - fill.volume)
+                if seller == "player":
+                    buyer.reputation = min(REPUTATION_MAX, buyer.reputation + 1)
+            entry = totals.setdefault((seller, commodity), [0, 0])
+            entry[0] += fill.volume
+            entry[1] += fill.value
+            fills.append(fill)
+        if commodity == "petrol":
+            state.petrol_storage -= sum(withdrawals.values())
+        else:
+            if withdrawals.get("player"):
+                # Player crude leaves along the cheapest routes and pays freight.
+                freight = logistics.ship_oil(state, withdrawals["player"]).freight
+                state.cash -= freight
+                totals[("player", commodity)][1] -= freight
+            _withdraw_from_owners(state, {seller: volume for seller, volume in withdrawals.items() if seller != "player"})
+            for seller, volume in withdrawals.items():
+                record_sale(state, seller, volume)
+
+    for (seller, commodity), (volume, revenue) in totals.items():
+        if seller == "player":
+            record_revenue(state, REFINING if commodity == "petrol" else ONSHORE, volume, revenue)
+        name = "You" if seller == "player" else seller
+        snapshot.events.append(f"{name} sold {volume} barrels of {commodity} on the market for ${revenue}.")
+    for index in traded:
+        sampler.refresh(state.buyers[index])
+    market.mark_bidders(state, list(traded))
+    return fills
+
+
+def _withdraw_from_owners(state: GameState, amounts: dict[str, int]) -> None:
+    # One pass over the map for all sellers, in the same tile order as withdraw_oil.
+    remaining = dict(amounts)
+    for tile in state.tiles:
+        owed = remaining.get(tile.owner, 0)
+        if owed <= 0 or not tile.storage:
+            continue
+        taken = min(tile.storage, owed)
+        tile.storage -= taken
+        remaining[tile.owner] = owed - taken
+
+
+def _seller_inventory(state: GameState, commodity: str) -> dict[str, int]:
+    if commodity == "petrol":
+        return {"player": state.petrol_storage}
+    inventory: dict[str, int] = {}
+    for tile in state.tiles:
+        if tile.owner is not None and tile.storage:
+            inventory[tile.owner] = inventory.get(tile.owner, 0) + tile.storage
+    return inventory
 
 
 def maintenance_and_interest(state: GameState, snapshot: EconomySnapshot) -> None:
@@ -130,13 +270,22 @@ def random_event(state: GameState, snapshot: EconomySnapshot) -> None:
 
 def advance_day(state: GameState) -> EconomySnapshot:
     snapshot = EconomySnapshot()
+    sample_well_incidents(state, snapshot)
     produce_oil(state, snapshot)
+    offshore.operate_offshore(state, snapshot)
+    if state.interference:
+        drainage.apply_drainage(state)
     process_contracts(state, snapshot)
+    scheduler.run_due(state, snapshot)
+    rigs.advance_campaign(state, snapshot)
     refine_oil(state, snapshot)
+    clear_order_books(state, snapshot)
     update_market_conditions(state)
     apply_market(state)
+    state.sales_today.clear()
     apply_petrol_market(state)
     random_event(state, snapshot)
+    regulation.settle_fiscal(state, snapshot)
     maintenance_and_interest(state, snapshot)
     state.day_phase = (state.day_phase + 1) % 4
     return snapshot
@@ -146,9 +295,9 @@ def total_storage(state: GameState, owner: str) -> int:
     return sum(tile.storage for tile in state.tiles if tile.owner == owner)
 
 
-def withdraw_oil(state: GameState, amount: int) -> None:
+def withdraw_oil(state: GameState, amount: int, owner: str = "player") -> None:
     remaining = amount
-    for tile in [tile for tile in state.tiles if tile.owner == "player"]:
+    for tile in [tile for tile in state.tiles if tile.owner == owner]:
         if remaining <= 0:
             break
         if tile.storage <= remaining:
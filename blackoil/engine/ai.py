@@ -2,53 +2,84 @@ from __future__ import annotations
 
 import random
 
+from ..models import Tile
 from ..state import GameState, MAX_PUMP_LEVEL, PUMP_UPGRADE_COST
+from . import market
+
+SCOUT_SAMPLES = 4
 
 
 def competitor_turns(state: GameState) -> list[str]:
     events: list[str] = []
+    # One pass over the map serves every competitor, instead of each one
+    # rescanning all tiles for its holdings and for open land.
+    holdings = tiles_by_owner(state)
+    open_tiles = holdings.pop(None, [])
+    if state.chunked:
+        # Large worlds only hold visited chunks, so look further afield for land.
+        open_tiles.extend(_scout(state, SCOUT_SAMPLES * len(state.competitors)))
+    open_tiles.sort(key=lambda tile: tile.reserve, reverse=True)
     for competitor in state.competitors:
+        owned = holdings.setdefault(competitor.name, [])
         if random.random() < competitor.aggressiveness:
-            _competitor_expand(state, competitor, events)
-        _competitor_operate(state, competitor, events)
+            _competitor_expand(state, competitor, events, open_tiles, owned)
+        _competitor_operate(state, competitor, events, owned)
     return events
 
 
-def _competitor_expand(state: GameState, competitor, events: list[str]) -> None:
-    open_tiles = [tile for tile in state.tiles if tile.owner is None]
+def tiles_by_owner(state: GameState) -> dict[str | None, list[Tile]]:
+    holdings: dict[str | None, list[Tile]] = {}
+    for tile in state.tiles:
+        holdings.setdefault(tile.owner, []).append(tile)
+    return holdings
+
+
+def _scout(state: GameState, count: int) -> list[Tile]:
+    size = state.scenario.grid_size
+    found = {}
+    for _ in range(count):
+        tile = state.tile_at(random.randrange(size), random.randrange(size))
+        if tile is not None and tile.owner is None:
+            found[(tile.row, tile.col)] = tile
+    return list(found.values())
+
+
+def _competitor_expand(
+    state: GameState, competitor, events: list[str], open_tiles: list[Tile], owned: list[Tile]
+) -> None:
     if not open_tiles or competitor.cash < state.scenario.land_cost:
         return
-    open_tiles.sort(key=lambda tile: tile.reserve, reverse=True)
     pick = random.randint(0, min(3, len(open_tiles) - 1))
-    target = open_tiles[pick]
+    target = open_tiles.pop(pick)
     target.owner = competitor.name
+    owned.append(target)
     competitor.cash -= state.scenario.land_cost
     events.append(f"{competitor.name} secured land at ({target.row + 1}, {target.col + 1}).")
 
 
-def _competitor_operate(state: GameState, competitor, events: list[str]) -> None:
+def _competitor_operate(state: GameState, competitor, events: list[str], owned: list[Tile]) -> None:
     price_ratio = state.price / state.scenario.price_max
-    for tile in [tile for tile in state.tiles if tile.owner == competitor.name]:
+    for tile in owned:
         if not tile.drilled and competitor.cash >= state.scenario.drill_cost:
             tile.drilled = True
             competitor.cash -= state.scenario.drill_cost
         if tile.drilled and not tile.has_pump and competitor.cash >= state.scenario.pump_cost and tile.reserve > 0:
             tile.pump_level = 1
+            tile.pump_age = 0
             competitor.cash -= state.scenario.pump_cost
         if tile.has_pump and tile.pump_level < MAX_PUMP_LEVEL and competitor.cash >= PUMP_UPGRADE_COST:
             if price_ratio > competitor.risk_tolerance:
                 tile.pump_level += 1
+                tile.pump_age = 0
                 competitor.cash -= PUMP_UPGRADE_COST
         if tile.has_pump and tile.available_capacity < 10 and competitor.cash >= state.scenario.storage_cost:
             if price_ratio < (1 - competitor.discipline):
                 tile.capacity += 10
                 competitor.cash -= state.scenario.storage_cost
 
-    storage = sum(tile.storage for tile in state.tiles if tile.owner == competitor.name)
+    storage = sum(tile.storage for tile in owned)
     if storage >= competitor.storage_threshold and price_ratio > competitor.discipline:
-        revenue = storage * state.price
-        competitor.cash += revenue
-        for tile in [tile for tile in state.tiles if tile.owner == competitor.name]:
-            tile.storage = 0
-        if storage > 0:
-            events.append(f"{competitor.name} sold {storage} barrels for ${revenue}.")
+        # Sales go through the order book; fills are settled in the next day's clearing.
+        if storage > 0 and not market.open_asks(state, competitor.name):
+            market.post_ask(state, competitor.name, "oil", storage, state.price)
+            events.append(f"{competitor.name} offered {storage} barrels at ${state.price}.")
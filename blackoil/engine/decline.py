@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from ..models import Tile
+from ..state import GameState
+
+DECLINE_B = 0.5
+MIN_DECLINE = 0.01
+RESERVE_DECLINE_SCALE = 4
+SCHEDULE_DAYS = 180
+
+
+@lru_cache(maxsize=1024)
+def decline_schedule(initial_rate: int, reserve: int, days: int = SCHEDULE_DAYS) -> tuple[int, ...]:
+    """Daily output of a hyperbolic (Arps) decline, one entry per day.
+
+    The initial decline rate scales with rate over reserve, so small
+    pockets fall off quickly while large fields hold their rate. The curve
+    itself would recover several times the reserve; production stops when
+    the reserve runs out, as before.
+    """
+    if initial_rate <= 0:
+        return (0,)
+    decline = max(MIN_DECLINE, initial_rate / (RESERVE_DECLINE_SCALE * max(1, reserve)))
+    exponent = 1 / DECLINE_B
+    return tuple(
+        max(1, round(initial_rate / (1 + DECLINE_B * decline * day) ** exponent)) for day in range(days)
+    )
+
+
+@dataclass
+class WellSchedule:
+    rate: int
+    anchor_age: int
+    start: int
+    reserve: int
+    schedule: tuple[int, ...] = ()
+
+    def __post_init__(self) -> None:
+        if not self.schedule:
+            self.schedule = decline_schedule(self.start, self.reserve)
+
+    def output(self, age: int) -> int:
+        offset = max(0, age - self.anchor_age)
+        return self.schedule[min(offset, len(self.schedule) - 1)]
+
+
+@dataclass
+class DeclineCache:
+    """Per-well decline schedules, rebuilt only when a well changes.
+
+    A schedule is keyed to the pump's nameplate rate, so building or
+    upgrading a pump starts a fresh curve. ``invalidate`` re-anchors a
+    well on its current reserve and rate, for when something other than
+    production (such as reservoir interference) has moved its oil.
+    """
+
+    _wells: dict[tuple[int, int], WellSchedule] = field(default_factory=dict)
+    _stale: set[tuple[int, int]] = field(default_factory=set)
+
+    def output(self, tile: Tile) -> int:
+        if not tile.has_pump:
+            return 0
+        key = (tile.row, tile.col)
+        well = self._wells.get(key)
+        if well is None or well.rate != tile.current_output or key in self._stale:
+            well = self._wells[key] = self._build(tile, well)
+            self._stale.discard(key)
+        return well.output(tile.pump_age)
+
+    def projected(self, tile: Tile, days: int) -> list[int]:
+        """Output for the next ``days`` producing days, ignoring reserve and storage."""
+        if not tile.has_pump:
+            return [0] * days
+        self.output(tile)
+        well = self._wells[(tile.row, tile.col)]
+        return [well.output(tile.pump_age + day) for day in range(days)]
+
+    def invalidate(self, tile: Tile) -> None:
+        if (tile.row, tile.col) in self._wells:
+            self._stale.add((tile.row, tile.col))
+
+    def clear(self) -> None:
+        self._wells.clear()
+        self._stale.clear()
+
+    def export(self, state: GameState) -> list[list[int]]:
+        """Each well's curve as ``[row, col, rate, anchor_age, start, reserve]`` for saving.
+
+        Stale wells are re-anchored first, exactly as their next ``output``
+        would, so a reload continues every curve from where it stood.
+        """
+        for row, col in self._stale:
+            tile = state.tile_at(row, col)
+            if tile is not None and tile.has_pump:
+                self._wells[(row, col)] = self._build(tile, self._wells.get((row, col)))
+            else:
+                self._wells.pop((row, col), None)
+        self._stale.clear()
+        return [
+            [row, col, well.rate, well.anchor_age, well.start, well.reserve]
+            for (row, col), well in self._wells.items()
+        ]
+
+    def restore(self, rows: list[list[int]]) -> None:
+        for row, col, rate, anchor_age, start, reserve in rows:
+            self._wells[(row, col)] = WellSchedule(rate, anchor_age, start, reserve)
+
+    @staticmethod
+    def _build(tile: Tile, previous: WellSchedule | None) -> WellSchedule:
+        rate = tile.current_output
+        if previous is not None and previous.rate == rate:
+            # Same pump: continue from today's rate rather than restarting the curve.
+            start = previous.output(tile.pump_age)
+        else:
+            start = rate
+        return WellSchedule(rate, tile.pump_age, start, tile.reserve)
+
+
+def decline_cache(state: GameState) -> DeclineCache:
+    cache = state.decline
+    if cache is None:
+        cache = state.decline = DeclineCache()
+    return cache
+
+
+def well_output(state: GameState, tile: Tile) -> int:
+    """Today's output for a pumped well, before reserve and storage limits."""
+    return decline_cache(state).output(tile)
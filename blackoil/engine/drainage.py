@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from itertools import chain
+
+from ..models import Tile
+from ..state import GameState
+from .decline import decline_cache
+
+# Share of a pumping well's rate pulled from each bordering tile per day.
+DRAINAGE_RATE = 0.1
+
+
+def neighbor_sum(values: list[float], size: int) -> list[float]:
+    """Sum of the four edge neighbours of every cell in a row-major grid.
+
+    The grid is shifted up, down, left and right as whole lists and added
+    element-wise, so the cost is a handful of list passes rather than a
+    Python loop over every cell's neighbours.
+    """
+    pad = [0.0] * size
+    up = pad + values[:-size]
+    down = values[size:] + pad
+    starts = range(0, len(values), size)
+    left = list(chain.from_iterable([0.0] + values[start : start + size - 1] for start in starts))
+    right = list(chain.from_iterable(values[start + 1 : start + size] + [0.0] for start in starts))
+    return [a + b + c + d for a, b, c, d in zip(up, down, left, right)]
+
+
+def apply_drainage(state: GameState, rate: float = DRAINAGE_RATE) -> int:
+    """Move oil from tiles bordering pumping wells into those wells' reserves.
+
+    Each tile is asked for ``rate`` times the summed pumping rate of its
+    neighbours, capped by what it holds. What it gives up is shared among
+    the neighbouring pumps in proportion to their rate, so a rival pumping
+    harder next door takes more of a shared reservoir. Pumps count at
+    their declined output, and wells down for an incident pull nothing.
+    Every barrel drawn lands in exactly one pump, so drainage never
+    creates or destroys oil. Returns the barrels moved. Chunked worlds
+    are skipped since they have no full grid.
+    """
+    if state.chunked:
+        return 0
+    size = state.scenario.grid_size
+    tiles = _row_major(state.tiles, size)
+    schedules = decline_cache(state)
+    day = state.day
+    pumping = [
+        float(schedules.output(tile)) if tile.has_pump and tile.reserve > 0 and tile.down_until <= day else 0.0
+        for tile in tiles
+    ]
+    if not any(pumping):
+        return 0
+
+    pulls = neighbor_sum(pumping, size)
+    drawn = [min(tile.reserve, round(rate * pull)) for tile, pull in zip(tiles, pulls)]
+    gained = [0] * len(tiles)
+    for index, taken in enumerate(drawn):
+        if taken > 0:
+            _share_out(index, taken, pulls[index], pumping, gained, size)
+
+    moved = 0
+    for tile, taken, gain in zip(tiles, drawn, gained):
+        if taken or gain:
+            tile.reserve += gain - taken
+            moved += taken
+            schedules.invalidate(tile)
+    return moved
+
+
+def _share_out(index: int, taken: int, pull: float, pumping: list[float], gained: list[int], size: int) -> None:
+    """Split ``taken`` barrels among the pumps around ``index`` by their rate.
+
+    Cumulative rounding keeps the whole-barrel shares summing to ``taken``.
+    """
+    row, col = divmod(index, size)
+    neighbors = []
+    if row > 0:
+        neighbors.append(index - size)
+    if row < size - 1:
+        neighbors.append(index + size)
+    if col > 0:
+        neighbors.append(index - 1)
+    if col < size - 1:
+        neighbors.append(index + 1)
+    running = 0.0
+    given = 0
+    for neighbor in neighbors:
+        if pumping[neighbor]:
+            running += pumping[neighbor]
+            share = round(taken * running / pull) - given
+            gained[neighbor] += share
+            given += share
+
+
+def _row_major(tiles: list[Tile], size: int) -> list[Tile]:
+    if len(tiles) == size * size and all(
+        tile.row * size + tile.col == index for index, tile in enumerate(tiles)
+    ):
+        return tiles
+    return sorted(tiles, key=lambda tile: (tile.row, tile.col))
@@ -43,6 +43,7 @@ def build_pump(state: GameState, tile: Tile) -> tuple[bool, str]:
     if state.cash < state.scenario.pump_cost:
         return False, "Insufficient cash to build pump."
     tile.pump_level = 1
+    tile.pump_age = 0
     state.cash -= state.scenario.pump_cost
     return True, "Pump installed. Production will start next day."
 
@@ -55,5 +56,6 @@ def upgrade_pump(state: GameState, tile: Tile) -> tuple[bool, str]:
     if state.cash < PUMP_UPGRADE_COST:
         return False, "Insufficient cash to upgrade pump."
     tile.pump_level += 1
+    tile.pump_age = 0
     state.cash -= PUMP_UPGRADE_COST
     return True, f"Pump upgraded to level {tile.pump_level}."
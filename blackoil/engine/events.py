@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
+from typing import Callable
 
 
 @dataclass
@@ -10,15 +12,98 @@ class Incident:
     downtime_days: int
 
 
+# (name, chance per well-day, severity, downtime days), checked in order.
+INCIDENT_TYPES: list[tuple[str, float, float, int]] = [
+    ("Lost circulation", 0.05, 0.6, 2),
+    ("Equipment failure", 0.03, 0.4, 1),
+    ("Weather downtime", 0.02, 0.3, 1),
+]
+
+
 def sample_incident(seed: int) -> Incident | None:
     import random
 
     rng = random.Random(seed)
-    roll = rng.random()
-    if roll < 0.05:
-        return Incident("Lost circulation", 0.6, 2)
-    if roll < 0.08:
-        return Incident("Equipment failure", 0.4, 1)
-    if roll < 0.1:
-        return Incident("Weather downtime", 0.3, 1)
-    return None
+    return incident_table().pick(rng.random())
+
+
+@dataclass(frozen=True)
+class IncidentTable:
+    """Cumulative form of an incident list, for one roll per well.
+
+    A roll below ``total`` is an incident; ``bisect`` on the running
+    thresholds picks which one, so adding types costs nothing per well.
+    """
+
+    incidents: tuple[Incident, ...]
+    thresholds: tuple[float, ...]
+
+    @property
+    def total(self) -> float:
+        return self.thresholds[-1] if self.thresholds else 0.0
+
+    @classmethod
+    def from_types(cls, types: list[tuple[str, float, float, int]]) -> IncidentTable:
+        incidents = []
+        thresholds = []
+        running = 0.0
+        for name, chance, severity, downtime in types:
+            running += chance
+            incidents.append(Incident(name, severity, downtime))
+            thresholds.append(running)
+        return cls(tuple(incidents), tuple(thresholds))
+
+    def pick(self, roll: float) -> Incident | None:
+        if roll >= self.total:
+            return None
+        return self.incidents[bisect_right(self.thresholds, roll)]
+
+
+@dataclass(frozen=True)
+class WellIncident:
+    well: int
+    incident: Incident
+
+    @property
+    def severity(self) -> float:
+        return self.incident.severity
+
+    @property
+    def downtime_days(self) -> int:
+        return self.incident.downtime_days
+
+
+_TABLES: dict[tuple[tuple[tuple[str, float, float, int], ...], float], IncidentTable] = {}
+
+
+def incident_table(rate: float = 1.0) -> IncidentTable:
+    """Table for the current ``INCIDENT_TYPES`` with every chance scaled by ``rate``.
+
+    Tables are cached per rate and dropped when the type list changes.
+    """
+    types = tuple(INCIDENT_TYPES)
+    table = _TABLES.get((types, rate))
+    if table is None:
+        for key in [key for key in _TABLES if key[0] != types]:
+            del _TABLES[key]
+        scaled = [(name, chance * rate, severity, downtime) for name, chance, severity, downtime in types]
+        table = _TABLES[(types, rate)] = IncidentTable.from_types(scaled)
+    return table
+
+
+def add_incident_type(name: str, chance: float, severity: float, downtime_days: int) -> None:
+    INCIDENT_TYPES.append((name, chance, severity, downtime_days))
+
+
+def sample_fleet(count: int, roll: Callable[[], float], table: IncidentTable | None = None) -> list[WellIncident]:
+    """Draw incidents for ``count`` wells at once, returning only the hits.
+
+    One roll per well, a single comparison against the table total to
+    filter, and a bisect only for the few wells that were hit.
+    """
+    table = table or incident_table()
+    total = table.total
+    rolls = [roll() for _ in range(count)]
+    return [
+        WellIncident(well, table.pick(value)) for well, value in enumerate(rolls) if value < total
+    ]
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import math
+import os
 import random
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 
-from .geology import Prospect, reduce_uncertainty
+from .geology import Prospect, ProspectEstimate, reduce_uncertainty
 
 
 def run_recon(prospect: Prospect, seed: int) -> Prospect:
@@ -24,3 +29,186 @@ def run_3d_seismic(prospect: Prospect, seed: int) -> Prospect:
     factor = rng.uniform(0.3, 0.5)
     prospect.estimate = reduce_uncertainty(prospect.estimate, factor)
     return prospect
+
+
+RECON_COST = 150
+SEISMIC_2D_COST = 350
+SEISMIC_3D_COST = 900
+DEFAULT_VALUE_PER_UNIT = 20.0
+DEFAULT_DRILL_COST = 1000.0
+VOI_SAMPLES = 2000
+VOI_CACHE_SIZE = 4096
+PARALLEL_MIN_MISSES = 64
+Z_P10 = 1.2816
+
+# name -> (uncertainty factor range, cost); factors match the run_* functions above.
+SURVEY_OPTIONS: dict[str, tuple[float, float, int]] = {
+    "recon": (0.75, 0.9, RECON_COST),
+    "2d_seismic": (0.55, 0.7, SEISMIC_2D_COST),
+    "3d_seismic": (0.3, 0.5, SEISMIC_3D_COST),
+}
+
+
+@dataclass(frozen=True)
+class SurveyValue:
+    option: str
+    cost: int
+    prior_value: float
+    informed_value: float
+    posterior_spread: float
+    drill_probability: float
+
+    @property
+    def value_of_information(self) -> float:
+        """Gain from deciding with the survey, net of its cost."""
+        return self.informed_value - self.prior_value - self.cost
+
+
+class _SurveyCache(OrderedDict):
+    """Least-recently-used survey values, capped at ``VOI_CACHE_SIZE`` entries."""
+
+    def lookup(self, key: tuple) -> SurveyValue | None:
+        value = self.get(key)
+        if value is not None:
+            self.move_to_end(key)
+        return value
+
+    def store(self, keys: list[tuple], values: list[SurveyValue]) -> None:
+        for key, value in zip(keys, values):
+            self[key] = value
+            self.move_to_end(key)
+        while len(self) > VOI_CACHE_SIZE:
+            self.popitem(last=False)
+
+
+_VOI_CACHE = _SurveyCache()
+_POOL: ProcessPoolExecutor | None = None
+_POOL_WORKERS = 0
+
+
+def _pool(workers: int) -> ProcessPoolExecutor:
+    """One process pool for the whole run, replaced only if ``workers`` changes."""
+    global _POOL, _POOL_WORKERS
+    if _POOL is None or _POOL_WORKERS != workers:
+        if _POOL is not None:
+            _POOL.shutdown()
+        _POOL = ProcessPoolExecutor(max_workers=workers)
+        _POOL_WORKERS = workers
+    return _POOL
+
+
+def survey_values(
+    prospect: Prospect,
+    samples: int = VOI_SAMPLES,
+    seed: int = 0,
+    value_per_unit: float = DEFAULT_VALUE_PER_UNIT,
+    drill_cost: float = DEFAULT_DRILL_COST,
+) -> list[SurveyValue]:
+    return evaluate_surveys([prospect], samples, seed, value_per_unit, drill_cost, workers=1)[0]
+
+
+def best_survey(prospect: Prospect, **kwargs) -> SurveyValue | None:
+    """The survey with the highest positive value of information, if any."""
+    options = [value for value in survey_values(prospect, **kwargs) if value.value_of_information > 0]
+    return max(options, key=lambda value: value.value_of_information, default=None)
+
+
+def evaluate_surveys(
+    prospects: list[Prospect],
+    samples: int = VOI_SAMPLES,
+    seed: int = 0,
+    value_per_unit: float = DEFAULT_VALUE_PER_UNIT,
+    drill_cost: float = DEFAULT_DRILL_COST,
+    workers: int | None = None,
+) -> list[list[SurveyValue]]:
+    """Value every survey option for every prospect.
+
+    Results are cached on the prospect's current estimate, so a prospect
+    is only re-evaluated after a survey changes it; the cache keeps the
+    ``VOI_CACHE_SIZE`` most recently used entries. When ``workers`` allows
+    more than one and there are at least ``PARALLEL_MIN_MISSES`` misses,
+    they are spread over a process pool that is kept for later calls.
+    """
+    keys = [
+        [(_estimate_key(prospect.estimate), option, samples, seed, value_per_unit, drill_cost) for option in SURVEY_OPTIONS]
+        for prospect in prospects
+    ]
+    found = {key: _VOI_CACHE.lookup(key) for row in keys for key in row}
+    missing = [key for key, value in found.items() if value is None]
+    if missing:
+        workers = workers if workers is not None else (os.cpu_count() or 1)
+        if workers > 1 and len(missing) >= PARALLEL_MIN_MISSES:
+            size = -(-len(missing) // workers)
+            chunks = [missing[start : start + size] for start in range(0, len(missing), size)]
+            results = [value for chunk in _pool(workers).map(_evaluate_chunk, chunks) for value in chunk]
+        else:
+            results = _evaluate_chunk(missing)
+        found.update(zip(missing, results))
+        _VOI_CACHE.store(missing, results)
+    return [[found[key] for key in row] for row in keys]
+
+
+def _estimate_key(estimate: ProspectEstimate) -> tuple[float, float, float, float]:
+    return (estimate.pos, estimate.p10, estimate.p50, estimate.p90)
+
+
+def _evaluate_chunk(keys: list[tuple]) -> list[SurveyValue]:
+    return [_survey_value(*key) for key in keys]
+
+
+def _survey_value(
+    estimate: tuple[float, float, float, float],
+    option: str,
+    samples: int,
+    seed: int,
+    value_per_unit: float,
+    drill_cost: float,
+) -> SurveyValue:
+    # Lognormal volume fitted to P50 and the P10-P90 range (P10 is the high case).
+    # Each sample draws a truth from the prior, a noisy survey reading of it,
+    # a Bayesian posterior, and the drill/walk-away decision taken on that
+    # posterior; the realized value of that decision is averaged.
+    pos, p10, p50, p90 = estimate
+    low, high, cost = SURVEY_OPTIONS[option]
+    mu = math.log(max(p50, 1e-9))
+    sigma = max(1e-6, (math.log(max(p10, 1e-9)) - math.log(max(p90, 1e-9))) / (2 * Z_P10))
+    prior_mean = math.exp(mu + sigma * sigma / 2)
+    prior_value = max(0.0, pos * prior_mean * value_per_unit - drill_cost)
+
+    rng = random.Random(f"{seed}:{option}:{estimate}")
+    gauss = rng.gauss
+    draw = rng.random
+    total = 0.0
+    drilled = 0
+    spread = 0.0
+    for _ in range(samples):
+        factor = low + (high - low) * draw()
+        success = draw() < pos
+        log_volume = mu + sigma * gauss(0, 1)
+        # Volume reading: noise shrinks with the survey's uncertainty factor.
+        noise = sigma * factor
+        reading = log_volume + noise * gauss(0, 1)
+        weight = 1 / (sigma * sigma)
+        reading_weight = 1 / (noise * noise)
+        post_var = 1 / (weight + reading_weight)
+        post_mu = post_var * (mu * weight + reading * reading_weight)
+        post_mean = math.exp(post_mu + post_var / 2)
+        # Success indicator: reads correctly with probability rising as factor falls.
+        accuracy = 1 - factor / 2
+        says_success = success if draw() < accuracy else not success
+        if says_success:
+            post_pos = pos * accuracy / (pos * accuracy + (1 - pos) * (1 - accuracy))
+        else:
+            post_pos = pos * (1 - accuracy) / (pos * (1 - accuracy) + (1 - pos) * accuracy)
+        spread += 2 * Z_P10 * math.sqrt(post_var) * post_mean
+        if post_pos * post_mean * value_per_unit > drill_cost:
+            drilled += 1
+            total += (math.exp(log_volume) * value_per_unit if success else 0.0) - drill_cost
+    return SurveyValue(
+        option=option,
+        cost=cost,
+        prior_value=prior_value,
+        informed_value=total / samples,
+        posterior_spread=spread / samples,
+        drill_probability=drilled / samples,
+    )
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+
+from ..state import (
+    BASE_DEMAND,
+    DEMAND_VARIANCE,
+    MARKET_IMPACT,
+    MARKET_TREND_MAX,
+    PETROL_PRICE_MAX,
+    PETROL_PRICE_MIN,
+    GameState,
+)
+
+FORECAST_HORIZON = 7
+FORECAST_PATHS = 2000
+EVENT_PRICE_BUMP = 12
+EVENT_SHORTAGE_SHARE = 0.35
+
+
+@dataclass(frozen=True)
+class PriceBand:
+    day: int
+    p10: int
+    p50: int
+    p90: int
+
+
+@dataclass(frozen=True)
+class PricePaths:
+    """Simulated prices indexed as ``oil[day_offset][path]``."""
+
+    start_day: int
+    oil: tuple[tuple[int, ...], ...]
+    petrol: tuple[tuple[int, ...], ...]
+
+    @property
+    def horizon(self) -> int:
+        return len(self.oil)
+
+    @property
+    def paths(self) -> int:
+        return len(self.oil[0]) if self.oil else 0
+
+
+@dataclass(frozen=True)
+class PriceForecast:
+    oil: tuple[PriceBand, ...]
+    petrol: tuple[PriceBand, ...]
+    paths: int
+
+    def summary(self, commodity: str = "oil") -> str:
+        bands = self.oil if commodity == "oil" else self.petrol
+        if not bands:
+            return "No forecast."
+        last = bands[-1]
+        return f"{len(bands)}-day {commodity} outlook: ${last.p10}-${last.p90} (median ${last.p50})"
+
+
+def simulate_paths(
+    state: GameState,
+    horizon: int = FORECAST_HORIZON,
+    paths: int = FORECAST_PATHS,
+    seed: int | None = None,
+) -> PricePaths:
+    if seed is None:
+        seed = state.map_seed + state.day
+    scenario = state.scenario
+    return _simulate(
+        state.day,
+        seed,
+        horizon,
+        paths,
+        state.price,
+        state.petrol_price,
+        state.market_trend,
+        state.market_supply,
+        scenario.price_min,
+        scenario.price_max,
+        scenario.event_chance,
+    )
+
+
+def forecast_prices(
+    state: GameState,
+    horizon: int = FORECAST_HORIZON,
+    paths: int = FORECAST_PATHS,
+    seed: int | None = None,
+) -> PriceForecast:
+    simulated = simulate_paths(state, horizon, paths, seed)
+    return PriceForecast(
+        oil=_bands(simulated.start_day, simulated.oil),
+        petrol=_bands(simulated.start_day, simulated.petrol),
+        paths=simulated.paths,
+    )
+
+
+def _bands(start_day: int, days: tuple[tuple[int, ...], ...]) -> tuple[PriceBand, ...]:
+    bands = []
+    for offset, prices in enumerate(days, start=1):
+        ordered = sorted(prices)
+        last = len(ordered) - 1
+        bands.append(
+            PriceBand(
+                day=start_day + offset,
+                p10=ordered[int(last * 0.1)],
+                p50=ordered[int(last * 0.5)],
+                p90=ordered[int(last * 0.9)],
+            )
+        )
+    return tuple(bands)
+
+
+@lru_cache(maxsize=32)
+def _simulate(
+    start_day: int,
+    seed: int,
+    horizon: int,
+    paths: int,
+    price: int,
+    petrol_price: int,
+    trend: float,
+    supply: int,
+    price_min: int,
+    price_max: int,
+    event_chance: float,
+) -> PricePaths:
+    # Mirrors update_market_conditions -> apply_market -> apply_petrol_market
+    # -> random_event, stepping every path one day at a time. Supply is held
+    # at the last cleared volume since future sales are unknown here.
+    rng = random.Random(seed)
+    uniform = rng.uniform
+    randint = rng.randint
+    roll = rng.random
+    shortage_chance = event_chance * EVENT_SHORTAGE_SHARE
+
+    trends = [trend] * paths
+    prices = [price] * paths
+    petrols = [petrol_price] * paths
+    oil_days = []
+    petrol_days = []
+    for _ in range(horizon):
+        trends = [
+            max(-MARKET_TREND_MAX, min(MARKET_TREND_MAX, value + uniform(-0.6, 0.6))) for value in trends
+        ]
+        demands = [
+            max(40, BASE_DEMAND + int(value * 18) + randint(-DEMAND_VARIANCE, DEMAND_VARIANCE))
+            for value in trends
+        ]
+        prices = [
+            max(
+                price_min,
+                min(
+                    price_max,
+                    int(
+                        current
+                        + value * 6
+                        + max(-50, min(50, demand - supply)) * MARKET_IMPACT
+                        + randint(-10, 10)
+                    ),
+                ),
+            )
+            for current, value, demand in zip(prices, trends, demands)
+        ]
+        petrols = [
+            max(
+                PETROL_PRICE_MIN,
+                min(PETROL_PRICE_MAX, current + randint(-10, 10) + int((oil - price_min) * 0.1)),
+            )
+            for current, oil in zip(petrols, prices)
+        ]
+        prices = [
+            current + EVENT_PRICE_BUMP if current < price_max and roll() < shortage_chance else current
+            for current in prices
+        ]
+        oil_days.append(tuple(prices))
+        petrol_days.append(tuple(petrols))
+    return PricePaths(start_day=start_day, oil=tuple(oil_days), petrol=tuple(petrol_days))
@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from ..models import Tile
+from ..state import GameState
+from .pipelines import PIPE_TARIFF, Segment, hub_position, pipeline_graph
+
+ROAD_COST = 6.0
+GATHER_COST_PER_TILE = 0.5
+PIPELINE_CAPACITY = 40
+PIPELINE_COST = 1.0
+RAIL_CAPACITY = 80
+RAIL_COST = 2.5
 
 
 @dataclass
@@ -12,3 +23,200 @@ class TransportOption:
 
 def netback_price(market_price: int, transport: TransportOption) -> int:
     return max(1, int(market_price - transport.cost_per_barrel))
+
+
+ROAD = TransportOption("Road haulage", 0, ROAD_COST)
+
+
+def hub_options(level: int) -> list[TransportOption]:
+    """Trunk routes out of the hub, cheapest first; capacity is per day."""
+    if level <= 0:
+        return []
+    return [
+        TransportOption("Export pipeline", PIPELINE_CAPACITY * level, PIPELINE_COST),
+        TransportOption("Rail", RAIL_CAPACITY * level, RAIL_COST),
+    ]
+
+
+@dataclass(frozen=True)
+class Shipment:
+    tile: Tile
+    option: TransportOption
+    barrels: int
+    cost_per_barrel: float
+    piped: bool = False
+
+
+@dataclass
+class Routing:
+    shipments: list[Shipment] = field(default_factory=list)
+    pipe_usage: dict[Segment, int] = field(default_factory=dict)
+
+    @property
+    def barrels(self) -> int:
+        return sum(shipment.barrels for shipment in self.shipments)
+
+    @property
+    def freight(self) -> int:
+        return round(sum(shipment.barrels * shipment.cost_per_barrel for shipment in self.shipments))
+
+    def netback(self, market_price: int) -> int:
+        barrels = self.barrels
+        if not barrels:
+            return market_price
+        return netback_price(market_price, TransportOption("Blended", barrels, self.freight / barrels))
+
+
+@dataclass
+class TransportNetwork:
+    """Tiles -> hub -> buyers, with road haulage straight to buyers as the fallback.
+
+    Every route is a tile's gathering leg to the hub plus one trunk
+    option, or road haulage from the tile. A gathering leg is either the
+    gathering pipeline, for tiles connected to the hub, or a truck priced
+    by distance. A route's cost is the sum of its legs, so the min-cost
+    flow pairs the cheapest gathering legs with the cheapest trunk
+    capacity left today until road haulage is cheaper: a merge of two
+    sorted lists rather than a general flow solve. Pipe legs all cost the
+    same, but the tiles behind them do not: a tile that loses its share of
+    a segment falls back to a truck priced by its distance. Piped legs are
+    therefore ranked by what they save over that truck, largest first, so
+    far tiles claim shared throughput before near ones.
+
+    Truck costs are fixed per tile and cached the first time a tile
+    ships, and each owner's legs stay sorted until the state revision or
+    the pipeline network moves. Trunk options are rebuilt only when the
+    hub level changes, and the capacity they have used is reset when the
+    day changes.
+    """
+
+    level: int = -1
+    day: int = -1
+    options: list[TransportOption] = field(default_factory=list)
+    used: dict[str, int] = field(default_factory=dict)
+    _gather: dict[tuple[int, int], float] = field(default_factory=dict)
+    _legs: dict[str, tuple[tuple[int, int], list[tuple[float, int, Tile, bool]]]] = field(default_factory=dict)
+
+    def sync(self, state: GameState) -> None:
+        if state.transport_hub.level != self.level:
+            self.level = state.transport_hub.level
+            self.options = hub_options(self.level)
+        if state.day != self.day:
+            self.day = state.day
+            self.used.clear()
+        pipeline_graph(state).sync(state.day)
+
+    def gather_cost(self, state: GameState, tile: Tile) -> float:
+        key = (tile.row, tile.col)
+        cost = self._gather.get(key)
+        if cost is None:
+            hub_row, hub_col = hub_position(state)
+            cost = self._gather[key] = GATHER_COST_PER_TILE * (abs(hub_row - tile.row) + abs(hub_col - tile.col))
+        return cost
+
+    def remaining(self, option: TransportOption) -> int:
+        return option.capacity - self.used.get(option.name, 0)
+
+    def legs(self, state: GameState, owner: str) -> list[tuple[float, int, Tile, bool]]:
+        """``owner``'s gathering legs as ``(cost, order, tile, piped)``, cheapest first.
+
+        Equal-cost piped legs are ordered by their saving over the truck
+        leg, largest first; ``order`` records that rank.
+        """
+        graph = pipeline_graph(state)
+        key = (state.revision, graph.version)
+        cached = self._legs.get(owner)
+        if cached is None or cached[0] != key:
+            tiles = [tile for tile in state.tiles if tile.owner == owner]
+            # Farthest first, so among equal pipe tariffs the biggest saving
+            # over trucking (gather cost minus tariff) claims a segment first.
+            tiles.sort(key=lambda tile: -self.gather_cost(state, tile))
+            legs = [(self.gather_cost(state, tile), index, tile, False) for index, tile in enumerate(tiles)]
+            legs.extend(
+                (min(PIPE_TARIFF, self.gather_cost(state, tile)), index, tile, True)
+                for index, tile in enumerate(tiles)
+                if graph.connected(tile.row, tile.col)
+            )
+            legs.sort(key=lambda leg: leg[:2])
+            cached = self._legs[owner] = (key, legs)
+        return cached[1]
+
+    def route(self, state: GameState, volume: int, owner: str = "player") -> Routing:
+        """Cheapest way to move ``volume`` barrels out of ``owner``'s storage today."""
+        self.sync(state)
+        graph = pipeline_graph(state)
+        legs = [leg for leg in self.legs(state, owner) if leg[2].owner == owner]
+        taken: dict[int, int] = {}
+        routing = Routing()
+        leg = 0
+        for option in self.options:
+            spare = self.remaining(option)
+            while volume > 0 and spare > 0 and leg < len(legs):
+                cost, index, tile, piped = legs[leg]
+                left = tile.storage - taken.get(index, 0)
+                node = graph.node(tile.row, tile.col)
+                if piped:
+                    left = min(left, graph.spare(node, routing.pipe_usage))
+                if left <= 0:
+                    leg += 1
+                    continue
+                cost += option.cost_per_barrel
+                if cost >= ROAD.cost_per_barrel:
+                    break
+                barrels = min(volume, spare, left)
+                routing.shipments.append(Shipment(tile, option, barrels, cost, piped))
+                if piped:
+                    graph.reserve(node, barrels, routing.pipe_usage)
+                volume -= barrels
+                spare -= barrels
+                taken[index] = taken.get(index, 0) + barrels
+        # Whatever the hub cannot take cheaper goes by road, farthest tiles first.
+        for cost, index, tile, piped in reversed(legs):
+            if volume <= 0:
+                break
+            barrels = min(volume, tile.storage - taken.get(index, 0))
+            if not piped and barrels > 0:
+                routing.shipments.append(Shipment(tile, ROAD, barrels, ROAD.cost_per_barrel))
+                taken[index] = taken.get(index, 0) + barrels
+                volume -= barrels
+        return routing
+
+    def commit(self, state: GameState, routing: Routing) -> None:
+        for shipment in routing.shipments:
+            if shipment.option is not ROAD:
+                self.used[shipment.option.name] = self.used.get(shipment.option.name, 0) + shipment.barrels
+        pipeline_graph(state).commit(routing.pipe_usage)
+
+
+def transport_network(state: GameState) -> TransportNetwork:
+    network = state.transport
+    if network is None:
+        network = state.transport = TransportNetwork()
+    return network
+
+
+def ship_oil(state: GameState, volume: int, owner: str = "player") -> Routing:
+    """Withdraw ``volume`` barrels along the cheapest routes and book the capacity.
+
+    Callers charge ``routing.freight`` against the sale.
+    """
+    network = transport_network(state)
+    routing = network.route(state, volume, owner)
+    for shipment in routing.shipments:
+        shipment.tile.storage -= shipment.barrels
+    network.commit(state, routing)
+    return routing
+
+
+def tile_route(state: GameState, tile: Tile) -> tuple[TransportOption, float]:
+    """Cheapest route for the next barrel out of ``tile``, given today's spare capacity."""
+    network = transport_network(state)
+    network.sync(state)
+    gather = network.gather_cost(state, tile)
+    graph = pipeline_graph(state)
+    if graph.connected(tile.row, tile.col) and graph.spare(graph.node(tile.row, tile.col)) > 0:
+        gather = min(PIPE_TARIFF, gather)
+    for option in network.options:
+        if network.remaining(option) > 0 and gather + option.cost_per_barrel < ROAD.cost_per_barrel:
+            return option, gather + option.cost_per_barrel
+    return ROAD, ROAD.cost_per_barrel
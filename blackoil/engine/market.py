@@ -1,16 +1,30 @@
 from __future__ import annotations
 
+import heapq
 import random
+from dataclasses import dataclass, field
 
 from ..models import Buyer, Contract
-from ..state import GameState, TRADE_MAX_VOLUME, TRADE_MIN_VOLUME
+from ..state import GameState, ORDER_EXPIRY_DAYS, TRADE_MAX_VOLUME, TRADE_MIN_VOLUME
+from .orderbook import ASK, BID, Order, OrderBook
+from .sampling import BuyerSampler
+from .scheduler import schedule_contract
+
+
+def buyer_sampler(state: GameState) -> BuyerSampler:
+    sampler = state.buyer_sampler
+    if sampler is None or not sampler.matches(state.buyers):
+        sampler = state.buyer_sampler = BuyerSampler(state.buyers, cap=TRADE_MAX_VOLUME)
+    return sampler
 
 
 def trade_offers(state: GameState) -> list[Buyer]:
     rng = random.Random(state.map_seed + state.day)
-    offers = rng.sample(state.buyers, k=min(3, len(state.buyers)))
+    sampler = buyer_sampler(state)
+    offers = sampler.sample(rng, k=min(3, len(state.buyers)))
     for buyer in offers:
         buyer.demand = max(TRADE_MIN_VOLUME, min(TRADE_MAX_VOLUME, buyer.demand + rng.randint(-20, 20)))
+        sampler.refresh(buyer)
     return offers
 
 
@@ -30,3 +44,102 @@ def contract_offers(state: GameState) -> list[Contract]:
             )
         )
     return offers
+
+
+def sign_contract(state: GameState, contract: Contract, volume: int) -> Contract:
+    contract.volume = volume
+    state.contracts.append(contract)
+    schedule_contract(state, contract)
+    return contract
+
+
+def order_book(state: GameState, commodity: str = "oil") -> OrderBook:
+    book = state.order_books.get(commodity)
+    if book is None:
+        book = state.order_books[commodity] = OrderBook(commodity)
+    return book
+
+
+def market_price(state: GameState, commodity: str) -> int:
+    return state.price if commodity == "oil" else state.petrol_price
+
+
+def buyer_owner(index: int) -> str:
+    """Order-book owner id for ``state.buyers[index]``; names need not be unique."""
+    return f"buyer:{index}"
+
+
+@dataclass
+class BidQueue:
+    """Which buyers could need a new bid in one commodity's book.
+
+    A buyer needs a bid when its last one lapsed, when it traded, or when
+    its demand recovers from zero. ``expiring`` is a heap of
+    ``(expires_day, buyer index)`` for posted bids, and ``due`` collects
+    the rest as they happen, so posting visits only those buyers instead
+    of the whole list.
+    """
+
+    buyers: list[Buyer]
+    due: set[int]
+    expiring: list[tuple[int, int]] = field(default_factory=list)
+
+    def take_due(self, day: int) -> list[int]:
+        while self.expiring and self.expiring[0][0] < day:
+            self.due.add(heapq.heappop(self.expiring)[1])
+        due = sorted(self.due)
+        self.due.clear()
+        return due
+
+
+def bid_queue(state: GameState, commodity: str) -> BidQueue:
+    """The commodity's bid queue; a new one starts with every buyer due."""
+    queues = state.bid_queues
+    if queues is None:
+        queues = state.bid_queues = {}
+    queue = queues.get(commodity)
+    if queue is None or queue.buyers is not state.buyers:
+        queue = queues[commodity] = BidQueue(state.buyers, set(range(len(state.buyers))))
+    return queue
+
+
+def mark_bidders(state: GameState, indices: list[int]) -> None:
+    """Flag buyers whose demand changed so every book checks their bids."""
+    for commodity in ("oil", "petrol"):
+        bid_queue(state, commodity).due.update(indices)
+
+
+def post_buyer_bids(state: GameState, commodity: str = "oil") -> int:
+    """Buyers without an open bid post one sized to their demand."""
+    book = order_book(state, commodity)
+    queue = bid_queue(state, commodity)
+    price = market_price(state, commodity)
+    posted = 0
+    for index in queue.take_due(state.day):
+        buyer = state.buyers[index]
+        owner = buyer_owner(index)
+        if buyer.demand <= 0:
+            continue
+        bids = book.open_orders(owner, state.day, BID)
+        if bids:
+            heapq.heappush(queue.expiring, (max(bid.expires_day for bid in bids), index))
+            continue
+        volume = min(TRADE_MAX_VOLUME, buyer.demand)
+        bid = book.post_bid(owner, volume, buyer.price_for(price), state.day + ORDER_EXPIRY_DAYS)
+        heapq.heappush(queue.expiring, (bid.expires_day, index))
+        posted += 1
+    return posted
+
+
+def post_ask(state: GameState, owner: str, commodity: str, volume: int, price: int) -> tuple[bool, str, Order | None]:
+    if volume <= 0:
+        return False, "Nothing to offer.", None
+    if price <= 0:
+        return False, "Ask price must be positive.", None
+    order = order_book(state, commodity).post_ask(owner, volume, price, state.day + ORDER_EXPIRY_DAYS)
+    return True, f"Posted ask for {volume} barrels of {commodity} at ${price}.", order
+
+
+def open_asks(state: GameState, owner: str, commodity: str = "oil") -> list[Order]:
+    book = state.order_books.get(commodity)
+    return book.open_orders(owner, state.day, ASK) if book else []
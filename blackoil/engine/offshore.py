@@ -1,6 +1,23 @@
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass
+from functools import lru_cache
+
+from ..models import EconomySnapshot
+from ..state import OFFSHORE, GameState, record_revenue, record_sale
+
+OFFSHORE_BLOCK_COUNT = 4
+OFFSHORE_LEASE_COST = 2400
+OFFSHORE_DEVELOP_COST = 3600
+OFFSHORE_SHIPPING_COST = 6
+AVAILABILITY_PATHS = 1000
+SEA_STATE_PERSISTENCE = 0.7
+STORM_BASELINE = 0.5
+MAX_DOWNTIME_PROBABILITY = 0.95
+
+BLOCK_NAMES = ["North Shoal", "Gull Bank", "Cape Deep", "Amber Trench", "Reef Margin", "Storm Ridge"]
+RIG_TYPES = {"shallow": ("jackup",), "deep": ("semisub", "drillship")}
 
 
 @dataclass
@@ -9,6 +26,14 @@ class OffshoreBlock:
     water_depth: str
     metocean_severity: float
     rig_requirement: str
+    reserve: int = 0
+    output_rate: int = 0
+    owner: str | None = None
+    developed: bool = False
+
+    @property
+    def producing(self) -> bool:
+        return self.developed and self.reserve > 0
 
 
 def downtime_probability(block: OffshoreBlock) -> float:
@@ -16,3 +41,175 @@ def downtime_probability(block: OffshoreBlock) -> float:
     if block.water_depth == "deep":
         base += 0.08
     return min(0.5, base + block.metocean_severity * 0.1)
+
+
+def create_offshore_blocks(seed: int, count: int = OFFSHORE_BLOCK_COUNT) -> list[OffshoreBlock]:
+    rng = random.Random(seed ^ 0x0FF5)
+    blocks = []
+    for name in rng.sample(BLOCK_NAMES, k=min(count, len(BLOCK_NAMES))):
+        depth = rng.choice(("shallow", "deep"))
+        deep = depth == "deep"
+        blocks.append(
+            OffshoreBlock(
+                name=name,
+                water_depth=depth,
+                metocean_severity=round(rng.uniform(0.2, 1.0), 2),
+                rig_requirement=rng.choice(RIG_TYPES[depth]),
+                reserve=rng.randint(900, 1800) if deep else rng.randint(400, 900),
+                output_rate=rng.randint(35, 60) if deep else rng.randint(18, 32),
+            )
+        )
+    return blocks
+
+
+def offshore_blocks(state: GameState) -> list[OffshoreBlock]:
+    """The state's offshore blocks, generated from ``map_seed`` on first use."""
+    if not state.offshore_blocks:
+        state.offshore_blocks = create_offshore_blocks(state.map_seed)
+    return state.offshore_blocks
+
+
+def lease_block(state: GameState, block: OffshoreBlock) -> tuple[bool, str]:
+    if block.owner is not None:
+        return False, "Block already leased."
+    if state.cash < OFFSHORE_LEASE_COST:
+        return False, "Insufficient cash to lease block."
+    state.cash -= OFFSHORE_LEASE_COST
+    block.owner = "player"
+    return True, f"Leased offshore block {block.name}."
+
+
+def develop_block(state: GameState, block: OffshoreBlock) -> tuple[bool, str]:
+    if block.owner != "player":
+        return False, "Block not leased."
+    if block.developed:
+        return False, "Block already developed."
+    if state.cash < OFFSHORE_DEVELOP_COST:
+        return False, "Insufficient cash to develop block."
+    state.cash -= OFFSHORE_DEVELOP_COST
+    block.developed = True
+    return True, f"Platform installed on {block.name}. Production starts next day."
+
+
+def next_sea_state(sea_state: float, rng_gauss) -> float:
+    """One AR(1) step of the shared regional sea state (mean zero, unit variance)."""
+    persistence = SEA_STATE_PERSISTENCE
+    return persistence * sea_state + (1 - persistence * persistence) ** 0.5 * rng_gauss(0, 1)
+
+
+def storm_factor(sea_state: float) -> float:
+    return STORM_BASELINE + max(0.0, sea_state)
+
+
+def fleet_downtime(probabilities: list[float], sea_state: float, roll) -> list[bool]:
+    """Weather downtime for every block on one day, in one pass.
+
+    All blocks share the day's sea state, so rough days take several
+    platforms down together; each block's own exposure scales it.
+    """
+    factor = storm_factor(sea_state)
+    cap = MAX_DOWNTIME_PROBABILITY
+    return [roll() < min(cap, probability * factor) for probability in probabilities]
+
+
+def operate_offshore(state: GameState, snapshot: EconomySnapshot) -> int:
+    """Advance the sea state, then produce and ship from every running block.
+
+    Offshore crude is sold on delivery at the spot price less shipping
+    rather than stored, so it joins the day's market supply directly.
+    Returns barrels produced.
+    """
+    state.sea_state = next_sea_state(state.sea_state, random.gauss)
+    blocks = [block for block in state.offshore_blocks if block.producing]
+    if not blocks:
+        return 0
+    down = fleet_downtime([downtime_probability(block) for block in blocks], state.sea_state, random.random)
+    produced = 0
+    for block, is_down in zip(blocks, down):
+        if is_down:
+            if block.owner == "player":
+                snapshot.events.append(f"Weather shut in {block.name} today.")
+            continue
+        output = min(block.output_rate, block.reserve)
+        block.reserve -= output
+        produced += output
+        if block.owner == "player":
+            revenue = output * max(1, state.price - OFFSHORE_SHIPPING_COST)
+            state.cash += revenue
+            record_sale(state, "player", output)
+            record_revenue(state, OFFSHORE, output, revenue)
+    snapshot.production += produced
+    state.total_oil_produced += produced
+    state.last_day_production += produced
+    return produced
+
+
+@dataclass(frozen=True)
+class BlockAvailability:
+    """Uptime over the rest of the season, from tomorrow to the last day.
+
+    ``daily`` holds one probability per remaining day, and ``p10_days``
+    and ``p90_days`` bound the producing days over that same window.
+    """
+
+    name: str
+    daily: tuple[float, ...]
+    p10_days: int
+    p90_days: int
+
+    def expected_days(self) -> float:
+        return sum(self.daily)
+
+    def summary(self) -> str:
+        remaining = len(self.daily)
+        if remaining <= 0:
+            return "Season over"
+        share = self.expected_days() / remaining
+        return f"{share:.0%} uptime expected ({self.p10_days}-{self.p90_days} of {remaining} days left)"
+
+
+def availability_forecast(state: GameState, paths: int = AVAILABILITY_PATHS) -> list[BlockAvailability]:
+    """Monte Carlo uptime per block for the rest of the season.
+
+    Every path starts from today's sea state and runs to the season's last
+    day. The result is cached on its inputs, so repeated calls on the same
+    day (the offshore dialog, the UI refresh) share one simulation.
+    """
+    blocks = offshore_blocks(state)
+    exposure = tuple((block.name, downtime_probability(block)) for block in blocks)
+    days = max(0, state.scenario.max_days - state.day)
+    seed = state.map_seed ^ state.day
+    return list(_simulate_availability(exposure, days, paths, seed, state.sea_state))
+
+
+@lru_cache(maxsize=16)
+def _simulate_availability(
+    exposure: tuple[tuple[str, float], ...], days: int, paths: int, seed: int, sea_state: float
+) -> tuple[BlockAvailability, ...]:
+    rng = random.Random(seed ^ 0xA5A5)
+    start = sea_state
+    probabilities = [probability for _name, probability in exposure]
+    up_counts = [[0] * days for _ in exposure]
+    totals = [[0] * paths for _ in exposure]
+    for path in range(paths):
+        sea_state = start
+        for day in range(days):
+            sea_state = next_sea_state(sea_state, rng.gauss)
+            down = fleet_downtime(probabilities, sea_state, rng.random)
+            for index, is_down in enumerate(down):
+                if not is_down:
+                    up_counts[index][day] += 1
+                    totals[index][path] += 1
+    result = []
+    for (name, _probability), counts, per_path in zip(exposure, up_counts, totals):
+        ordered = sorted(per_path)
+        last = len(ordered) - 1
+        result.append(
+            BlockAvailability(
+                name=name,
+                daily=tuple(count / paths for count in counts),
+                p10_days=ordered[int(last * 0.1)],
+                p90_days=ordered[int(last * 0.9)],
+            )
+        )
+    return tuple(result)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Callable
+
+from .telemetry import TelemetryLog
+
+FILL_LOG_LIMIT = 500
+
+BID = "bid"
+ASK = "ask"
+
+
+@dataclass
+class Order:
+    order_id: int
+    side: str
+    owner: str
+    volume: int
+    price: int
+    expires_day: int
+    filled: int = 0
+    cancelled: bool = False
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.volume - self.filled)
+
+    def is_open(self, day: int) -> bool:
+        return not self.cancelled and self.remaining > 0 and day <= self.expires_day
+
+
+@dataclass
+class Fill:
+    day: int
+    bid: Order
+    ask: Order
+    volume: int
+    price: int
+
+    @property
+    def value(self) -> int:
+        return self.volume * self.price
+
+
+# Settlement hook: given a prospective match, return the volume the seller
+# can actually deliver. Returning 0 cancels the ask.
+Settle = Callable[[Order, Order, int, int], int]
+
+
+@dataclass
+class OrderBook:
+    """Limit order book for one commodity with price-time priority.
+
+    Bids sit in a max-heap and asks in a min-heap keyed by price then
+    arrival. Cancelled, filled and expired orders are dropped lazily when
+    they reach the top, so posting and cancelling stay O(log n). ``log``
+    keeps the last ``FILL_LOG_LIMIT`` fills.
+    """
+
+    commodity: str
+    log: TelemetryLog = field(default_factory=lambda: TelemetryLog.bounded(FILL_LOG_LIMIT))
+    _orders: dict[int, Order] = field(default_factory=dict, repr=False)
+    _by_owner: dict[str, set[int]] = field(default_factory=dict, repr=False)
+    _bids: list[tuple[int, int]] = field(default_factory=list, repr=False)
+    _asks: list[tuple[int, int]] = field(default_factory=list, repr=False)
+    _next_id: int = 1
+
+    def post(self, side: str, owner: str, volume: int, price: int, expires_day: int) -> Order:
+        if side not in (BID, ASK):
+            raise ValueError(f"Unknown order side: {side}")
+        order = Order(self._next_id, side, owner, volume, price, expires_day)
+        self._next_id += 1
+        self._orders[order.order_id] = order
+        self._by_owner.setdefault(owner, set()).add(order.order_id)
+        if side == BID:
+            heapq.heappush(self._bids, (-price, order.order_id))
+        else:
+            heapq.heappush(self._asks, (price, order.order_id))
+        return order
+
+    def post_bid(self, owner: str, volume: int, price: int, expires_day: int) -> Order:
+        return self.post(BID, owner, volume, price, expires_day)
+
+    def post_ask(self, owner: str, volume: int, price: int, expires_day: int) -> Order:
+        return self.post(ASK, owner, volume, price, expires_day)
+
+    def cancel(self, order_id: int) -> None:
+        order = self._orders.get(order_id)
+        if order is not None:
+            order.cancelled = True
+            self._forget(order)
+
+    def open_orders(self, owner: str, day: int, side: str | None = None) -> list[Order]:
+        orders = (self._orders[order_id] for order_id in self._by_owner.get(owner, ()))
+        return [order for order in orders if order.is_open(day) and (side is None or order.side == side)]
+
+    def orders(self) -> list[Order]:
+        return list(self._orders.values())
+
+    def depth(self, side: str, day: int, levels: int = 5) -> list[tuple[int, int]]:
+        """Aggregated (price, volume) for the best ``levels`` prices on one side."""
+        heap = self._bids if side == BID else self._asks
+        totals: dict[int, int] = {}
+        for key, order_id in sorted(heap):
+            order = self._orders.get(order_id)
+            if order is None or not order.is_open(day):
+                continue
+            price = -key if side == BID else key
+            if price not in totals and len(totals) >= levels:
+                break
+            totals[price] = totals.get(price, 0) + order.remaining
+        return list(totals.items())
+
+    def clear(self, day: int, settle: Settle | None = None) -> list[Fill]:
+        fills: list[Fill] = []
+        while True:
+            bid = self._top(self._bids, day)
+            ask = self._top(self._asks, day)
+            if bid is None or ask is None or bid.price < ask.price:
+                break
+            # The order that rested first sets the trade price.
+            price = bid.price if bid.order_id < ask.order_id else ask.price
+            volume = min(bid.remaining, ask.remaining)
+            if settle is not None:
+                volume = max(0, min(volume, settle(bid, ask, volume, price)))
+            if volume <= 0:
+                self.cancel(ask.order_id)
+                continue
+            bid.filled += volume
+            ask.filled += volume
+            fill = Fill(day=day, bid=bid, ask=ask, volume=volume, price=price)
+            fills.append(fill)
+            self.log.add(
+                day,
+                f"{self.commodity}-fill",
+                f"{ask.owner} -> {bid.owner}: {volume} @ ${price}",
+                fill.value,
+            )
+            for order in (bid, ask):
+                if order.remaining == 0:
+                    self._forget(order)
+        self.expire(day)
+        return fills
+
+    def expire(self, day: int) -> None:
+        for order in [order for order in self._orders.values() if not order.is_open(day + 1)]:
+            self._forget(order)
+        if len(self._bids) + len(self._asks) > 2 * len(self._orders) + 64:
+            self._rebuild()
+
+    def _top(self, heap: list[tuple[int, int]], day: int) -> Order | None:
+        while heap:
+            order = self._orders.get(heap[0][1])
+            if order is not None and order.is_open(day):
+                return order
+            heapq.heappop(heap)
+        return None
+
+    def _forget(self, order: Order) -> None:
+        self._orders.pop(order.order_id, None)
+        owned = self._by_owner.get(order.owner)
+        if owned is not None:
+            owned.discard(order.order_id)
+            if not owned:
+                del self._by_owner[order.owner]
+
+    def _rebuild(self) -> None:
+        self._bids = [(-order.price, order.order_id) for order in self._orders.values() if order.side == BID]
+        self._asks = [(order.price, order.order_id) for order in self._orders.values() if order.side == ASK]
+        heapq.heapify(self._bids)
+        heapq.heapify(self._asks)
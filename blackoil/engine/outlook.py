@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from ..models import Tile
+from ..state import GameState
+from .decline import decline_cache
+
+OUTLOOK_HORIZON = 365
+
+
+@dataclass(frozen=True)
+class WellOutlook:
+    """Projection for one pumped well, assuming its storage is not emptied.
+
+    Output is capped by the space left, as in production, so the well shuts
+    in on the day storage fills and produces nothing after. A well that is
+    down for an incident produces nothing until it is back online, and its
+    decline curve resumes where it stopped.
+
+    ``days_to_depletion`` and ``days_to_storage_full`` are ``None`` when
+    that does not happen within the horizon; a well that shuts in first
+    never depletes. Storage that is already full reports day 0.
+    """
+
+    days_to_depletion: int | None
+    days_to_storage_full: int | None
+    season_barrels: int
+
+    def summary(self) -> str:
+        if self.days_to_depletion is not None:
+            dry = f"{self.days_to_depletion}d"
+        elif self.days_to_storage_full is not None:
+            dry = "shut in when full"
+        else:
+            dry = "beyond a year"
+        full = f"{self.days_to_storage_full}d" if self.days_to_storage_full is not None else "not soon"
+        return f"Runs dry: {dry} | Storage full: {full} | Season: {self.season_barrels} bbl"
+
+
+def project_well(state: GameState, tile: Tile, horizon: int = OUTLOOK_HORIZON) -> WellOutlook:
+    days_left = max(0, state.scenario.max_days - state.day)
+    if not tile.has_pump or tile.reserve <= 0:
+        return WellOutlook(None if tile.reserve > 0 else 0, None, 0)
+    span = max(horizon, days_left)
+    down = min(span, down_days(state, tile))
+    rates = [0] * down + decline_cache(state).projected(tile, span - down)
+    space = tile.available_capacity
+    if space <= 0:
+        return WellOutlook(None, 0, 0)
+    limit = min(tile.reserve, space)
+    produced = 0
+    season = 0
+    depletion = None
+    storage_full = None
+    for day, rate in enumerate(rates, start=1):
+        produced = min(limit, produced + rate)
+        if day <= days_left:
+            season = produced
+        if produced >= limit:
+            if produced >= tile.reserve:
+                depletion = day
+            if produced >= space:
+                storage_full = day
+            break
+    return WellOutlook(depletion, storage_full, season)
+
+
+def down_days(state: GameState, tile: Tile) -> int:
+    """Days from tomorrow on that ``tile`` stays shut in by an incident."""
+    return max(0, tile.down_until - state.day - 1)
+
+
+@dataclass
+class OutlookCache:
+    """Per-well outlooks, recomputed only when an input to them changes."""
+
+    _entries: dict[tuple[int, int], tuple[tuple, WellOutlook]] = field(default_factory=dict)
+
+    def outlook(self, state: GameState, tile: Tile) -> WellOutlook:
+        key = (
+            tile.reserve,
+            tile.storage,
+            tile.capacity,
+            tile.current_output,
+            tile.pump_age,
+            down_days(state, tile),
+            state.scenario.max_days - state.day,
+        )
+        entry = self._entries.get((tile.row, tile.col))
+        if entry is None or entry[0] != key:
+            entry = self._entries[(tile.row, tile.col)] = (key, project_well(state, tile))
+        return entry[1]
+
+
+def outlook_cache(state: GameState) -> OutlookCache:
+    cache = state.outlooks
+    if cache is None:
+        cache = state.outlooks = OutlookCache()
+    return cache
+
+
+def well_outlooks(state: GameState, owner: str = "player") -> dict[tuple[int, int], WellOutlook]:
+    cache = outlook_cache(state)
+    return {
+        (tile.row, tile.col): cache.outlook(state, tile)
+        for tile in state.tiles
+        if tile.owner == owner and tile.has_pump
+    }
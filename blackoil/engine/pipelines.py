@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+
+from ..models import Tile
+from ..state import GameState
+
+PIPE_SEGMENT_COST = 250
+SEGMENT_CAPACITY = 120
+PIPE_TARIFF = 0.25
+
+Segment = tuple[int, int]
+
+
+def hub_position(state: GameState) -> tuple[int, int]:
+    """The hub sits in the bottom-right corner of the map."""
+    last = state.scenario.grid_size - 1
+    return last, last
+
+
+@dataclass
+class PipelineGraph:
+    """Pipe segments between adjacent tiles, with connectivity to the hub.
+
+    Nodes are tile indices (``row * size + col``) held in dicts, so the
+    graph costs nothing for tiles without pipe however large the map is.
+    Connectivity is a union-find with path halving and union by size, so
+    "is this tile on the hub's network" is near O(1). The hub's component
+    also keeps a BFS tree toward the hub; a segment that joins a new piece
+    of network extends the tree from the joining node instead of
+    rebuilding it. Oil from a tile follows its tree path, and every
+    segment on it carries at most ``SEGMENT_CAPACITY`` barrels a day.
+    """
+
+    size: int
+    hub: int
+    capacity: int = SEGMENT_CAPACITY
+    version: int = 0
+    day: int = -1
+    used: dict[Segment, int] = field(default_factory=dict)
+    _parent: dict[int, int] = field(default_factory=dict)
+    _weight: dict[int, int] = field(default_factory=dict)
+    _adjacent: dict[int, list[int]] = field(default_factory=dict)
+    _toward_hub: dict[int, int] = field(default_factory=dict)
+
+    def node(self, row: int, col: int) -> int:
+        return row * self.size + col
+
+    def find(self, node: int) -> int:
+        parent = self._parent
+        if node not in parent:
+            return node
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def connected(self, row: int, col: int) -> bool:
+        node = self.node(row, col)
+        return node == self.hub or self.find(node) == self.find(self.hub)
+
+    def has_segment(self, a: int, b: int) -> bool:
+        return b in self._adjacent.get(a, ())
+
+    def add(self, a: int, b: int) -> bool:
+        """Lay a segment between nodes ``a`` and ``b``; False if it already exists."""
+        if self.has_segment(a, b):
+            return False
+        self._adjacent.setdefault(a, []).append(b)
+        self._adjacent.setdefault(b, []).append(a)
+        hub_root = self.find(self.hub)
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            if root_a == hub_root:
+                self._extend(b, a)
+            elif root_b == hub_root:
+                self._extend(a, b)
+            self._union(root_a, root_b)
+        self.version += 1
+        return True
+
+    def path(self, node: int) -> list[Segment]:
+        """Segments from ``node`` to the hub, empty when not connected."""
+        segments = []
+        while node != self.hub:
+            following = self._toward_hub.get(node)
+            if following is None:
+                return []
+            segments.append((min(node, following), max(node, following)))
+            node = following
+        return segments
+
+    def sync(self, day: int) -> None:
+        if day != self.day:
+            self.day = day
+            self.used.clear()
+
+    def spare(self, node: int, pending: dict[Segment, int] | None = None) -> int:
+        """Barrels ``node`` can still push to the hub today."""
+        if node == self.hub:
+            return 1 << 30
+        path = self.path(node)
+        if not path:
+            return 0
+        pending = pending or {}
+        return min(self.capacity - self.used.get(segment, 0) - pending.get(segment, 0) for segment in path)
+
+    def reserve(self, node: int, barrels: int, usage: dict[Segment, int]) -> None:
+        for segment in self.path(node):
+            usage[segment] = usage.get(segment, 0) + barrels
+
+    def commit(self, usage: dict[Segment, int]) -> None:
+        for segment, barrels in usage.items():
+            self.used[segment] = self.used.get(segment, 0) + barrels
+
+    def _union(self, root_a: int, root_b: int) -> None:
+        weight_a = self._weight.setdefault(root_a, 1)
+        weight_b = self._weight.setdefault(root_b, 1)
+        self._parent.setdefault(root_a, root_a)
+        self._parent.setdefault(root_b, root_b)
+        if weight_a < weight_b:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._weight[root_a] = weight_a + weight_b
+
+    def _extend(self, start: int, via: int) -> None:
+        # Only the newly joined piece is walked; the rest of the tree stands.
+        self._toward_hub[start] = via
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for neighbor in self._adjacent.get(node, ()):
+                if neighbor != self.hub and neighbor not in self._toward_hub:
+                    self._toward_hub[neighbor] = node
+                    queue.append(neighbor)
+
+
+def pipeline_graph(state: GameState) -> PipelineGraph:
+    """The pipeline graph, rebuilt from the saved segments when missing."""
+    graph = state.pipeline_graph
+    if graph is None:
+        row, col = hub_position(state)
+        size = state.scenario.grid_size
+        graph = state.pipeline_graph = PipelineGraph(size, row * size + col)
+        for row_a, col_a, row_b, col_b in state.pipelines:
+            graph.add(graph.node(row_a, col_a), graph.node(row_b, col_b))
+    return graph
+
+
+def is_connected(state: GameState, tile: Tile) -> bool:
+    if not state.pipelines:
+        return hub_position(state) == (tile.row, tile.col)
+    return pipeline_graph(state).connected(tile.row, tile.col)
+
+
+def lay_pipeline(state: GameState, tile: Tile) -> tuple[bool, str]:
+    """Extend the pipe from ``tile`` one segment closer to the hub.
+
+    Existing pipe toward the hub is followed first, so repeated use runs a
+    line from the tile to the hub (or to any tile already connected).
+    """
+    if tile.owner != "player":
+        return False, "Tile not owned."
+    graph = pipeline_graph(state)
+    if graph.connected(tile.row, tile.col):
+        return False, "Tile already connected to the hub."
+    if state.cash < PIPE_SEGMENT_COST:
+        return False, "Insufficient cash to lay pipe."
+    hub_row, hub_col = hub_position(state)
+    row, col = tile.row, tile.col
+    while True:
+        steps = []
+        if row != hub_row:
+            steps.append((row + (1 if hub_row > row else -1), col))
+        if col != hub_col:
+            steps.append((row, col + (1 if hub_col > col else -1)))
+        here = graph.node(row, col)
+        laid = next((step for step in steps if graph.has_segment(here, graph.node(*step))), None)
+        if laid is None:
+            break
+        row, col = laid
+    # Prefer joining the network outright, then closing the longer gap.
+    steps.sort(key=lambda step: (not graph.connected(*step), max(abs(hub_row - step[0]), abs(hub_col - step[1]))))
+    target = steps[0]
+    graph.add(here, graph.node(*target))
+    state.pipelines.append((row, col, *target))
+    state.cash -= PIPE_SEGMENT_COST
+    if graph.connected(tile.row, tile.col):
+        return True, f"Pipeline from ({tile.row + 1}, {tile.col + 1}) now reaches the hub."
+    return True, f"Laid pipe ({row + 1}, {col + 1}) -> ({target[0] + 1}, {target[1] + 1})."
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
-from ..state import GameState
+from ..state import ONSHORE, REFINING, GameState, record_revenue, record_sale
 from .. import economy
+from .logistics import ship_oil
 
 
 def sell_oil(state: GameState) -> tuple[bool, str, int]:
     total_storage = economy.total_storage(state, "player")
     if total_storage <= 0:
         return False, "No oil to sell.", 0
-    revenue = total_storage * state.price
+    routing = ship_oil(state, total_storage)
+    revenue = total_storage * state.price - routing.freight
     state.cash += revenue
-    economy.withdraw_oil(state, total_storage)
-    return True, f"Sold {total_storage} barrels.", revenue
+    record_sale(state, "player", total_storage)
+    record_revenue(state, ONSHORE, total_storage, revenue)
+    return True, f"Sold {total_storage} barrels (netback ${routing.netback(state.price)}/bbl).", revenue
 
 
 def sell_petrol(state: GameState) -> tuple[bool, str, int]:
@@ -21,4 +24,5 @@ def sell_petrol(state: GameState) -> tuple[bool, str, int]:
     state.cash += revenue
     volume = state.petrol_storage
     state.petrol_storage = 0
+    record_revenue(state, REFINING, volume, revenue)
     return True, f"Sold {volume} barrels of petrol.", revenue
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from ..models import Refinery, TransportHub
+from ..models import EconomySnapshot, Refinery, TransportHub
 from ..state import (
     GameState,
     HUB_BUILD_COST,
@@ -13,15 +13,33 @@ from ..state import (
     REFINERY_UPGRADE_COST,
     RESEARCH_COST,
 )
+from .scheduler import PROJECT_COMPLETE, on, scheduler
 
 
-@dataclass
+REFINERY_BUILD_DAYS = 3
+REFINERY_UPGRADE_DAYS = 2
+HUB_BUILD_DAYS = 2
+HUB_UPGRADE_DAYS = 1
+RESEARCH_DAYS = 2
+
+REFINERY = "refinery"
+REFINERY_UPGRADE = "refinery-upgrade"
+HUB = "hub"
+HUB_UPGRADE = "hub-upgrade"
+RESEARCH = "research"
+
+
+# Identity equality: projects are tracked individually, and removing one
+# from a long active list should not compare every field of every entry.
+@dataclass(eq=False)
 class Project:
     name: str
     duration_days: int
     remaining_days: int
     cost: int
     status: str = "planned"
+    kind: str = ""
+    finish_day: int | None = None
 
     def tick(self) -> None:
         if self.status != "active":
@@ -31,36 +49,101 @@ class Project:
         if self.remaining_days == 0:
             self.status = "complete"
 
+    def days_left(self, day: int) -> int:
+        if self.finish_day is None:
+            return self.remaining_days
+        return max(0, self.finish_day - day)
+
+    def progress(self, day: int) -> float:
+        if self.duration_days <= 0:
+            return 1.0
+        return 1 - self.days_left(day) / self.duration_days
+
+
+def active_project(state: GameState, kind: str) -> Project | None:
+    return next((project for project in state.projects if project.kind == kind), None)
+
+
+def start_project(state: GameState, kind: str, name: str, duration_days: int, cost: int) -> Project:
+    """Charge for a project and queue its completion.
+
+    ``state.projects`` only ever holds active projects and the scheduler
+    wakes each one on its finish day, so the day loop never walks them.
+    """
+    state.cash -= cost
+    project = Project(
+        name=name,
+        duration_days=duration_days,
+        remaining_days=duration_days,
+        cost=cost,
+        status="active",
+        kind=kind,
+        finish_day=state.day + duration_days,
+    )
+    state.projects.append(project)
+    scheduler(state).schedule(project.finish_day, PROJECT_COMPLETE, project)
+    return project
+
+
+@on(PROJECT_COMPLETE)
+def complete_project(state: GameState, project: Project, snapshot: EconomySnapshot) -> None:
+    if project.status != "active":
+        return
+    state.projects.remove(project)
+    project.remaining_days = 0
+    project.status = "complete"
+    if project.kind == REFINERY:
+        state.refinery = Refinery(level=1, capacity=REFINERY_BASE_CAPACITY)
+        message = "Refinery construction complete."
+    elif project.kind == REFINERY_UPGRADE:
+        state.refinery.level += 1
+        state.refinery.capacity += int(REFINERY_BASE_CAPACITY * 0.6)
+        message = f"Refinery upgraded to level {state.refinery.level}."
+    elif project.kind == HUB:
+        state.transport_hub = TransportHub(level=1)
+        message = "Transport hub construction complete."
+    elif project.kind == HUB_UPGRADE:
+        state.transport_hub.level += 1
+        message = f"Transport hub upgraded to level {state.transport_hub.level}."
+    elif project.kind == RESEARCH:
+        state.research_level += 1
+        message = "Research complete. Efficiency improved."
+    else:
+        message = f"{project.name} complete."
+    snapshot.events.append(message)
+
 
 def build_refinery(state: GameState) -> tuple[bool, str]:
     if state.refinery.active:
         return False, "Refinery already built."
+    if active_project(state, REFINERY):
+        return False, "Refinery already under construction."
     if state.cash < REFINERY_BUILD_COST:
         return False, "Insufficient cash to build refinery."
-    state.cash -= REFINERY_BUILD_COST
-    state.refinery = Refinery(level=1, capacity=REFINERY_BASE_CAPACITY)
-    return True, "Refinery built."
+    start_project(state, REFINERY, "Refinery", REFINERY_BUILD_DAYS, REFINERY_BUILD_COST)
+    return True, f"Refinery construction started ({REFINERY_BUILD_DAYS} days)."
 
 
 def upgrade_refinery(state: GameState) -> tuple[bool, str]:
     if not state.refinery.active:
         return False, "No refinery to upgrade."
+    if active_project(state, REFINERY_UPGRADE):
+        return False, "Refinery upgrade already in progress."
     if state.cash < REFINERY_UPGRADE_COST:
         return False, "Insufficient cash to upgrade refinery."
-    state.cash -= REFINERY_UPGRADE_COST
-    state.refinery.level += 1
-    state.refinery.capacity += int(REFINERY_BASE_CAPACITY * 0.6)
-    return True, f"Refinery upgraded to level {state.refinery.level}."
+    start_project(state, REFINERY_UPGRADE, "Refinery upgrade", REFINERY_UPGRADE_DAYS, REFINERY_UPGRADE_COST)
+    return True, f"Refinery upgrade started ({REFINERY_UPGRADE_DAYS} days)."
 
 
 def build_hub(state: GameState) -> tuple[bool, str]:
     if state.transport_hub.active:
         return False, "Transport hub already built."
+    if active_project(state, HUB):
+        return False, "Transport hub already under construction."
     if state.cash < HUB_BUILD_COST:
         return False, "Insufficient cash to build transport hub."
-    state.cash -= HUB_BUILD_COST
-    state.transport_hub = TransportHub(level=1)
-    return True, "Transport hub constructed."
+    start_project(state, HUB, "Transport hub", HUB_BUILD_DAYS, HUB_BUILD_COST)
+    return True, f"Transport hub construction started ({HUB_BUILD_DAYS} days)."
 
 
 def upgrade_hub(state: GameState) -> tuple[bool, str]:
@@ -68,16 +151,18 @@ def upgrade_hub(state: GameState) -> tuple[bool, str]:
         return False, "No transport hub to upgrade."
     if state.transport_hub.level >= HUB_MAX_LEVEL:
         return False, "Transport hub already at max level."
+    if active_project(state, HUB_UPGRADE):
+        return False, "Transport hub upgrade already in progress."
     if state.cash < HUB_UPGRADE_COST:
         return False, "Insufficient cash to upgrade hub."
-    state.cash -= HUB_UPGRADE_COST
-    state.transport_hub.level += 1
-    return True, f"Transport hub upgraded to level {state.transport_hub.level}."
+    start_project(state, HUB_UPGRADE, "Hub upgrade", HUB_UPGRADE_DAYS, HUB_UPGRADE_COST)
+    return True, f"Transport hub upgrade started ({HUB_UPGRADE_DAYS} day)."
 
 
 def research_upgrade(state: GameState) -> tuple[bool, str]:
+    if active_project(state, RESEARCH):
+        return False, "Research already in progress."
     if state.cash < RESEARCH_COST:
         return False, "Insufficient cash to fund research."
-    state.cash -= RESEARCH_COST
-    state.research_level += 1
-    return True, "Research complete. Efficiency improved."
+    start_project(state, RESEARCH, "Efficiency research", RESEARCH_DAYS, RESEARCH_COST)
+    return True, f"Research started ({RESEARCH_DAYS} days)."
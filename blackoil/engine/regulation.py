@@ -1,6 +1,15 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+
+from ..models import EconomySnapshot
+from ..state import OFFSHORE, ONSHORE, REFINING, GameState
+
+# A ledger entry: (region, barrels, revenue).
+LedgerEntry = tuple[str, int, int]
 
 
 @dataclass
@@ -14,3 +23,125 @@ def apply_fiscal_terms(revenue: int, terms: FiscalTerms) -> int:
     after_royalty = revenue * (1 - terms.royalty)
     after_tax = after_royalty * (1 - terms.tax_rate)
     return int(after_tax - terms.carbon_tax)
+
+
+@dataclass(frozen=True)
+class FiscalRegime:
+    """Daily fiscal terms for one region.
+
+    ``royalty_tiers`` and ``tax_brackets`` are ``(threshold, rate)`` steps
+    starting at zero: the royalty rate rises with the barrels the region
+    has sold that day, and income tax is progressive in the day's revenue
+    after royalty and carbon tax. Carbon tax is charged per barrel.
+    """
+
+    royalty_tiers: tuple[tuple[int, float], ...]
+    tax_brackets: tuple[tuple[int, float], ...]
+    carbon_tax: float = 0.0
+
+
+FISCAL_REGIMES: dict[str, FiscalRegime] = {
+    ONSHORE: FiscalRegime(
+        royalty_tiers=((0, 0.08), (200, 0.12), (500, 0.18)),
+        tax_brackets=((0, 0.0), (1000, 0.15), (5000, 0.25), (15000, 0.35)),
+        carbon_tax=0.5,
+    ),
+    OFFSHORE: FiscalRegime(
+        royalty_tiers=((0, 0.05), (300, 0.1)),
+        tax_brackets=((0, 0.0), (2000, 0.2), (10000, 0.3)),
+        carbon_tax=0.8,
+    ),
+    REFINING: FiscalRegime(
+        royalty_tiers=((0, 0.0),),
+        tax_brackets=((0, 0.0), (1500, 0.2), (8000, 0.3)),
+        carbon_tax=0.3,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class FiscalBill:
+    royalty: int = 0
+    carbon: int = 0
+    tax: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.royalty + self.carbon + self.tax
+
+    def __add__(self, other: FiscalBill) -> FiscalBill:
+        return FiscalBill(self.royalty + other.royalty, self.carbon + other.carbon, self.tax + other.tax)
+
+
+@lru_cache(maxsize=64)
+def _schedule(steps: tuple[tuple[int, float], ...]) -> tuple[list[int], list[float], list[float]]:
+    """Thresholds, rates and the cumulative charge at each threshold."""
+    thresholds = [threshold for threshold, _rate in steps]
+    rates = [rate for _threshold, rate in steps]
+    charged = [0.0]
+    for index in range(1, len(steps)):
+        charged.append(charged[-1] + (thresholds[index] - thresholds[index - 1]) * rates[index - 1])
+    return thresholds, rates, charged
+
+
+def _charge(steps: tuple[tuple[int, float], ...], amount: float) -> float:
+    """Total charge on ``amount`` under a stepped schedule: one bisect, no loop over steps."""
+    thresholds, rates, charged = _schedule(steps)
+    index = bisect_right(thresholds, amount) - 1
+    if index < 0:
+        return 0.0
+    return charged[index] + (amount - thresholds[index]) * rates[index]
+
+
+def assess(entries: list[tuple[int, int]], regime: FiscalRegime) -> FiscalBill:
+    """Fiscal take on one region's ledger, entries in the order they were sold.
+
+    A prefix sum over barrels places every entry on the royalty tiers, so
+    an entry straddling a tier pays the blended rate for its own barrels
+    at its own price; the rest of the bill is one lookup on the totals.
+    Royalty and income tax are never negative, but barrels sold at a loss
+    still climb the royalty tiers and pay carbon tax.
+    """
+    if not entries:
+        return FiscalBill()
+    tiers = regime.royalty_tiers
+    sold = list(accumulate(barrels for barrels, _revenue in entries))
+    royalty = 0.0
+    before = 0
+    charged_before = 0.0
+    for (barrels, revenue), after in zip(entries, sold):
+        charged_after = _charge(tiers, after)
+        if barrels > 0 and revenue > 0:
+            royalty += revenue * (charged_after - charged_before) / barrels
+        before, charged_before = after, charged_after
+    carbon = before * regime.carbon_tax
+    taxable = max(0.0, sum(revenue for _barrels, revenue in entries) - royalty - carbon)
+    return FiscalBill(round(royalty), round(carbon), round(_charge(regime.tax_brackets, taxable)))
+
+
+def assess_ledger(ledger: list[LedgerEntry], regimes: dict[str, FiscalRegime] = FISCAL_REGIMES) -> FiscalBill:
+    by_region: dict[str, list[tuple[int, int]]] = {}
+    for region, barrels, revenue in ledger:
+        by_region.setdefault(region, []).append((barrels, revenue))
+    bill = FiscalBill()
+    for region, entries in by_region.items():
+        bill += assess(entries, regimes[region])
+    return bill
+
+
+def settle_fiscal(state: GameState, snapshot: EconomySnapshot) -> FiscalBill:
+    """Charge the fiscal take on everything sold since the last settlement.
+
+    Cash never goes below zero: whatever the player cannot pay is carried
+    in ``state.tax_arrears`` and collected first at the next settlement.
+    """
+    bill = assess_ledger(state.revenue_ledger) if state.revenue_ledger else FiscalBill()
+    state.revenue_ledger.clear()
+    due = bill.total + state.tax_arrears
+    if due <= 0:
+        return bill
+    paid = min(due, max(0, state.cash))
+    state.cash -= paid
+    state.tax_arrears = due - paid
+    snapshot.fiscal_cost = paid
+    return bill
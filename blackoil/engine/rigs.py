@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+
+from ..models import EconomySnapshot, Tile
+from ..state import GameState
+from .offshore import OFFSHORE_DEVELOP_COST, OffshoreBlock, offshore_blocks
+
+LAND = "land"
+RIG_FLEET: tuple[str, ...] = (LAND, LAND, "jackup", "semisub", "drillship")
+LAND_WELL_DAYS = 1
+PUMP_INSTALL_DAYS = 1
+OFFSHORE_WELL_DAYS = {"shallow": 3, "deep": 5}
+LOCAL_SEARCH_PASSES = 4
+
+WELL = "well"
+PUMP = "pump"
+BLOCK = "block"
+
+
+@dataclass(eq=False)
+class DrillJob:
+    kind: str
+    target: str
+    rig_type: str
+    duration: int
+    weight: float = 1.0
+    rig: int | None = None
+    start_day: int | None = None
+
+    @property
+    def ratio(self) -> float:
+        # Smith's rule: sequencing by duration over weight minimises the
+        # weighted sum of completion times on a single rig.
+        return self.duration / self.weight
+
+    def finish_day(self) -> int | None:
+        if self.start_day is None:
+            return None
+        return self.start_day + self.duration - 1
+
+
+@dataclass
+class RigPlanner:
+    """Assigns queued drilling jobs to a fixed rig fleet.
+
+    Jobs only run on rigs of their ``rig_type``. The plan minimises the
+    weighted sum of completion days: a greedy list schedule in Smith-rule
+    order, then a local search that moves jobs between rigs of the same
+    type while it pays. Every rig keeps its queue in Smith-rule order, so
+    the cost of inserting or removing a job is an O(1) expression over
+    per-rig prefix sums. A job that has started stays where it is.
+    """
+
+    fleet: tuple[str, ...] = RIG_FLEET
+    queues: list[list[DrillJob]] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.queues:
+            self.queues = [[] for _ in self.fleet]
+
+    @property
+    def jobs(self) -> list[DrillJob]:
+        return [job for queue in self.queues for job in queue]
+
+    def find(self, kind: str, target: str) -> DrillJob | None:
+        return next((job for job in self.jobs if job.kind == kind and job.target == target), None)
+
+    def plan(self, jobs: list[DrillJob], day: int) -> None:
+        """Rebuild the plan from scratch, keeping started jobs on their rigs."""
+        self.queues = [[] for _ in self.fleet]
+        pending = []
+        for job in jobs:
+            if job.rig is not None and _started(job, job.rig, day):
+                self.queues[job.rig].append(job)
+            else:
+                pending.append(job)
+        free = [self._free_day(rig, day) for rig in range(len(self.fleet))]
+        for job in sorted(pending, key=lambda job: job.ratio):
+            rigs = self._rigs_for(job)
+            if not rigs:
+                raise ValueError(f"No {job.rig_type} rig in the fleet.")
+            rig = min(rigs, key=lambda index: free[index])
+            self.queues[rig].append(job)
+            free[rig] = max(free[rig], day + 1) + job.duration
+        for rig_type in set(self.fleet):
+            self._improve(rig_type, day)
+        self._assign(day)
+
+    def add(self, job: DrillJob, day: int) -> None:
+        """Insert one job where it costs least, then re-plan only its rig type."""
+        rigs = self._rigs_for(job)
+        if not rigs:
+            raise ValueError(f"No {job.rig_type} rig in the fleet.")
+        best = min(rigs, key=lambda rig: self._insert_cost(rig, job, day))
+        self._insert(best, job, day)
+        self._improve(job.rig_type, day)
+        self._assign(day)
+
+    def advance(self, day: int) -> list[DrillJob]:
+        """Start what is due and pop every job finishing on ``day``."""
+        finished = []
+        for queue in self.queues:
+            while queue and queue[0].finish_day() is not None and queue[0].finish_day() <= day:
+                finished.append(queue.pop(0))
+        self._assign(day)
+        return finished
+
+    def weighted_completion(self) -> float:
+        return sum(job.weight * (job.finish_day() or 0) for job in self.jobs)
+
+    def _rigs_for(self, job: DrillJob) -> list[int]:
+        return [index for index, rig_type in enumerate(self.fleet) if rig_type == job.rig_type]
+
+    def _locked(self, rig: int, day: int) -> int:
+        queue = self.queues[rig]
+        return 1 if queue and _started(queue[0], rig, day) else 0
+
+    def _free_day(self, rig: int, day: int) -> int:
+        """First day a new job could start behind the rig's locked job."""
+        queue = self.queues[rig]
+        if self._locked(rig, day):
+            return queue[0].finish_day() + 1
+        return day + 1
+
+    def _movable(self, rig: int, day: int) -> list[DrillJob]:
+        return self.queues[rig][self._locked(rig, day) :]
+
+    def _insert(self, rig: int, job: DrillJob, day: int) -> None:
+        locked = self._locked(rig, day)
+        ratios = [other.ratio for other in self.queues[rig][locked:]]
+        self.queues[rig].insert(locked + bisect_right(ratios, job.ratio), job)
+
+    def _insert_cost(self, rig: int, job: DrillJob, day: int) -> float:
+        movable = self._movable(rig, day)
+        position = bisect_right([other.ratio for other in movable], job.ratio)
+        start = self._free_day(rig, day) + sum(other.duration for other in movable[:position])
+        after = sum(other.weight for other in movable[position:])
+        return job.weight * (start + job.duration - 1) + job.duration * after
+
+    def _improve(self, rig_type: str, day: int) -> None:
+        # Move jobs between same-type rigs while the weighted completion
+        # drops. Each candidate is priced from prefix sums in O(log n).
+        rigs = [index for index, kind in enumerate(self.fleet) if kind == rig_type]
+        if len(rigs) < 2:
+            return
+        for _ in range(LOCAL_SEARCH_PASSES):
+            improved = False
+            sums = {rig: self._prefix(rig, day) for rig in rigs}
+            for source in rigs:
+                for job in list(self._movable(source, day)):
+                    saving = self._removal_saving(sums[source], job)
+                    best_rig, best_gain = None, 0.0
+                    for target in rigs:
+                        if target == source:
+                            continue
+                        gain = saving - self._insertion_cost(sums[target], job)
+                        if gain > best_gain + 1e-9:
+                            best_rig, best_gain = target, gain
+                    if best_rig is not None:
+                        self.queues[source].remove(job)
+                        self._insert(best_rig, job, day)
+                        sums[source] = self._prefix(source, day)
+                        sums[best_rig] = self._prefix(best_rig, day)
+                        improved = True
+            if not improved:
+                break
+
+    def _prefix(self, rig: int, day: int) -> tuple[int, list[DrillJob], list[float], list[int], list[float]]:
+        movable = self._movable(rig, day)
+        ratios = [job.ratio for job in movable]
+        durations = [0]
+        weights_after = [0.0] * (len(movable) + 1)
+        for job in movable:
+            durations.append(durations[-1] + job.duration)
+        for index in range(len(movable) - 1, -1, -1):
+            weights_after[index] = weights_after[index + 1] + movable[index].weight
+        return self._free_day(rig, day), movable, ratios, durations, weights_after
+
+    @staticmethod
+    def _insertion_cost(sums, job: DrillJob) -> float:
+        free, _movable, ratios, durations, weights_after = sums
+        position = bisect_right(ratios, job.ratio)
+        finish = free + durations[position] + job.duration - 1
+        return job.weight * finish + job.duration * weights_after[position]
+
+    @staticmethod
+    def _removal_saving(sums, job: DrillJob) -> float:
+        free, movable, _ratios, durations, weights_after = sums
+        position = movable.index(job)
+        finish = free + durations[position + 1] - 1
+        return job.weight * finish + job.duration * weights_after[position + 1]
+
+    def _assign(self, day: int) -> None:
+        for rig, queue in enumerate(self.queues):
+            start = day + 1
+            for index, job in enumerate(queue):
+                if index == 0 and _started(job, rig, day):
+                    start = job.finish_day() + 1
+                    continue
+                job.rig = rig
+                job.start_day = start
+                start += job.duration
+
+
+def _started(job: DrillJob, rig: int, day: int) -> bool:
+    return job.rig == rig and job.start_day is not None and job.start_day <= day
+
+
+def rig_planner(state: GameState) -> RigPlanner:
+    """The campaign planner, rebuilt from the saved job list when missing."""
+    planner = state.rig_planner
+    if planner is None:
+        planner = state.rig_planner = RigPlanner()
+        planner.plan(state.drilling_jobs, state.day)
+    return planner
+
+
+def _tile_target(tile: Tile) -> str:
+    return f"{tile.row},{tile.col}"
+
+
+def queued_job(state: GameState, tile: Tile, kind: str = WELL) -> DrillJob | None:
+    if not state.drilling_jobs:
+        return None
+    return rig_planner(state).find(kind, _tile_target(tile))
+
+
+def queued_block(state: GameState, block: OffshoreBlock) -> DrillJob | None:
+    if not state.drilling_jobs:
+        return None
+    return rig_planner(state).find(BLOCK, block.name)
+
+
+def queue_well(state: GameState, tile: Tile) -> tuple[bool, str]:
+    if tile.owner != "player":
+        return False, "Tile not owned."
+    if tile.drilled:
+        return False, "Well already drilled."
+    if queued_job(state, tile) is not None:
+        return False, "Well already queued for a rig."
+    if state.cash < state.scenario.drill_cost:
+        return False, "Insufficient cash to drill."
+    state.cash -= state.scenario.drill_cost
+    weight = 1.0
+    if tile.survey_low is not None and tile.survey_high is not None:
+        # Surveyed prospects jump the queue in proportion to their promise.
+        weight += (tile.survey_low + tile.survey_high) / 200
+    job = DrillJob(WELL, _tile_target(tile), LAND, LAND_WELL_DAYS, weight)
+    _add_job(state, job)
+    return True, f"Well queued. {_eta(job)}"
+
+
+def queue_pump(state: GameState, tile: Tile) -> tuple[bool, str]:
+    if tile.owner != "player":
+        return False, "Tile not owned."
+    if not tile.drilled:
+        return False, "Drill the well first."
+    if tile.has_pump:
+        return False, "Pump already installed."
+    if queued_job(state, tile, PUMP) is not None:
+        return False, "Pump already queued for a rig."
+    if state.cash < state.scenario.pump_cost:
+        return False, "Insufficient cash to build pump."
+    state.cash -= state.scenario.pump_cost
+    # A pump on a proven well starts earning at once, so it outranks a wildcat.
+    job = DrillJob(PUMP, _tile_target(tile), LAND, PUMP_INSTALL_DAYS, 2.0)
+    _add_job(state, job)
+    return True, f"Pump installation queued. {_eta(job)}"
+
+
+def queue_block(state: GameState, block: OffshoreBlock) -> tuple[bool, str]:
+    if block.owner != "player":
+        return False, "Block not leased."
+    if block.developed:
+        return False, "Block already developed."
+    if queued_block(state, block) is not None:
+        return False, "Development already queued."
+    if state.cash < OFFSHORE_DEVELOP_COST:
+        return False, "Insufficient cash to develop block."
+    state.cash -= OFFSHORE_DEVELOP_COST
+    job = DrillJob(BLOCK, block.name, block.rig_requirement, OFFSHORE_WELL_DAYS[block.water_depth], 2.0)
+    _add_job(state, job)
+    return True, f"{block.name} development queued for a {block.rig_requirement}. {_eta(job)}"
+
+
+def _add_job(state: GameState, job: DrillJob) -> None:
+    planner = rig_planner(state)
+    planner.add(job, state.day)
+    state.drilling_jobs.append(job)
+
+
+def _eta(job: DrillJob) -> str:
+    return f"Rig {job.rig + 1} ({job.rig_type}), done day {job.finish_day()}."
+
+
+def campaign_lines(state: GameState) -> list[str]:
+    """One line per queued job, soonest first."""
+    jobs = sorted(state.drilling_jobs, key=lambda job: job.finish_day() or 0)
+    lines = []
+    for job in jobs:
+        if job.kind in (WELL, PUMP):
+            row, col = map(int, job.target.split(","))
+            target = f"{job.kind.capitalize()} ({row + 1}, {col + 1})"
+        else:
+            target = job.target
+        lines.append(f"- {target}: rig {job.rig + 1} ({job.rig_type}), day {job.finish_day()}")
+    return lines
+
+
+def advance_campaign(state: GameState, snapshot: EconomySnapshot) -> int:
+    """Complete every drilling job that finishes today."""
+    if not state.drilling_jobs:
+        return 0
+    finished = rig_planner(state).advance(state.day)
+    if not finished:
+        return 0
+    done = set(map(id, finished))
+    state.drilling_jobs = [job for job in state.drilling_jobs if id(job) not in done]
+    blocks = {block.name: block for block in offshore_blocks(state)}
+    for job in finished:
+        if job.kind == PUMP:
+            row, col = map(int, job.target.split(","))
+            tile = state.tile_at(row, col)
+            if tile is None or tile.has_pump:
+                continue
+            tile.pump_level = 1
+            tile.pump_age = 0
+            snapshot.events.append(f"Pump installed at ({row + 1}, {col + 1}). Production starts next day.")
+        elif job.kind == WELL:
+            row, col = map(int, job.target.split(","))
+            tile = state.tile_at(row, col)
+            if tile is None:
+                continue
+            tile.drilled = True
+            if tile.reserve <= 0:
+                snapshot.events.append(f"Dry well at ({row + 1}, {col + 1}). No oil in this tile.")
+            else:
+                snapshot.events.append(
+                    f"Drilled well at ({row + 1}, {col + 1}). Estimated reserves: {tile.reserve} barrels."
+                )
+        else:
+            block = blocks.get(job.target)
+            if block is not None:
+                block.developed = True
+                snapshot.events.append(f"Platform installed on {block.name}. Production starts next day.")
+    return len(finished)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import random
+
+from ..models import Buyer
+
+REPUTATION_WEIGHT = 0.25
+
+
+class FenwickSampler:
+    """Weighted index sampler over a Fenwick (binary indexed) tree.
+
+    Updating one weight and drawing one index are both O(log n), so large
+    populations can change a few members per draw without rebuilding.
+    """
+
+    def __init__(self, weights: list[float]) -> None:
+        self._weights: list[float] = []
+        self._tree: list[float] = []
+        self.rebuild(weights)
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    @property
+    def total(self) -> float:
+        return self._prefix(len(self._weights))
+
+    def weight(self, index: int) -> float:
+        return self._weights[index]
+
+    def rebuild(self, weights: list[float]) -> None:
+        size = len(weights)
+        self._weights = [max(0.0, float(weight)) for weight in weights]
+        tree = [0.0] * (size + 1)
+        for index, weight in enumerate(self._weights, start=1):
+            tree[index] += weight
+            parent = index + (index & -index)
+            if parent <= size:
+                tree[parent] += tree[index]
+        self._tree = tree
+
+    def update(self, index: int, weight: float) -> None:
+        weight = max(0.0, float(weight))
+        delta = weight - self._weights[index]
+        if not delta:
+            return
+        self._weights[index] = weight
+        position = index + 1
+        size = len(self._weights)
+        while position <= size:
+            self._tree[position] += delta
+            position += position & -position
+
+    def find(self, target: float) -> int:
+        """Index whose cumulative weight range contains ``target``."""
+        position = 0
+        step = 1 << len(self._weights).bit_length()
+        while step:
+            following = position + step
+            if following <= len(self._weights) and self._tree[following] <= target:
+                position = following
+                target -= self._tree[following]
+            step >>= 1
+        return min(position, len(self._weights) - 1)
+
+    def sample(self, rng: random.Random) -> int | None:
+        total = self.total
+        if total <= 0:
+            return None
+        return self.find(rng.random() * total)
+
+    def sample_distinct(self, rng: random.Random, k: int) -> list[int]:
+        picked: list[int] = []
+        removed: list[tuple[int, float]] = []
+        for _ in range(min(k, len(self._weights))):
+            index = self.sample(rng)
+            if index is None:
+                break
+            picked.append(index)
+            removed.append((index, self._weights[index]))
+            self.update(index, 0.0)
+        for index, weight in removed:
+            self.update(index, weight)
+        return picked
+
+    def _prefix(self, count: int) -> float:
+        total = 0.0
+        while count > 0:
+            total += self._tree[count]
+            count -= count & -count
+        return total
+
+
+def buyer_weight(buyer: Buyer) -> float:
+    return max(0, buyer.demand) * (1 + buyer.reputation * REPUTATION_WEIGHT)
+
+
+class BuyerSampler:
+    """Demand- and reputation-weighted sampler bound to one buyer list.
+
+    With a demand ``cap``, ``off_cap`` holds the indices of buyers whose
+    demand is not at it, kept current by ``refresh``, so daily demand
+    recovery only visits the buyers it would change.
+    """
+
+    def __init__(self, buyers: list[Buyer], cap: int | None = None) -> None:
+        self.buyers = buyers
+        self.cap = cap
+        self._positions = {id(buyer): index for index, buyer in enumerate(buyers)}
+        self._sampler = FenwickSampler([buyer_weight(buyer) for buyer in buyers])
+        self.off_cap = self._off_cap()
+
+    def matches(self, buyers: list[Buyer]) -> bool:
+        return buyers is self.buyers and len(buyers) == len(self._sampler)
+
+    def refresh(self, buyer: Buyer) -> None:
+        index = self._positions.get(id(buyer))
+        if index is not None:
+            self._sampler.update(index, buyer_weight(buyer))
+            if self.cap is not None and buyer.demand != self.cap:
+                self.off_cap.add(index)
+            else:
+                self.off_cap.discard(index)
+
+    def rebuild(self) -> None:
+        self._positions = {id(buyer): index for index, buyer in enumerate(self.buyers)}
+        self._sampler.rebuild([buyer_weight(buyer) for buyer in self.buyers])
+        self.off_cap = self._off_cap()
+
+    def _off_cap(self) -> set[int]:
+        if self.cap is None:
+            return set()
+        return {index for index, buyer in enumerate(self.buyers) if buyer.demand != self.cap}
+
+    def sample(self, rng: random.Random, k: int) -> list[Buyer]:
+        picks = self._sampler.sample_distinct(rng, k)
+        if len(picks) < k:
+            # Everyone left has zero weight; fill uniformly so offers still appear.
+            chosen = set(picks)
+            rest = [index for index in range(len(self.buyers)) if index not in chosen]
+            picks.extend(rng.sample(rest, k=min(k - len(picks), len(rest))))
+        return [self.buyers[index] for index in picks]
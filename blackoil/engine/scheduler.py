@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from ..models import Contract, EconomySnapshot
+from ..state import GameState
+
+CONTRACT_DEADLINE = "contract-deadline"
+PROJECT_COMPLETE = "project-complete"
+WELL_RESTORED = "well-restored"
+
+# Handler signature: (state, payload, snapshot). Domain modules register
+# theirs at import time so this module stays free of game rules.
+Handler = Callable[[GameState, Any, EconomySnapshot], None]
+HANDLERS: dict[str, Handler] = {}
+
+
+def on(kind: str) -> Callable[[Handler], Handler]:
+    def register(handler: Handler) -> Handler:
+        HANDLERS[kind] = handler
+        return handler
+
+    return register
+
+
+@dataclass
+class Scheduler:
+    """Day-keyed priority queue of pending game events.
+
+    Only entries due on or before the current day are touched, so long
+    running contracts, projects and downtime cost nothing on the days in
+    between. Cancelled entries are skipped lazily when they surface.
+    """
+
+    _heap: list[tuple[int, int, str, Any]] = field(default_factory=list)
+    _cancelled: set[int] = field(default_factory=set)
+    _next_id: int = 0
+
+    def __len__(self) -> int:
+        return len(self._heap) - len(self._cancelled)
+
+    def schedule(self, day: int, kind: str, payload: Any) -> int:
+        entry_id = self._next_id
+        self._next_id += 1
+        heapq.heappush(self._heap, (day, entry_id, kind, payload))
+        return entry_id
+
+    def cancel(self, entry_id: int) -> None:
+        self._cancelled.add(entry_id)
+
+    def next_day(self) -> int | None:
+        while self._heap and self._heap[0][1] in self._cancelled:
+            self._cancelled.discard(heapq.heappop(self._heap)[1])
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, day: int) -> list[tuple[str, Any]]:
+        due = []
+        while self._heap and self._heap[0][0] <= day:
+            _day, entry_id, kind, payload = heapq.heappop(self._heap)
+            if entry_id in self._cancelled:
+                self._cancelled.discard(entry_id)
+                continue
+            due.append((kind, payload))
+        return due
+
+
+def scheduler(state: GameState) -> Scheduler:
+    """The state's scheduler, rebuilt from the state itself when missing.
+
+    Everything queued is derivable from the saved game (contract due days,
+    project finish days, player wells still down), so loading a save only
+    needs to re-seed it.
+    """
+    queue = state.scheduler
+    if queue is None:
+        queue = state.scheduler = Scheduler()
+        for contract in state.contracts:
+            schedule_contract(state, contract)
+        for project in state.projects:
+            if project.finish_day is not None:
+                queue.schedule(project.finish_day, PROJECT_COMPLETE, project)
+        for tile in state.tiles:
+            if tile.owner == "player" and tile.down_until > state.day:
+                queue.schedule(tile.down_until, WELL_RESTORED, tile)
+    return queue
+
+
+def run_due(state: GameState, snapshot: EconomySnapshot) -> int:
+    """Fire every event due today; returns how many fired."""
+    due = scheduler(state).pop_due(state.day)
+    for kind, payload in due:
+        HANDLERS[kind](state, payload, snapshot)
+    return len(due)
+
+
+def schedule_contract(state: GameState, contract: Contract) -> None:
+    """Pin a contract's due day and queue its deadline.
+
+    Deadline handlers ignore contracts no longer held, so a contract queued
+    twice (signed while the scheduler is being seeded) settles once.
+    """
+    if contract.due_day is None:
+        contract.due_day = state.day + contract.days_remaining
+    scheduler(state).schedule(contract.due_day, CONTRACT_DEADLINE, contract)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import csv
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -15,7 +16,12 @@ class EventEntry:
 
 @dataclass
 class TelemetryLog:
-    entries: list[EventEntry] = field(default_factory=list)
+    entries: list[EventEntry] | deque[EventEntry] = field(default_factory=list)
+
+    @classmethod
+    def bounded(cls, limit: int) -> TelemetryLog:
+        """A log that keeps only the most recent ``limit`` entries."""
+        return cls(deque(maxlen=limit))
 
     def add(self, day: int, category: str, message: str, amount: int | None = None) -> None:
         self.entries.append(EventEntry(day=day, category=category, message=message, amount=amount))
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+from ..models import Contract
+from ..state import CONTRACT_PENALTY, GameState
+from .decline import decline_cache
+from .events import incident_table
+from .forecast import simulate_paths
+from .logistics import ROAD_COST, tile_route
+
+VALUATION_PATHS = 400
+
+
+@dataclass(frozen=True)
+class ContractValuation:
+    contract: Contract
+    expected_revenue: float
+    penalty_probability: float
+    expected_shortfall: float
+    spot_value: float
+
+    @property
+    def expected_value(self) -> float:
+        return self.expected_revenue - self.penalty_probability * CONTRACT_PENALTY
+
+    @property
+    def premium(self) -> float:
+        """Expected value over selling the same barrels at the simulated spot price."""
+        return self.expected_value - self.spot_value
+
+    def summary(self) -> str:
+        return (
+            f"EV ${self.expected_value:,.0f} ({self.premium:+,.0f} vs spot), "
+            f"penalty risk {self.penalty_probability:.0%}"
+        )
+
+
+def value_offers(
+    state: GameState,
+    offers: list[Contract],
+    paths: int = VALUATION_PATHS,
+    seed: int | None = None,
+) -> list[ContractValuation]:
+    """Score contract offers against simulated production and price paths.
+
+    Each path draws well downtime from the incident table, then replays
+    the day loop's delivery order: produce, serve signed contracts, serve
+    the offer, auto-refine. All offers share the same random draws so they
+    are compared on identical futures.
+    """
+    if not offers:
+        return []
+    if seed is None:
+        seed = state.map_seed + state.day
+    horizon = max(offer.days_remaining for offer in offers)
+    prices = simulate_paths(state, horizon=horizon, paths=paths, seed=seed).oil
+    wells = [tile for tile in state.tiles if tile.owner == "player"]
+    downtime = _sample_downtime(state, wells, horizon, paths, seed)
+    return [_value_offer(state, offer, wells, downtime, prices) for offer in offers]
+
+
+def value_contract(
+    state: GameState,
+    contract: Contract,
+    paths: int = VALUATION_PATHS,
+    seed: int | None = None,
+) -> ContractValuation:
+    return value_offers(state, [contract], paths, seed)[0]
+
+
+def _sample_downtime(
+    state: GameState, wells: list, horizon: int, paths: int, seed: int
+) -> list[list[frozenset[int]]]:
+    """Per path and day, the indices of wells that produce nothing."""
+    rng = random.Random(seed ^ 0x5F3759DF)
+    roll = rng.random
+    table = incident_table(state.scenario.incident_rate)
+    total = table.total
+    pumped = [index for index, tile in enumerate(wells) if tile.has_pump]
+    # Offsets are relative to tomorrow, the first simulated day.
+    already_down = {index: wells[index].down_until - state.day - 1 for index in pumped}
+
+    result = []
+    for _ in range(paths):
+        down_until = dict(already_down)
+        days = []
+        for day in range(horizon):
+            down = set()
+            for index in pumped:
+                if down_until[index] > day:
+                    down.add(index)
+                    continue
+                value = roll()
+                if value < total:
+                    down_until[index] = day + table.pick(value).downtime_days
+                    down.add(index)
+            days.append(frozenset(down))
+        result.append(days)
+    return result
+
+
+def _value_offer(
+    state: GameState,
+    offer: Contract,
+    wells: list,
+    downtime: list[list[frozenset[int]]],
+    prices: tuple[tuple[int, ...], ...],
+) -> ContractValuation:
+    bonus = 1 + state.transport_hub.delivery_bonus
+    # Deliveries come from the producing wells, so price them at those wells' routes.
+    routes = [tile_route(state, tile)[1] for tile in wells if tile.has_pump]
+    freight = sum(routes) / len(routes) if routes else ROAD_COST
+    refine_capacity = state.refinery.capacity if state.refinery.active and state.auto_refine else 0
+    signed = [(contract.remaining, contract.days_left(state.day)) for contract in state.contracts]
+    paths = len(downtime)
+    schedules = decline_cache(state)
+    rates = [schedules.projected(tile, offer.days_remaining) for tile in wells]
+
+    revenue_total = 0.0
+    spot_total = 0.0
+    shortfall_total = 0
+    penalties = 0
+    for path, days in enumerate(downtime):
+        reserve = [tile.reserve for tile in wells]
+        storage = [tile.storage for tile in wells]
+        outstanding = [remaining for remaining, _days in signed]
+        remaining = offer.volume
+        for day in range(offer.days_remaining):
+            down = days[day]
+            for index, tile in enumerate(wells):
+                if not tile.has_pump or index in down or reserve[index] <= 0:
+                    continue
+                output = min(rates[index][day], reserve[index], tile.capacity - storage[index])
+                if output > 0:
+                    reserve[index] -= output
+                    storage[index] += output
+            available = sum(storage)
+            for slot, (_volume, days_left) in enumerate(signed):
+                if day < days_left and outstanding[slot] > 0:
+                    delivered = min(outstanding[slot], available)
+                    outstanding[slot] -= delivered
+                    available -= delivered
+            delivered = min(remaining, available)
+            remaining -= delivered
+            revenue_total += int(delivered * offer.price * bonus) - round(delivered * freight)
+            spot_total += delivered * prices[day][path]
+            available -= delivered
+            available -= min(available, refine_capacity)
+            _withdraw(storage, sum(storage) - available)
+        if remaining > 0:
+            penalties += 1
+            shortfall_total += remaining
+
+    return ContractValuation(
+        contract=offer,
+        expected_revenue=revenue_total / paths,
+        penalty_probability=penalties / paths,
+        expected_shortfall=shortfall_total / paths,
+        spot_value=spot_total / paths,
+    )
+
+
+def _withdraw(storage: list[int], amount: int) -> None:
+    # Same tile order as economy.withdraw_oil.
+    for index, held in enumerate(storage):
+        if amount <= 0:
+            break
+        taken = min(held, amount)
+        storage[index] -= taken
+        amount -= taken
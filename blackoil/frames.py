@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable
+
+BASE_FRAME_MS = 180
+UNFOCUSED_FACTOR = 3
+IDLE_FACTOR = 2
+IDLE_AFTER_SECONDS = 30.0
+MAX_FRAME_MS = 1000
+DRAW_BUDGET = 0.25
+
+
+@dataclass
+class FrameStats:
+    fps: float = 0.0
+    frame_ms: float = 0.0
+    interval_ms: int = BASE_FRAME_MS
+    frames: int = 0
+    skipped: int = 0
+
+    def overlay_text(self) -> str:
+        return f"{self.fps:4.1f} fps | draw {self.frame_ms:5.1f} ms | every {self.interval_ms} ms"
+
+
+class FrameScheduler:
+    """Drives map redraws with a single pending timer.
+
+    Animation frames run at ``BASE_FRAME_MS`` while something animates,
+    slow down when the window is unfocused, the player is idle, or drawing
+    is expensive, and stop entirely when the window is hidden or nothing
+    moves. ``request_redraw`` calls made between frames collapse into one.
+    """
+
+    def __init__(
+        self,
+        after: Callable[[int, Callable[[], None]], object],
+        after_cancel: Callable[[object], None],
+        draw: Callable[[], None],
+        is_animating: Callable[[], bool],
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._after = after
+        self._after_cancel = after_cancel
+        self._draw = draw
+        self._is_animating = is_animating
+        self._clock = clock
+        self._pending: object | None = None
+        self._pending_due = 0.0
+        self._dirty = False
+        self._visible = True
+        self._focused = True
+        self._last_input = clock()
+        self._frame_times: deque[float] = deque(maxlen=32)
+        self._draw_cost_ms = 0.0
+        self.stats = FrameStats()
+
+    def start(self) -> None:
+        self.request_redraw()
+
+    def stop(self) -> None:
+        if self._pending is not None:
+            self._after_cancel(self._pending)
+            self._pending = None
+
+    def set_visible(self, visible: bool) -> None:
+        self._visible = visible
+        if visible:
+            self.request_redraw()
+        else:
+            self.stop()
+
+    def set_focused(self, focused: bool) -> None:
+        self._focused = focused
+        if focused:
+            self.notify_input()
+
+    def notify_input(self) -> None:
+        self._last_input = self._clock()
+
+    def request_redraw(self) -> None:
+        self._dirty = True
+        if not self._visible:
+            return
+        self._schedule(0)
+
+    def frame_interval(self) -> int:
+        interval = BASE_FRAME_MS
+        if not self._focused:
+            interval *= UNFOCUSED_FACTOR
+        if self._clock() - self._last_input > IDLE_AFTER_SECONDS:
+            interval *= IDLE_FACTOR
+        # Keep drawing under DRAW_BUDGET of the frame so input stays responsive.
+        interval = max(interval, int(self._draw_cost_ms / DRAW_BUDGET))
+        return min(MAX_FRAME_MS, interval)
+
+    def _schedule(self, delay_ms: int) -> None:
+        due = self._clock() + delay_ms / 1000
+        if self._pending is not None:
+            if self._pending_due <= due:
+                self.stats.skipped += 1
+                return
+            self._after_cancel(self._pending)
+        self._pending_due = due
+        self._pending = self._after(delay_ms, self._run_frame)
+
+    def _run_frame(self) -> None:
+        self._pending = None
+        if not self._visible:
+            return
+        animating = self._is_animating()
+        if self._dirty or animating:
+            started = self._clock()
+            self._draw()
+            finished = self._clock()
+            self._dirty = False
+            self._record(started, finished)
+        if animating:
+            self._schedule(self.frame_interval())
+
+    def _record(self, started: float, finished: float) -> None:
+        cost = (finished - started) * 1000
+        self._draw_cost_ms = cost if not self.stats.frames else self._draw_cost_ms * 0.8 + cost * 0.2
+        self._frame_times.append(finished)
+        self.stats.frames += 1
+        self.stats.frame_ms = self._draw_cost_ms
+        self.stats.interval_ms = self.frame_interval()
+        if len(self._frame_times) > 1:
+            span = self._frame_times[-1] - self._frame_times[0]
+            self.stats.fps = (len(self._frame_times) - 1) / span if span > 0 else 0.0
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+
+from . import economy
+from .engine import ai
+from .engine.outlook import WellOutlook, well_outlooks
+from .models import EconomySnapshot, Scenario
+from .state import SCENARIOS, GameState, new_game_state
+from .viewmodel import net_assets, storage_by_owner
+
+
+@dataclass
+class RunResult:
+    state: GameState
+    days: int
+    snapshots: list[EconomySnapshot] = field(default_factory=list)
+
+    @property
+    def production(self) -> int:
+        return sum(snapshot.production for snapshot in self.snapshots)
+
+    @property
+    def net_assets(self) -> int:
+        return net_assets(self.state, storage_by_owner(self.state).get("player", 0))
+
+
+def find_scenario(name: str | None) -> Scenario:
+    if name is None:
+        return SCENARIOS[0]
+    for scenario in SCENARIOS:
+        if scenario.name.lower() == name.lower():
+            return scenario
+    raise ValueError(f"Unknown scenario: {name}")
+
+
+def well_forecasts(state: GameState, owner: str = "player") -> dict[tuple[int, int], WellOutlook]:
+    """Depletion, storage-full and season-end projections for an owner's pumped wells."""
+    return well_outlooks(state, owner)
+
+
+def step_day(state: GameState) -> EconomySnapshot:
+    state.day += 1
+    snapshot = economy.advance_day(state)
+    snapshot.events.extend(ai.competitor_turns(state))
+    state.release_idle_tiles()
+    state.touch()
+    return snapshot
+
+
+def run_season(
+    scenario: Scenario,
+    days: int | None = None,
+    seed: int | None = None,
+    state: GameState | None = None,
+) -> RunResult:
+    if seed is not None:
+        random.seed(seed)
+    if state is None:
+        state = new_game_state(scenario)
+    limit = state.scenario.max_days if days is None else min(state.scenario.max_days, state.day + days)
+    result = RunResult(state=state, days=0)
+    while state.day < limit:
+        result.snapshots.append(step_day(state))
+        result.days += 1
+    return result
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+from .models import Tile
+from .state import GameState
+
+HEATMAP_MODES = {
+    "reserve": "Reserves",
+    "survey": "Survey Range",
+    "storage": "Storage Fill",
+    "owner": "Ownership",
+}
+UNKNOWN_COLOR = "#1e293b"
+PLAYER_COLOR = "#22c55e"
+HEAT_STOPS = [
+    (0.0, (15, 23, 42)),
+    (0.25, (30, 64, 175)),
+    (0.5, (13, 148, 136)),
+    (0.75, (234, 179, 8)),
+    (1.0, (220, 38, 38)),
+]
+
+
+def heat_color(value: float) -> str:
+    value = max(0.0, min(1.0, value))
+    for (low, low_rgb), (high, high_rgb) in zip(HEAT_STOPS, HEAT_STOPS[1:]):
+        if value <= high:
+            t = (value - low) / (high - low)
+            r, g, b = (int(a + (b - a) * t) for a, b in zip(low_rgb, high_rgb))
+            return f"#{r:02x}{g:02x}{b:02x}"
+    return "#{:02x}{:02x}{:02x}".format(*HEAT_STOPS[-1][1])
+
+
+HEAT_LEVELS = 256
+HEAT_PALETTE = [heat_color(level / (HEAT_LEVELS - 1)) for level in range(HEAT_LEVELS)]
+
+
+def _reserve_value(tile: Tile, reveal: bool) -> int | None:
+    if reveal or tile.drilled:
+        return max(0, tile.reserve)
+    if tile.survey_low is not None and tile.survey_high is not None:
+        return (tile.survey_low + tile.survey_high) // 2
+    return None
+
+
+def _survey_value(tile: Tile, reveal: bool) -> int | None:
+    if tile.survey_low is None or tile.survey_high is None:
+        return None
+    return tile.survey_high - tile.survey_low
+
+
+def _storage_value(tile: Tile, reveal: bool) -> float | None:
+    return tile.storage / tile.capacity if tile.owner is not None and tile.capacity else None
+
+
+def _owner_value(tile: Tile, reveal: bool) -> str | None:
+    return tile.owner
+
+
+TILE_VALUES: dict[str, Callable[[Tile, bool], object]] = {
+    "reserve": _reserve_value,
+    "survey": _survey_value,
+    "storage": _storage_value,
+    "owner": _owner_value,
+}
+
+
+def tile_values(state: GameState, mode: str, reveal: bool = False) -> tuple:
+    """Raw per-tile values in row-major order; ``None`` marks unknown tiles.
+
+    Values are placed by each tile's ``(row, col)``, not by its position
+    in ``state.tiles``, so a chunked map that holds only part of the grid
+    leaves the rest unknown. Reserves are only shown where the player
+    could know them (drilled or surveyed) unless ``reveal`` is set for
+    analysis runs.
+    """
+    value = TILE_VALUES.get(mode)
+    if value is None:
+        raise ValueError(f"Unknown heatmap mode: {mode}")
+    size = state.scenario.grid_size
+    values: list = [None] * (size * size)
+    for tile in state.tiles:
+        values[tile.row * size + tile.col] = value(tile, reveal)
+    return tuple(values)
+
+
+def tile_colors(state: GameState, mode: str, values: tuple) -> list[str]:
+    if mode == "owner":
+        palette = {competitor.name: competitor.color for competitor in state.competitors}
+        palette["player"] = PLAYER_COLOR
+        return [palette.get(owner, UNKNOWN_COLOR) if owner else UNKNOWN_COLOR for owner in values]
+    if mode == "storage":
+        scale = 1.0
+    else:
+        scale = max((value for value in values if value is not None), default=0) or 1
+    top = HEAT_LEVELS - 1
+    factor = top / scale
+    return [
+        UNKNOWN_COLOR if value is None else HEAT_PALETTE[min(top, int(value * factor))]
+        for value in values
+    ]
+
+
+def image_data(colors: list[str], size: int) -> str:
+    """Encode row-major colours as Tk PhotoImage ``put`` data, one pixel per tile."""
+    rows = []
+    for row in range(size):
+        rows.append("{" + " ".join(colors[row * size : (row + 1) * size]) + "}")
+    return " ".join(rows)
+
+
+@dataclass
+class HeatmapLayer:
+    mode: str
+    size: int
+    data: str
+    version: int
+
+
+class HeatmapCache:
+    """Rebuilds a heatmap layer only when the tiles behind it change.
+
+    The state revision is a cheap first check; when it moves, the raw tile
+    values are compared so unrelated changes (cash, prices) keep the layer.
+    ``version`` increments whenever ``data`` changes so renderers can keep
+    their own scaled images.
+    """
+
+    def __init__(self) -> None:
+        self._state: GameState | None = None
+        self._key: tuple | None = None
+        self._values: tuple | None = None
+        self._layer: HeatmapLayer | None = None
+        self._version = 0
+
+    def layer(self, state: GameState, mode: str, reveal: bool = False) -> HeatmapLayer:
+        key = (state.revision, mode, reveal)
+        if self._layer is not None and self._state is state and self._key == key:
+            return self._layer
+        values = tile_values(state, mode, reveal)
+        size = state.scenario.grid_size
+        if self._layer is None or self._layer.mode != mode or self._layer.size != size or values != self._values:
+            self._version += 1
+            colors = tile_colors(state, mode, values)
+            self._layer = HeatmapLayer(mode=mode, size=size, data=image_data(colors, size), version=self._version)
+            self._values = values
+        self._state = state
+        self._key = key
+        return self._layer
@@ -18,6 +18,8 @@ class Scenario:
     price_max: int
     event_chance: float
     theme: str
+    # Multiplier on every incident chance in ``engine.events.INCIDENT_TYPES``.
+    incident_rate: float = 1.0
 
 
 @dataclass
@@ -33,6 +35,8 @@ class Tile:
     capacity: int = 20
     survey_low: int | None = None
     survey_high: int | None = None
+    pump_age: int = 0
+    down_until: int = 0
 
     @property
     def depleted(self) -> bool:
@@ -72,11 +76,18 @@ class Contract:
     price: int
     days_remaining: int
     delivered: int = 0
+    due_day: int | None = None
 
     @property
     def remaining(self) -> int:
         return max(0, self.volume - self.delivered)
 
+    def days_left(self, day: int) -> int:
+        """Days until the deadline; offers not yet signed count from today."""
+        if self.due_day is None:
+            return self.days_remaining
+        return max(0, self.due_day - day)
+
 
 @dataclass
 class Refinery:
@@ -125,4 +136,5 @@ class EconomySnapshot:
     contract_delivered: int = 0
     maintenance_cost: int = 0
     interest_cost: int = 0
+    fiscal_cost: int = 0
     events: list[str] = field(default_factory=list)
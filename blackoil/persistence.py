@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 import json
+from dataclasses import replace
 from pathlib import Path
 
+from .engine.decline import decline_cache
+from .engine.market import order_book
+from .engine.offshore import OffshoreBlock
+from .engine.projects import Project
+from .engine.rigs import DrillJob
 from .models import Buyer, Competitor, Contract, Refinery, TransportHub
 from .state import (
     BASE_DEMAND,
@@ -17,6 +23,7 @@ from .state import (
     create_tiles,
 )
 from .state import GameState
+from .world import EAGER_TILE_LIMIT, ChunkedTiles
 
 SAVE_VERSION = 2
 
@@ -47,7 +54,10 @@ def save_game(state: GameState, path: str | Path) -> None:
         "market_supply": state.market_supply,
         "market_demand": state.market_demand,
         "last_day_production": state.last_day_production,
+        "sales_today": state.sales_today,
+        "interference": state.interference,
         "map_seed": state.map_seed,
+        "grid_size": state.scenario.grid_size,
         "decorations": state.decorations,
         "tiles": [
             {
@@ -62,8 +72,10 @@ def save_game(state: GameState, path: str | Path) -> None:
                 "capacity": tile.capacity,
                 "survey_low": tile.survey_low,
                 "survey_high": tile.survey_high,
+                "pump_age": tile.pump_age,
+                "down_until": tile.down_until,
             }
-            for tile in state.tiles
+            for tile in (state.tiles.touched_tiles() if state.chunked else state.tiles)
         ],
         "competitors": [
             {
@@ -82,7 +94,8 @@ def save_game(state: GameState, path: str | Path) -> None:
                 "name": contract.name,
                 "volume": contract.volume,
                 "price": contract.price,
-                "days_remaining": contract.days_remaining,
+                "days_remaining": contract.days_left(state.day),
+                "due_day": contract.due_day,
                 "delivered": contract.delivered,
             }
             for contract in state.contracts
@@ -97,6 +110,59 @@ def save_game(state: GameState, path: str | Path) -> None:
             }
             for buyer in state.buyers
         ],
+        "sea_state": state.sea_state,
+        "offshore_blocks": [
+            {
+                "name": block.name,
+                "water_depth": block.water_depth,
+                "metocean_severity": block.metocean_severity,
+                "rig_requirement": block.rig_requirement,
+                "reserve": block.reserve,
+                "output_rate": block.output_rate,
+                "owner": block.owner,
+                "developed": block.developed,
+            }
+            for block in state.offshore_blocks
+        ],
+        "projects": [
+            {
+                "name": project.name,
+                "kind": project.kind,
+                "duration_days": project.duration_days,
+                "finish_day": project.finish_day,
+                "cost": project.cost,
+            }
+            for project in state.projects
+        ],
+        "pipelines": [list(segment) for segment in state.pipelines],
+        "decline": state.decline.export(state) if state.decline is not None else [],
+        "revenue_ledger": [list(entry) for entry in state.revenue_ledger],
+        "tax_arrears": state.tax_arrears,
+        "drilling_jobs": [
+            {
+                "kind": job.kind,
+                "target": job.target,
+                "rig_type": job.rig_type,
+                "duration": job.duration,
+                "weight": job.weight,
+                "rig": job.rig,
+                "start_day": job.start_day,
+            }
+            for job in state.drilling_jobs
+        ],
+        "orders": [
+            {
+                "commodity": commodity,
+                "side": order.side,
+                "owner": order.owner,
+                "volume": order.remaining,
+                "price": order.price,
+                "expires_day": order.expires_day,
+            }
+            for commodity, book in state.order_books.items()
+            for order in book.orders()
+            if order.is_open(state.day)
+        ],
     }
     Path(path).write_text(json.dumps(data, indent=2), encoding="utf-8")
 
@@ -112,14 +178,21 @@ def load_game(path: str | Path) -> GameState:
     if map_seed is None:
         map_seed = __import__("random").randint(1000, 9999)
 
+    grid_size = data.get("grid_size", scenario.grid_size)
+    if grid_size != scenario.grid_size:
+        scenario = replace(scenario, grid_size=grid_size)
+
     tiles_data = data.get("tiles")
-    if tiles_data:
+    if tiles_data and scenario.grid_size**2 <= EAGER_TILE_LIMIT:
         tiles = [
             _tile_from_dict(item)
             for item in tiles_data
         ]
     else:
         tiles = create_tiles(scenario, map_seed)
+        if isinstance(tiles, ChunkedTiles):
+            # Only touched tiles are saved; the rest regenerate from the seed.
+            tiles.restore(_tile_from_dict(item) for item in tiles_data or ())
 
     competitors_data = data.get("competitors")
     if competitors_data:
@@ -145,6 +218,7 @@ def load_game(path: str | Path) -> GameState:
             price=item["price"],
             days_remaining=item["days_remaining"],
             delivered=item.get("delivered", 0),
+            due_day=item.get("due_day", data.get("day", 1) + item["days_remaining"]),
         )
         for item in data.get("contracts", [])
     ]
@@ -204,7 +278,31 @@ def load_game(path: str | Path) -> GameState:
         last_day_production=data.get("last_day_production", 0),
         map_seed=map_seed,
         decorations=data.get("decorations") or create_decorations(map_seed, scenario.grid_size),
+        sales_today=data.get("sales_today", {}),
+        sea_state=data.get("sea_state", 0.0),
+        offshore_blocks=[OffshoreBlock(**item) for item in data.get("offshore_blocks", [])],
+        projects=[
+            Project(
+                name=item["name"],
+                duration_days=item["duration_days"],
+                remaining_days=max(0, item["finish_day"] - data.get("day", 1)),
+                cost=item["cost"],
+                status="active",
+                kind=item["kind"],
+                finish_day=item["finish_day"],
+            )
+            for item in data.get("projects", [])
+        ],
+        drilling_jobs=[DrillJob(**item) for item in data.get("drilling_jobs", [])],
+        pipelines=[tuple(segment) for segment in data.get("pipelines", [])],
+        revenue_ledger=[tuple(entry) for entry in data.get("revenue_ledger", [])],
+        tax_arrears=data.get("tax_arrears", 0),
+        interference=data.get("interference", False),
     )
+    decline_cache(state).restore(data.get("decline", []))
+    for item in data.get("orders", []):
+        book = order_book(state, item["commodity"])
+        book.post(item["side"], item["owner"], item["volume"], item["price"], item["expires_day"])
     return state
 
 
@@ -223,4 +321,6 @@ def _tile_from_dict(item: dict) -> "Tile":
         capacity=item.get("capacity", 20),
         survey_low=item.get("survey_low"),
         survey_high=item.get("survey_high"),
+        pump_age=item.get("pump_age", 0),
+        down_until=item.get("down_until", 0),
     )
@@ -1,11 +1,30 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING
 
 from .models import Buyer, Competitor, Contract, Refinery, Scenario, Tile, TransportHub
+from .world import EAGER_TILE_LIMIT, ChunkedTiles
+from .worldgen import tile_fields
+
+if TYPE_CHECKING:
+    from .engine.decline import DeclineCache
+    from .engine.logistics import TransportNetwork
+    from .engine.market import BidQueue
+    from .engine.orderbook import OrderBook
+    from .engine.offshore import OffshoreBlock
+    from .engine.outlook import OutlookCache
+    from .engine.pipelines import PipelineGraph
+    from .engine.projects import Project
+    from .engine.rigs import DrillJob, RigPlanner
+    from .engine.scheduler import Scheduler
+    from .engine.sampling import BuyerSampler
 
 OIL_PER_DAY_MIN = 6
 OIL_PER_DAY_MAX = 22
+TILE_RESERVE_MAX = 170
 MAX_PUMP_LEVEL = 3
 SURVEY_COST = 350
 PUMP_UPGRADE_COST = 700
@@ -13,6 +32,10 @@ STORAGE_EXPANSION = 15
 LOAN_CHUNK = 2000
 DEFAULT_LOAN_LIMIT = 6000
 DEFAULT_LOAN_RATE = 0.06
+# Fiscal regions for the revenue ledger.
+ONSHORE = "onshore"
+OFFSHORE = "offshore"
+REFINING = "refining"
 RESEARCH_COST = 500
 MAINTENANCE_COST = 120
 CONTRACT_PENALTY = 250
@@ -31,7 +54,15 @@ MARKET_IMPACT = 0.35
 TRADE_MIN_VOLUME = 20
 TRADE_MAX_VOLUME = 120
 REPUTATION_MAX = 5
+ORDER_EXPIRY_DAYS = 2
+# The built-in scenarios run incidents at a fifth of the engine's odds: at
+# the full 10% a well-day every well, rivals included, loses about 15% of
+# its output, more than its decline curve takes over a whole season.
+SCENARIO_INCIDENT_RATE = 0.2
 MAP_PIXEL_SIZE = 560
+DECORATION_LIMIT = 3000
+NEIGHBOR_OFFSETS = ((-1, 0), (0, -1), (0, 1), (1, 0))
+NEIGHBOR_OFFSETS_DIAGONAL = NEIGHBOR_OFFSETS + ((-1, -1), (-1, 1), (1, -1), (1, 1))
 
 SCENARIOS = [
     Scenario(
@@ -48,6 +79,7 @@ SCENARIOS = [
         price_max=120,
         event_chance=0.35,
         theme="prairie",
+        incident_rate=SCENARIO_INCIDENT_RATE,
     ),
     Scenario(
         name="Desert Wildcat",
@@ -63,6 +95,7 @@ SCENARIOS = [
         price_max=150,
         event_chance=0.4,
         theme="desert",
+        incident_rate=SCENARIO_INCIDENT_RATE,
     ),
     Scenario(
         name="Coastal Rush",
@@ -78,6 +111,7 @@ SCENARIOS = [
         price_max=110,
         event_chance=0.32,
         theme="coastal",
+        incident_rate=SCENARIO_INCIDENT_RATE,
     ),
 ]
 
@@ -91,7 +125,7 @@ class GameState:
     petrol_price: int
     event_message: str
     news_message: str
-    tiles: list[Tile]
+    tiles: list[Tile] | ChunkedTiles
     competitors: list[Competitor]
     contracts: list[Contract]
     buyers: list[Buyer]
@@ -113,6 +147,67 @@ class GameState:
     last_day_production: int
     map_seed: int
     decorations: list[tuple[int, int, int, str]]
+    order_books: dict[str, OrderBook] = field(default_factory=dict)
+    buyer_sampler: BuyerSampler | None = field(default=None, repr=False, compare=False)
+    bid_queues: dict[str, BidQueue] | None = field(default=None, repr=False, compare=False)
+    decline: DeclineCache | None = field(default=None, repr=False, compare=False)
+    outlooks: OutlookCache | None = field(default=None, repr=False, compare=False)
+    scheduler: Scheduler | None = field(default=None, repr=False, compare=False)
+    rig_planner: RigPlanner | None = field(default=None, repr=False, compare=False)
+    transport: TransportNetwork | None = field(default=None, repr=False, compare=False)
+    pipeline_graph: PipelineGraph | None = field(default=None, repr=False, compare=False)
+    sales_today: dict[str, int] = field(default_factory=dict)
+    projects: list[Project] = field(default_factory=list)
+    drilling_jobs: list[DrillJob] = field(default_factory=list)
+    pipelines: list[tuple[int, int, int, int]] = field(default_factory=list)
+    revenue_ledger: list[tuple[str, int, int]] = field(default_factory=list)
+    tax_arrears: int = 0
+    offshore_blocks: list[OffshoreBlock] = field(default_factory=list)
+    sea_state: float = 0.0
+    interference: bool = False
+    revision: int = 0
+    _tile_index: dict[tuple[int, int], Tile] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _tile_index_source: list[Tile] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def touch(self) -> None:
+        self.revision += 1
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        size = self.scenario.grid_size
+        return 0 <= row < size and 0 <= col < size
+
+    @property
+    def chunked(self) -> bool:
+        return isinstance(self.tiles, ChunkedTiles)
+
+    def release_idle_tiles(self) -> None:
+        if isinstance(self.tiles, ChunkedTiles):
+            self.tiles.release_idle()
+
+    def tile_at(self, row: int, col: int) -> Tile | None:
+        if isinstance(self.tiles, ChunkedTiles):
+            return self.tiles.tile_at(row, col)
+        if not self.in_bounds(row, col):
+            return None
+        index = row * self.scenario.grid_size + col
+        if index < len(self.tiles):
+            tile = self.tiles[index]
+            if tile.row == row and tile.col == col:
+                return tile
+        # Tiles loaded out of row-major order fall back to a coordinate map.
+        if self._tile_index_source is not self.tiles or len(self._tile_index) != len(self.tiles):
+            self._tile_index = {(tile.row, tile.col): tile for tile in self.tiles}
+            self._tile_index_source = self.tiles
+        return self._tile_index.get((row, col))
+
+    def neighbors(self, tile: Tile, diagonal: bool = False) -> Iterator[Tile]:
+        offsets = NEIGHBOR_OFFSETS_DIAGONAL if diagonal else NEIGHBOR_OFFSETS
+        for d_row, d_col in offsets:
+            neighbor = self.tile_at(tile.row + d_row, tile.col + d_col)
+            if neighbor is not None:
+                yield neighbor
 
 
 def create_competitors() -> list[Competitor]:
@@ -133,27 +228,31 @@ def create_buyers() -> list[Buyer]:
     ]
 
 
-def create_tiles(scenario: Scenario, rng_seed: int) -> list[Tile]:
-    tiles: list[Tile] = []
-    rng = __import__("random").Random(rng_seed)
-    for row in range(scenario.grid_size):
-        for col in range(scenario.grid_size):
-            reserve = rng.randint(0, 170)
-            tiles.append(
-                Tile(
-                    row=row,
-                    col=col,
-                    reserve=reserve,
-                    output_rate=rng.randint(OIL_PER_DAY_MIN, OIL_PER_DAY_MAX),
-                )
-            )
-    return tiles
+def create_tiles(scenario: Scenario, rng_seed: int) -> list[Tile] | ChunkedTiles:
+    size = scenario.grid_size
+    if size * size > EAGER_TILE_LIMIT:
+        return ChunkedTiles(size, partial(_build_tiles, size, rng_seed))
+    return _build_tiles(size, rng_seed, 0, 0, size, size)
+
+
+def _build_tiles(size: int, rng_seed: int, row: int, col: int, height: int, width: int) -> list[Tile]:
+    reserves, rates = tile_fields(size, rng_seed, (row, col, height, width))
+    rate_span = OIL_PER_DAY_MAX - OIL_PER_DAY_MIN
+    return [
+        Tile(
+            row=row + index // width,
+            col=col + index % width,
+            reserve=round(reserve * TILE_RESERVE_MAX),
+            output_rate=OIL_PER_DAY_MIN + round(rate * rate_span),
+        )
+        for index, (reserve, rate) in enumerate(zip(reserves, rates))
+    ]
 
 
 def create_decorations(seed: int, grid_size: int) -> list[tuple[int, int, int, str]]:
     rng = __import__("random").Random(seed)
     decorations = []
-    for _ in range(grid_size * grid_size * 3):
+    for _ in range(min(grid_size * grid_size * 3, DECORATION_LIMIT)):
         x = rng.randint(0, 599)
         y = rng.randint(0, 599)
         size = rng.randint(4, 12)
@@ -235,6 +334,7 @@ def build_pump(state: GameState, tile: Tile) -> bool:
     if tile.owner != "player" or state.cash < state.scenario.pump_cost:
         return False
     tile.pump_level = 1
+    tile.pump_age = 0
     state.cash -= state.scenario.pump_cost
     return True
 
@@ -245,6 +345,7 @@ def upgrade_pump(state: GameState, tile: Tile) -> bool:
     if state.cash < PUMP_UPGRADE_COST:
         return False
     tile.pump_level += 1
+    tile.pump_age = 0
     state.cash -= PUMP_UPGRADE_COST
     return True
 
@@ -321,11 +422,29 @@ def repay_loan(state: GameState) -> int:
     return amount
 
 
+def record_sale(state: GameState, seller: str, volume: int) -> None:
+    """Log crude that reached buyers today; the daily clearing turns it into market supply."""
+    if volume > 0:
+        state.sales_today[seller] = state.sales_today.get(seller, 0) + volume
+
+
+def record_revenue(state: GameState, region: str, barrels: int, revenue: int) -> None:
+    """Post a player sale to the revenue ledger; fiscal terms are settled on it once a day.
+
+    Sales that net nothing after freight are still posted: their barrels
+    count toward carbon tax and the royalty tiers.
+    """
+    if barrels > 0:
+        state.revenue_ledger.append((region, barrels, revenue))
+
+
 def sell_oil(state: GameState, volume: int, price: int) -> int:
     if volume <= 0:
         return 0
     revenue = volume * price
     state.cash += revenue
+    record_sale(state, "player", volume)
+    record_revenue(state, ONSHORE, volume, revenue)
     return revenue
 
 
@@ -335,23 +454,34 @@ def sell_petrol(state: GameState, volume: int, price: int) -> int:
     revenue = volume * price
     state.cash += revenue
     state.petrol_storage -= volume
+    record_revenue(state, REFINING, volume, revenue)
     return revenue
 
 
 def sign_contract(state: GameState, contract: Contract, volume: int) -> Contract:
-    contract.volume = volume
-    state.contracts.append(contract)
-    return contract
+    """Sign ``contract`` and queue its deadline from today; see ``engine.market.sign_contract``."""
+    # Imported here: the engine modules import this one.
+    from .engine.market import sign_contract as sign_and_schedule
 
+    return sign_and_schedule(state, contract, volume)
 
-def apply_trade(state: GameState, buyer: Buyer, volume: int, commodity: str, market_price: int) -> int:
+
+def apply_trade(
+    state: GameState, buyer: Buyer, volume: int, commodity: str, market_price: int, freight: int = 0
+) -> int:
     if volume <= 0:
         return 0
     price = buyer.price_for(market_price)
-    revenue = volume * price
+    revenue = volume * price - freight
     state.cash += revenue
     buyer.demand = max(0, buyer.demand - volume)
     buyer.reputation = min(REPUTATION_MAX, buyer.reputation + 1)
+    if state.buyer_sampler is not None:
+        state.buyer_sampler.refresh(buyer)
     if commodity == "petrol":
         state.petrol_storage -= volume
+        record_revenue(state, REFINING, volume, revenue)
+    else:
+        record_sale(state, "player", volume)
+        record_revenue(state, ONSHORE, volume, revenue)
     return revenue
@@ -5,9 +5,16 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
 from . import economy
-from .engine import ai, drilling, finance, leasing, market, production, projects
+from .engine import drilling, finance, leasing, logistics, market, offshore, pipelines, production, projects, rigs
+from .engine.decline import well_output
+from .engine.forecast import forecast_prices
+from .engine.valuation import value_offers
 from .models import Buyer, Contract
 from . import persistence
+from .frames import FrameScheduler
+from .headless import step_day
+from .heatmap import HEATMAP_MODES, HeatmapCache
+from .viewmodel import ButtonState, ViewModelCache
 from .state import (
     HUB_MAX_LEVEL,
     LOAN_CHUNK,
@@ -16,7 +23,6 @@ from .state import (
     REFINERY_BASE_CAPACITY,
     REFINERY_BUILD_COST,
     REFINERY_UPGRADE_COST,
-    REPUTATION_MAX,
     SCENARIOS,
     STORAGE_EXPANSION,
     SURVEY_COST,
@@ -55,12 +61,27 @@ class BlackOilApp:
         self.state = new_game_state(SCENARIOS[0])
         self.selected_tile = None
         self.fx_tick = 0
-        self.fx_running = False
+        self.show_frame_stats = False
+        self.tooltips_enabled = True
+        self.hover_tile = None
+        self.view_models = ViewModelCache()
+        self.frames = FrameScheduler(
+            after=self.root.after,
+            after_cancel=self.root.after_cancel,
+            draw=self._draw_frame,
+            is_animating=self._is_animating,
+        )
+
+        self.heatmap_var = tk.StringVar(value="off")
+        self.interference_var = tk.BooleanVar(value=self.state.interference)
+        self.heatmaps = HeatmapCache()
+        self.heatmap_image: tk.PhotoImage | None = None
+        self.heatmap_image_key: tuple[int, int] | None = None
 
         self._build_ui()
         self._bind_shortcuts()
         self._refresh_ui()
-        self._start_fx_loop()
+        self.frames.start()
 
     def _build_ui(self) -> None:
         self.root.geometry("1260x760")
@@ -78,6 +99,19 @@ class BlackOilApp:
         options_menu = tk.Menu(menubar, tearoff=0)
         options_menu.add_command(label="Toggle Sound", command=self.toggle_sound)
         options_menu.add_command(label="Toggle Tooltips", command=self.toggle_tooltips)
+        options_menu.add_command(label="Toggle Frame Stats", command=self.toggle_frame_stats)
+        options_menu.add_checkbutton(
+            label="Reservoir Interference", variable=self.interference_var, command=self.toggle_interference
+        )
+        heatmap_menu = tk.Menu(options_menu, tearoff=0)
+        heatmap_menu.add_radiobutton(
+            label="Off", variable=self.heatmap_var, value="off", command=self.frames.request_redraw
+        )
+        for mode, label in HEATMAP_MODES.items():
+            heatmap_menu.add_radiobutton(
+                label=label, variable=self.heatmap_var, value=mode, command=self.frames.request_redraw
+            )
+        options_menu.add_cascade(label="Heatmap", menu=heatmap_menu)
         menubar.add_cascade(label="Options", menu=options_menu)
 
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -99,6 +133,19 @@ class BlackOilApp:
         )
         self.canvas.grid(row=0, column=0, padx=16, pady=16)
         self.canvas.bind("<Button-1>", self._on_canvas_click)
+        self.canvas.bind("<Motion>", self._on_canvas_motion)
+        self.canvas.bind("<Leave>", self._hide_tooltip)
+
+        self.tooltip = tk.Label(
+            main_frame,
+            text="",
+            justify="left",
+            fg="#f8fafc",
+            bg="#1f2937",
+            font=("Helvetica", 9),
+            padx=6,
+            pady=3,
+        )
 
         panel = tk.Frame(main_frame, width=420, bg="#0b1120")
         panel.grid(row=0, column=1, sticky="n", padx=(0, 16), pady=16)
@@ -207,48 +254,63 @@ class BlackOilApp:
         self.storage_button = tk.Button(action_frame, text="Add Storage", command=self.add_storage, width=20)
         self.storage_button.grid(row=5, column=0, pady=2)
 
+        self.pipeline_button = tk.Button(
+            action_frame, text="Lay Pipeline", command=self.lay_pipeline, width=20
+        )
+        self.pipeline_button.grid(row=6, column=0, pady=2)
+
         self.refinery_button = tk.Button(
             action_frame, text="Build Refinery", command=self.build_refinery, width=20
         )
-        self.refinery_button.grid(row=6, column=0, pady=2)
+        self.refinery_button.grid(row=7, column=0, pady=2)
 
         self.upgrade_refinery_button = tk.Button(
             action_frame, text="Upgrade Refinery", command=self.upgrade_refinery, width=20
         )
-        self.upgrade_refinery_button.grid(row=7, column=0, pady=2)
+        self.upgrade_refinery_button.grid(row=8, column=0, pady=2)
 
         self.research_button = tk.Button(
             action_frame, text="Research Efficiency", command=self.research_upgrade, width=20
         )
-        self.research_button.grid(row=8, column=0, pady=2)
+        self.research_button.grid(row=9, column=0, pady=2)
 
         self.hub_button = tk.Button(
             action_frame, text="Build Transport Hub", command=self.build_hub, width=20
         )
-        self.hub_button.grid(row=9, column=0, pady=2)
+        self.hub_button.grid(row=10, column=0, pady=2)
 
         self.upgrade_hub_button = tk.Button(
             action_frame, text="Upgrade Transport Hub", command=self.upgrade_hub, width=20
         )
-        self.upgrade_hub_button.grid(row=10, column=0, pady=2)
+        self.upgrade_hub_button.grid(row=11, column=0, pady=2)
 
         self.trade_button = tk.Button(
             action_frame, text="Trade Market", command=self.trade_market, width=20
         )
-        self.trade_button.grid(row=11, column=0, pady=2)
+        self.trade_button.grid(row=12, column=0, pady=2)
+
+        self.order_book_button = tk.Button(
+            action_frame, text="Order Book", command=self.order_book, width=20
+        )
+        self.order_book_button.grid(row=13, column=0, pady=2)
 
         self.sell_button = tk.Button(action_frame, text="Sell Oil", command=self.sell_oil, width=20)
-        self.sell_button.grid(row=12, column=0, pady=2)
+        self.sell_button.grid(row=14, column=0, pady=2)
 
         self.sell_petrol_button = tk.Button(
             action_frame, text="Sell Petrol", command=self.sell_petrol, width=20
         )
-        self.sell_petrol_button.grid(row=13, column=0, pady=2)
+        self.sell_petrol_button.grid(row=15, column=0, pady=2)
 
         self.contract_button = tk.Button(
             action_frame, text="Contracts", command=self.manage_contracts, width=20
         )
-        self.contract_button.grid(row=14, column=0, pady=2)
+        self.contract_button.grid(row=16, column=0, pady=2)
+
+        self.offshore_button = tk.Button(
+            action_frame, text="Offshore Blocks", command=self.manage_offshore, width=20
+        )
+        self.offshore_button.grid(row=17, column=0, pady=2)
 
         self.auto_refine_var = tk.BooleanVar(value=self.state.auto_refine)
         self.auto_refine_check = tk.Checkbutton(
@@ -310,6 +372,16 @@ class BlackOilApp:
         )
         self.contract_label.pack(anchor="w", pady=(4, 2))
 
+        self.project_label = tk.Label(
+            panel,
+            text="",
+            justify="left",
+            fg="#e2e8f0",
+            bg="#0b1120",
+            font=("Helvetica", 9),
+        )
+        self.project_label.pack(anchor="w", pady=(2, 2))
+
         self.news_label = tk.Label(
             panel,
             text="",
@@ -339,136 +411,79 @@ class BlackOilApp:
         self.root.bind("n", lambda _event: self.next_day())
         self.root.bind("s", lambda _event: self.save_game())
         self.root.bind("l", lambda _event: self.load_game())
-
-    def _refresh_ui(self) -> None:
-        self.stats_label.config(
-            text=(
-                f"Scenario: {self.state.scenario.name}\n"
-                f"Day: {self.state.day}/{self.state.scenario.max_days}\n"
-                f"Cash: ${self.state.cash:,}\n"
-                f"Oil Price: ${self.state.price}/barrel\n"
-                f"Petrol Price: ${self.state.petrol_price}/barrel\n"
-                f"Stored Oil: {economy.total_storage(self.state, 'player')} barrels\n"
-                f"Stored Petrol: {self.state.petrol_storage} barrels\n"
-                f"Refinery: {'Online' if self.state.refinery.active else 'Offline'} "
-                f"(Cap {self.state.refinery.capacity})\n"
-                f"Research Level: {self.state.research_level}\n"
-                f"Transport Hub: {self.state.transport_hub.level}/{HUB_MAX_LEVEL}\n"
-                f"Demand Index: {self.state.market_demand}\n"
-                f"Loan Balance: ${self.state.loan_balance:,}\n"
-                f"Event: {self.state.event_message or 'None'}"
-            )
-        )
-        self.scenario_desc.config(text=self.state.scenario.description)
-        self.progress["value"] = (self.state.day / self.state.scenario.max_days) * 100
-
-        if self.selected_tile:
-            tile = self.selected_tile
-            reserve_text = "Unknown" if not tile.drilled else max(tile.reserve, 0)
-            survey_text = "None"
-            if tile.survey_low is not None and tile.survey_high is not None:
-                survey_text = f"{tile.survey_low}-{tile.survey_high}"
-            pump_text = f"Level {tile.pump_level}" if tile.has_pump else "None"
-            self.tile_label.config(
-                text=(
-                    f"Selected Tile ({tile.row + 1}, {tile.col + 1})\n"
-                    f"Owner: {tile.owner or 'Unowned'}\n"
-                    f"Survey: {survey_text}\n"
-                    f"Drilled: {'Yes' if tile.drilled else 'No'}\n"
-                    f"Pump: {pump_text}\n"
-                    f"Reserve: {reserve_text}\n"
-                    f"Storage: {tile.storage}/{tile.capacity} barrels"
-                )
-            )
-        else:
-            self.tile_label.config(text="Select a tile to inspect.")
-
-        self.news_label.config(text=self.state.news_message)
-        self._draw_grid()
-        self._update_buttons()
-        self._update_competitor_panel()
-
-    def _update_buttons(self) -> None:
-        tile = self.selected_tile
-        has_tile = tile is not None
-        is_player_tile = tile is not None and tile.owner == "player"
-        self.buy_button.config(
-            text=f"Buy Land (${self.state.scenario.land_cost})",
-            state=tk.NORMAL if has_tile and tile and tile.owner is None else tk.DISABLED,
-        )
-        self.survey_button.config(
-            text=f"Survey (${SURVEY_COST})",
-            state=tk.NORMAL if has_tile and is_player_tile else tk.DISABLED,
-        )
-        self.drill_button.config(
-            text=f"Drill Well (${self.state.scenario.drill_cost})",
-            state=tk.NORMAL if has_tile and is_player_tile and not tile.drilled else tk.DISABLED,
-        )
-        self.pump_button.config(
-            text=f"Build Pump (${self.state.scenario.pump_cost})",
-            state=tk.NORMAL
-            if has_tile and is_player_tile and tile.drilled and not tile.has_pump and not tile.depleted
-            else tk.DISABLED,
-        )
-        self.upgrade_button.config(
-            text=f"Upgrade Pump (${PUMP_UPGRADE_COST})",
-            state=tk.NORMAL
-            if has_tile and is_player_tile and tile.has_pump and tile.pump_level < MAX_PUMP_LEVEL
-            else tk.DISABLED,
-        )
-        self.storage_button.config(
-            text=f"Add Storage (${self.state.scenario.storage_cost})",
-            state=tk.NORMAL if has_tile and is_player_tile else tk.DISABLED,
-        )
-        self.refinery_button.config(
-            text=f"Build Refinery (${REFINERY_BUILD_COST})",
-            state=tk.NORMAL if self.state.refinery.level == 0 else tk.DISABLED,
-        )
-        self.upgrade_refinery_button.config(
-            text=f"Upgrade Refinery (${REFINERY_UPGRADE_COST})",
-            state=tk.NORMAL if self.state.refinery.active else tk.DISABLED,
-        )
-        self.research_button.config(
-            text=f"Research Efficiency (${RESEARCH_COST})",
-            state=tk.NORMAL if self.state.cash >= RESEARCH_COST else tk.DISABLED,
-        )
-        self.hub_button.config(
-            text=f"Build Transport Hub (${HUB_BUILD_COST})",
-            state=tk.NORMAL if not self.state.transport_hub.active else tk.DISABLED,
-        )
-        self.upgrade_hub_button.config(
-            text=f"Upgrade Transport Hub (${HUB_UPGRADE_COST})",
-            state=tk.NORMAL
-            if self.state.transport_hub.active and self.state.transport_hub.level < HUB_MAX_LEVEL
-            else tk.DISABLED,
-        )
-        self.trade_button.config(
-            state=tk.NORMAL if economy.total_storage(self.state, "player") > 0 or self.state.petrol_storage > 0 else tk.DISABLED
-        )
-        self.sell_button.config(
-            text="Sell Oil",
-            state=tk.NORMAL if economy.total_storage(self.state, "player") > 0 else tk.DISABLED,
-        )
-        self.sell_petrol_button.config(
-            text="Sell Petrol",
-            state=tk.NORMAL if self.state.petrol_storage > 0 else tk.DISABLED,
-        )
-
-    def _update_competitor_panel(self) -> None:
-        lines = ["Competitors:"]
-        for competitor in self.state.competitors:
-            lines.append(f"- {competitor.name}: ${competitor.cash:,}")
-        self.competitor_label.config(text="\n".join(lines))
-
-        if not self.state.contracts:
-            self.contract_label.config(text="Contracts: None")
-        else:
-            contract_lines = ["Contracts:"]
-            for contract in self.state.contracts:
-                contract_lines.append(
-                    f"- {contract.name}: {contract.delivered}/{contract.volume} ({contract.days_remaining}d)"
-                )
-            self.contract_label.config(text="\n".join(contract_lines))
+        self.root.bind("<Map>", self._on_window_event, add="+")
+        self.root.bind("<Unmap>", self._on_window_event, add="+")
+        self.root.bind("<FocusIn>", self._on_window_event, add="+")
+        self.root.bind("<FocusOut>", self._on_window_event, add="+")
+        self.root.bind_all("<Key>", lambda _event: self.frames.notify_input(), add="+")
+        self.root.bind_all("<Button>", lambda _event: self.frames.notify_input(), add="+")
+
+    def _on_window_event(self, event: tk.Event) -> None:
+        if event.widget is not self.root:
+            return
+        if event.type == tk.EventType.Map:
+            self.frames.set_visible(True)
+        elif event.type == tk.EventType.Unmap:
+            self.frames.set_visible(False)
+        elif event.type == tk.EventType.FocusIn:
+            self.frames.set_focused(True)
+        elif event.type == tk.EventType.FocusOut:
+            self.frames.set_focused(False)
+
+    def _refresh_ui(self, state_changed: bool = True) -> None:
+        if state_changed:
+            self.state.touch()
+        panel = self.view_models.panel(self.state)
+        tile_view = self.view_models.tile(self.state, self.selected_tile)
+
+        self._set_text(self.stats_label, panel.stats_text)
+        self._set_text(self.scenario_desc, self.state.scenario.description)
+        self.progress["value"] = panel.progress
+        self._set_text(self.tile_label, tile_view.text)
+        self._set_text(self.news_label, self.state.news_message)
+        if self.interference_var.get() != self.state.interference:
+            self.interference_var.set(self.state.interference)
+        self.frames.request_redraw()
+        self._update_buttons(panel.buttons)
+        self._update_buttons(tile_view.buttons)
+        self._set_text(self.competitor_label, panel.competitor_text)
+        self._set_text(self.contract_label, panel.contract_text)
+        self._set_text(self.project_label, panel.project_text)
+        if self.hover_tile is not None:
+            hover = self.hover_tile
+            if self.state.tile_at(hover.row, hover.col) is hover:
+                self._set_text(self.tooltip, self._tooltip_text(hover))
+            else:
+                self._hide_tooltip()
+
+    def _set_text(self, widget: tk.Widget, text: str) -> None:
+        if widget.cget("text") != text:
+            widget.config(text=text)
+
+    def _update_buttons(self, states: dict[str, ButtonState]) -> None:
+        buttons = {
+            "buy": self.buy_button,
+            "survey": self.survey_button,
+            "drill": self.drill_button,
+            "pump": self.pump_button,
+            "upgrade": self.upgrade_button,
+            "storage": self.storage_button,
+            "pipeline": self.pipeline_button,
+            "refinery": self.refinery_button,
+            "upgrade_refinery": self.upgrade_refinery_button,
+            "research": self.research_button,
+            "hub": self.hub_button,
+            "upgrade_hub": self.upgrade_hub_button,
+            "trade": self.trade_button,
+            "order_book": self.order_book_button,
+            "sell": self.sell_button,
+            "sell_petrol": self.sell_petrol_button,
+        }
+        for name, button_state in states.items():
+            button = buttons[name]
+            state = tk.NORMAL if button_state.enabled else tk.DISABLED
+            if button.cget("text") != button_state.text or str(button.cget("state")) != state:
+                button.config(text=button_state.text, state=state)
 
     def _set_summary(self, snapshot: economy.EconomySnapshot) -> None:
         lines = ["End of Day Summary"]
@@ -482,20 +497,27 @@ class BlackOilApp:
             lines.append(f"Maintenance: ${snapshot.maintenance_cost}")
         if snapshot.interest_cost:
             lines.append(f"Interest: ${snapshot.interest_cost}")
+        if snapshot.fiscal_cost:
+            lines.append(f"Royalties & taxes: ${snapshot.fiscal_cost}")
         if snapshot.events:
             lines.extend(snapshot.events)
         self.summary_label.config(text="\n".join(lines))
 
-    def _start_fx_loop(self) -> None:
-        if self.fx_running:
-            return
-        self.fx_running = True
-        self._tick_fx()
+    def _is_animating(self) -> bool:
+        return self.selected_tile is not None or self.view_models.panel(self.state).has_pumps
 
-    def _tick_fx(self) -> None:
+    def _draw_frame(self) -> None:
         self.fx_tick = (self.fx_tick + 1) % 120
         self._draw_grid()
-        self.root.after(180, self._tick_fx)
+        if self.show_frame_stats:
+            self.canvas.create_text(
+                8,
+                8,
+                anchor="nw",
+                text=self.frames.stats.overlay_text(),
+                fill="#f8fafc",
+                font=("Courier", 9, "bold"),
+            )
 
     def _play_sound(self, action: str) -> None:
         if action in {"buy", "sell", "loan", "advance", "build"}:
@@ -510,22 +532,57 @@ class BlackOilApp:
         tile = self._tile_at(event.x, event.y)
         if tile:
             self.selected_tile = tile
-            self._refresh_ui()
+            self._refresh_ui(state_changed=False)
+
+    def _tile_size(self) -> int:
+        return max(1, min(MAP_PIXEL_SIZE // self.state.scenario.grid_size, 70))
 
     def _tile_at(self, x: int, y: int):
-        col = x // self.tile_size
-        row = y // self.tile_size
-        for tile in self.state.tiles:
-            if tile.row == row and tile.col == col:
-                return tile
-        return None
+        if x < 0 or y < 0:
+            return None
+        size = self._tile_size()
+        return self.state.tile_at(y // size, x // size)
+
+    def _on_canvas_motion(self, event: tk.Event) -> None:
+        if not self.tooltips_enabled:
+            return
+        tile = self._tile_at(event.x, event.y)
+        if tile is None:
+            self._hide_tooltip()
+            return
+        if tile is not self.hover_tile:
+            self.hover_tile = tile
+            self.tooltip.config(text=self._tooltip_text(tile))
+        self.tooltip.place(in_=self.canvas, x=event.x + 14, y=event.y + 14)
+        self.tooltip.lift()
+
+    def _hide_tooltip(self, _event: tk.Event | None = None) -> None:
+        self.hover_tile = None
+        self.tooltip.place_forget()
+
+    def _tooltip_text(self, tile) -> str:
+        lines = [f"({tile.row + 1}, {tile.col + 1}) {tile.owner or 'Unowned'}"]
+        if tile.survey_low is not None and tile.survey_high is not None:
+            lines.append(f"Survey: {tile.survey_low}-{tile.survey_high}")
+        if tile.drilled:
+            lines.append(f"Reserve: {max(tile.reserve, 0)}")
+        if tile.has_pump:
+            lines.append(f"Pump L{tile.pump_level}: {well_output(self.state, tile)}/day")
+        if tile.owner == "player":
+            lines.append(f"Storage: {tile.storage}/{tile.capacity}")
+        return "\n".join(lines)
 
     def _draw_grid(self) -> None:
         self.canvas.delete("all")
         grid_size = self.state.scenario.grid_size
-        self.tile_size = min(MAP_PIXEL_SIZE // grid_size, 70)
+        self.tile_size = self._tile_size()
         canvas_size = self.tile_size * grid_size
         self.canvas.config(width=canvas_size, height=canvas_size)
+        mode = self.heatmap_var.get()
+        if mode != "off":
+            # The heatmap image covers every tile, so nothing is drawn beneath it.
+            self._draw_heatmap(mode, canvas_size)
+            return
         self._draw_background(canvas_size)
 
         selection_pulse = 1 + (self.fx_tick % 6) * 0.08
@@ -659,11 +716,37 @@ class BlackOilApp:
                     outline="",
                 )
 
-        for tile in self.state.tiles:
-            if tile.owner == "player" and tile.has_pump:
-                self._draw_pipeline(tile, self.tile_size)
+        if self.state.pipelines:
+            self._draw_pipelines(self.tile_size)
         self._draw_hub(canvas_size)
 
+    def _draw_heatmap(self, mode: str, canvas_size: int) -> None:
+        layer = self.heatmaps.layer(self.state, mode)
+        key = (layer.version, self.tile_size)
+        if self.heatmap_image is None or self.heatmap_image_key != key:
+            # One pixel per tile, scaled up once; only rebuilt when the layer changes.
+            source = tk.PhotoImage(width=layer.size, height=layer.size)
+            source.put(layer.data)
+            self.heatmap_image = source.zoom(self.tile_size, self.tile_size)
+            self.heatmap_image_key = key
+        self.canvas.create_image(0, 0, anchor="nw", image=self.heatmap_image)
+        self._draw_grid_roads(canvas_size)
+        if self.selected_tile is not None:
+            tile = self.selected_tile
+            x0 = tile.col * self.tile_size
+            y0 = tile.row * self.tile_size
+            self.canvas.create_rectangle(
+                x0 + 2, y0 + 2, x0 + self.tile_size - 2, y0 + self.tile_size - 2, outline="#fbbf24", width=3
+            )
+        self.canvas.create_text(
+            canvas_size - 8,
+            8,
+            anchor="ne",
+            text=HEATMAP_MODES[mode],
+            fill="#f8fafc",
+            font=("Helvetica", 9, "bold"),
+        )
+
     def _draw_background(self, canvas_size: int) -> None:
         sky, mid, ground = self._theme_palette()
         step = max(8, canvas_size // 30)
@@ -958,27 +1041,27 @@ class BlackOilApp:
             return "#4b5563", "#64748b"
         return "#7c5c3f", "#8b6b4c"
 
-    def _draw_pipeline(self, tile, size: int) -> None:
-        x0 = tile.col * size
-        y0 = tile.row * size
-        x1 = x0 + size
-        y1 = y0 + size
-        self.canvas.create_line(
-            x0 + size * 0.1,
-            y1 - size * 0.2,
-            x1 - size * 0.1,
-            y1 - size * 0.2,
-            fill="#0ea5e9",
-            width=3,
-        )
-        self.canvas.create_oval(
-            x1 - size * 0.16,
-            y1 - size * 0.28,
-            x1 - size * 0.06,
-            y1 - size * 0.18,
-            fill="#0ea5e9",
-            outline="",
-        )
+    def _draw_pipelines(self, size: int) -> None:
+        graph = pipelines.pipeline_graph(self.state)
+        half = size / 2
+        for row_a, col_a, row_b, col_b in self.state.pipelines:
+            color = "#0ea5e9" if graph.connected(row_a, col_a) else "#64748b"
+            self.canvas.create_line(
+                col_a * size + half,
+                row_a * size + half,
+                col_b * size + half,
+                row_b * size + half,
+                fill=color,
+                width=3,
+            )
+            self.canvas.create_oval(
+                col_a * size + half - size * 0.05,
+                row_a * size + half - size * 0.05,
+                col_a * size + half + size * 0.05,
+                row_a * size + half + size * 0.05,
+                fill=color,
+                outline="",
+            )
 
     def new_game(self) -> None:
         scenario_name = self.scenario_var.get()
@@ -995,14 +1078,22 @@ class BlackOilApp:
         )
         if not path:
             return
-        save_game(self.state, path)
+        persistence.save_game(self.state, path)
         self._log(f"Game saved to {path}.")
 
     def load_game(self) -> None:
         path = filedialog.askopenfilename(filetypes=[("Black Oil Save", "*.json")])
         if not path:
             return
-        self.state = load_game(path)
+        state = persistence.load_game(path)
+        if state.chunked:
+            messagebox.showinfo(
+                "Load Game",
+                f"This save is a {state.scenario.grid_size}x{state.scenario.grid_size} map, too large for the "
+                "game window. Use 'blackoil inspect-save' to review it.",
+            )
+            return
+        self.state = state
         self.scenario_var.set(self.state.scenario.name)
         self.selected_tile = None
         self._log(f"Game loaded from {path}.")
@@ -1012,7 +1103,13 @@ class BlackOilApp:
         messagebox.showinfo("Sound", "Sound toggle is handled by system beeps in this prototype.")
 
     def toggle_tooltips(self) -> None:
-        messagebox.showinfo("Tooltips", "Tooltips are not implemented in this refactor yet.")
+        self.tooltips_enabled = not self.tooltips_enabled
+        if not self.tooltips_enabled:
+            self._hide_tooltip()
+
+    def toggle_frame_stats(self) -> None:
+        self.show_frame_stats = not self.show_frame_stats
+        self.frames.request_redraw()
 
     def show_about(self) -> None:
         messagebox.showinfo(
@@ -1030,6 +1127,10 @@ class BlackOilApp:
             f"- Contract Delivered: {self.state.total_contract_delivered} barrels\n",
         )
 
+    def toggle_interference(self) -> None:
+        self.state.interference = bool(self.interference_var.get())
+        self._refresh_ui()
+
     def toggle_auto_refine(self) -> None:
         self.state.auto_refine = bool(self.auto_refine_var.get())
         self._refresh_ui()
@@ -1057,7 +1158,7 @@ class BlackOilApp:
     def drill_well(self) -> None:
         if not self.selected_tile:
             return
-        success, message = drilling.drill_well(self.state, self.selected_tile)
+        success, message = rigs.queue_well(self.state, self.selected_tile)
         if not success:
             messagebox.showinfo("Drill Well", message)
             return
@@ -1067,7 +1168,7 @@ class BlackOilApp:
     def build_pump(self) -> None:
         if not self.selected_tile:
             return
-        success, message = drilling.build_pump(self.state, self.selected_tile)
+        success, message = rigs.queue_pump(self.state, self.selected_tile)
         if not success:
             messagebox.showinfo("Build Pump", message)
             return
@@ -1084,6 +1185,16 @@ class BlackOilApp:
         self._log(message)
         self._refresh_ui()
 
+    def lay_pipeline(self) -> None:
+        if not self.selected_tile:
+            return
+        success, message = pipelines.lay_pipeline(self.state, self.selected_tile)
+        if not success:
+            messagebox.showinfo("Pipeline", message)
+            return
+        self._log(message)
+        self._refresh_ui()
+
     def add_storage(self) -> None:
         if not self.selected_tile:
             return
@@ -1139,13 +1250,14 @@ class BlackOilApp:
         self._refresh_ui()
 
     def trade_market(self) -> None:
-        if economy.total_storage(self.state, "player") <= 0 and self.state.petrol_storage <= 0:
+        panel = self.view_models.panel(self.state)
+        if panel.stored_oil <= 0 and self.state.petrol_storage <= 0:
             return
         commodity = _TradeDialog.ask_commodity(self.root)
         if commodity is None:
             return
         if commodity == "oil":
-            available = economy.total_storage(self.state, "player")
+            available = panel.stored_oil
             market_price = self.state.price
         else:
             available = self.state.petrol_storage
@@ -1161,27 +1273,54 @@ class BlackOilApp:
             available=available,
             commodity=commodity,
             market_price=market_price,
+            forecast_text=forecast_prices(self.state).summary(commodity),
         )
         result = dialog.show()
         if not result:
             return
-        buyer, volume, revenue = result
-        if commodity == "oil":
-            economy.withdraw_oil(self.state, volume)
-        else:
-            self.state.petrol_storage -= volume
-        self.state.cash += revenue
-        buyer.demand = max(0, buyer.demand - volume)
-        buyer.reputation = min(REPUTATION_MAX, buyer.reputation + 1)
+        buyer, volume, _revenue = result
+        freight = logistics.ship_oil(self.state, volume).freight if commodity == "oil" else 0
+        revenue = apply_trade(self.state, buyer, volume, commodity, market_price, freight)
         self._log(f"Traded {volume} barrels of {commodity} with {buyer.name} for ${revenue}.")
         self._refresh_ui()
 
+    def order_book(self) -> None:
+        panel = self.view_models.panel(self.state)
+        if panel.stored_oil <= 0 and self.state.petrol_storage <= 0:
+            return
+        commodity = _TradeDialog.ask_commodity(self.root)
+        if commodity is None:
+            return
+        available = panel.stored_oil if commodity == "oil" else self.state.petrol_storage
+        committed = sum(order.remaining for order in market.open_asks(self.state, "player", commodity))
+        available -= committed
+        if available <= 0:
+            messagebox.showinfo("Order Book", f"No uncommitted {commodity} available to offer.")
+            return
+        book = market.order_book(self.state, commodity)
+        result = _AskDialog(
+            self.root,
+            commodity=commodity,
+            available=available,
+            market_price=market.market_price(self.state, commodity),
+            bids=book.depth("bid", self.state.day),
+        ).show()
+        if not result:
+            return
+        volume, price = result
+        success, message, _order = market.post_ask(self.state, "player", commodity, volume, price)
+        if not success:
+            messagebox.showinfo("Order Book", message)
+            return
+        self._log(message)
+        self._refresh_ui()
+
     def sell_oil(self) -> None:
         success, message, revenue = production.sell_oil(self.state)
         if not success:
             messagebox.showinfo("Sell Oil", message)
             return
-        self._log(f\"{message} Revenue: ${revenue}.\")
+        self._log(f"{message} Revenue: ${revenue}.")
         self._refresh_ui()
 
     def sell_petrol(self) -> None:
@@ -1189,7 +1328,7 @@ class BlackOilApp:
         if not success:
             messagebox.showinfo("Sell Petrol", message)
             return
-        self._log(f\"{message} Revenue: ${revenue}.\")
+        self._log(f"{message} Revenue: ${revenue}.")
         self._refresh_ui()
 
     def manage_contracts(self) -> None:
@@ -1198,20 +1337,56 @@ class BlackOilApp:
             self.root,
             title="Contracts",
             offers=offers,
-            available=economy.total_storage(self.state, "player"),
+            available=self.view_models.panel(self.state).stored_oil,
             commodity="oil",
             market_price=self.state.price,
             contract_mode=True,
+            forecast_text=forecast_prices(self.state).summary("oil"),
+            offer_notes=[valuation.summary() for valuation in value_offers(self.state, offers)],
         )
         result = dialog.show()
         if not result:
             return
         contract, volume, _revenue = result
-        contract.volume = volume
-        self.state.contracts.append(contract)
+        market.sign_contract(self.state, contract, volume)
         self._log(f"Signed contract: {contract.name} for {contract.volume} barrels.")
         self._refresh_ui()
 
+    def manage_offshore(self) -> None:
+        blocks = offshore.offshore_blocks(self.state)
+        forecasts = offshore.availability_forecast(self.state)
+        lines = []
+        for block, availability in zip(blocks, forecasts):
+            job = rigs.queued_block(self.state, block)
+            if block.owner is None:
+                status = f"Available (${offshore.OFFSHORE_LEASE_COST})"
+            elif block.owner != "player":
+                status = f"Held by {block.owner}"
+            elif job is not None:
+                status = f"Rig {job.rig + 1} ({job.rig_type}) installing, done day {job.finish_day()}"
+            elif not block.developed:
+                status = f"Leased, develop ${offshore.OFFSHORE_DEVELOP_COST}"
+            else:
+                status = f"Producing, {block.reserve} barrels left"
+            lines.append(
+                f"{block.name} ({block.water_depth}, {block.output_rate} bbl/day) - {status}\n"
+                f"    {availability.summary()}"
+            )
+        choice = _OffshoreDialog(self.root, lines).show()
+        if choice is None:
+            return
+        action, index = choice
+        block = blocks[index]
+        if action == "lease":
+            success, message = offshore.lease_block(self.state, block)
+        else:
+            success, message = rigs.queue_block(self.state, block)
+        if not success:
+            messagebox.showinfo("Offshore", message)
+            return
+        self._log(message)
+        self._refresh_ui()
+
     def take_loan(self) -> None:
         success, message = finance.take_loan(self.state)
         if not success:
@@ -1232,23 +1407,14 @@ class BlackOilApp:
         if self.state.day >= self.state.scenario.max_days:
             self._final_score()
             return
-        self.state.day += 1
-        snapshot = economy.advance_day(self.state)
-        ai_events = ai.competitor_turns(self.state)
-        for event in ai_events:
-            snapshot.events.append(event)
+        snapshot = step_day(self.state)
         self._set_summary(snapshot)
         self._refresh_ui()
         if self.state.day == self.state.scenario.max_days:
             self._final_score()
 
     def _final_score(self) -> None:
-        assets = (
-            self.state.cash
-            + economy.total_storage(self.state, "player") * self.state.price
-            + self.state.petrol_storage * self.state.petrol_price
-            - self.state.loan_balance
-        )
+        assets = self.view_models.panel(self.state).net_assets
         messagebox.showinfo(
             "Season Over",
             f"You finished with ${assets:,} in assets.\nThanks for playing Black Oil!",
@@ -1271,6 +1437,8 @@ class _OfferDialog:
         commodity: str,
         market_price: int,
         contract_mode: bool = False,
+        forecast_text: str = "",
+        offer_notes: list[str] | None = None,
     ) -> None:
         self.root = root
         self.title = title
@@ -1290,9 +1458,9 @@ class _OfferDialog:
             pady=(10, 6)
         )
 
-        self.listbox = tk.Listbox(self.window, width=60, height=6)
+        self.listbox = tk.Listbox(self.window, width=100 if offer_notes else 60, height=6)
         self.listbox.pack(padx=10)
-        for offer in offers:
+        for index, offer in enumerate(offers):
             if isinstance(offer, Buyer):
                 price = offer.price_for(market_price)
                 self.listbox.insert(
@@ -1300,10 +1468,15 @@ class _OfferDialog:
                     f"{offer.name} ({offer.category}) - Demand {offer.demand} @ ${price}",
                 )
             else:
-                self.listbox.insert(
-                    tk.END,
-                    f"{offer.name} - {offer.volume} barrels @ ${offer.price} ({offer.days_remaining} days)",
-                )
+                line = f"{offer.name} - {offer.volume} barrels @ ${offer.price} ({offer.days_remaining} days)"
+                if offer_notes:
+                    line = f"{line} | {offer_notes[index]}"
+                self.listbox.insert(tk.END, line)
+
+        if forecast_text:
+            tk.Label(self.window, text=forecast_text, fg="#475569", font=("Helvetica", 9, "italic")).pack(
+                pady=(4, 0)
+            )
 
         self.volume_var = tk.IntVar(value=min(available, offers[0].demand if offers else 0))
         self.volume_scale = tk.Scale(
@@ -1370,6 +1543,105 @@ class _OfferDialog:
         return self.result
 
 
+class _OffshoreDialog:
+    def __init__(self, root: tk.Tk, lines: list[str]) -> None:
+        self.root = root
+        self.result: tuple[str, int] | None = None
+
+        self.window = tk.Toplevel(root)
+        self.window.title("Offshore Blocks")
+        self.window.grab_set()
+        self.window.resizable(False, False)
+
+        tk.Label(self.window, text="Offshore Blocks", font=("Helvetica", 12, "bold")).pack(pady=(10, 6))
+        self.listbox = tk.Listbox(self.window, width=64, height=len(lines) * 2)
+        for line in lines:
+            for part in line.split("\n"):
+                self.listbox.insert(tk.END, part)
+        self.listbox.pack(padx=10)
+
+        buttons = tk.Frame(self.window)
+        buttons.pack(pady=10)
+        tk.Button(buttons, text="Lease", command=lambda: self._confirm("lease")).grid(row=0, column=0, padx=6)
+        tk.Button(buttons, text="Develop", command=lambda: self._confirm("develop")).grid(row=0, column=1, padx=6)
+        tk.Button(buttons, text="Close", command=self.window.destroy).grid(row=0, column=2, padx=6)
+
+    def _confirm(self, action: str) -> None:
+        selection = self.listbox.curselection()
+        if not selection:
+            return
+        # Each block takes two rows: its status line and its forecast line.
+        self.result = (action, selection[0] // 2)
+        self.window.destroy()
+
+    def show(self) -> tuple[str, int] | None:
+        self.root.wait_window(self.window)
+        return self.result
+
+
+class _AskDialog:
+    def __init__(
+        self,
+        root: tk.Tk,
+        commodity: str,
+        available: int,
+        market_price: int,
+        bids: list[tuple[int, int]],
+    ) -> None:
+        self.root = root
+        self.available = available
+        self.result: tuple[int, int] | None = None
+
+        self.window = tk.Toplevel(root)
+        self.window.title("Order Book")
+        self.window.grab_set()
+        self.window.resizable(False, False)
+
+        tk.Label(self.window, text=f"Post Ask - {commodity.title()}", font=("Helvetica", 12, "bold")).pack(
+            pady=(10, 6)
+        )
+        bid_lines = [f"${price}: {volume} barrels" for price, volume in bids] or ["No open bids."]
+        tk.Label(self.window, text="Best bids\n" + "\n".join(bid_lines), justify="left").pack(padx=10)
+
+        self.volume_var = tk.IntVar(value=min(available, TRADE_MAX_VOLUME))
+        tk.Scale(
+            self.window,
+            from_=0,
+            to=available,
+            orient=tk.HORIZONTAL,
+            label="Volume",
+            variable=self.volume_var,
+            length=280,
+        ).pack(pady=4)
+
+        self.price_var = tk.IntVar(value=market_price)
+        tk.Scale(
+            self.window,
+            from_=max(1, market_price // 2),
+            to=market_price * 2,
+            orient=tk.HORIZONTAL,
+            label="Ask Price",
+            variable=self.price_var,
+            length=280,
+        ).pack(pady=4)
+
+        buttons = tk.Frame(self.window)
+        buttons.pack(pady=10)
+        tk.Button(buttons, text="Post", command=self._confirm).grid(row=0, column=0, padx=6)
+        tk.Button(buttons, text="Cancel", command=self.window.destroy).grid(row=0, column=1, padx=6)
+
+    def _confirm(self) -> None:
+        volume = min(self.volume_var.get(), self.available)
+        if volume <= 0:
+            return
+        self.result = (volume, self.price_var.get())
+        self.window.destroy()
+
+    def show(self) -> tuple[int, int] | None:
+        self.root.wait_window(self.window)
+        return self.result
+
+
 class _TradeDialog:
     @staticmethod
     def ask_commodity(root: tk.Tk) -> str | None:
@@ -1415,3 +1687,9 @@ def _generate_contract_offers(state: GameState) -> list[Contract]:
             )
         )
     return offers
+
+
+def launch() -> None:
+    root = tk.Tk()
+    BlackOilApp(root)
+    root.mainloop()
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from .engine.logistics import tile_route
+from .engine.outlook import outlook_cache
+from .engine.pipelines import PIPE_SEGMENT_COST, is_connected
+from .engine.projects import HUB, HUB_UPGRADE, REFINERY, REFINERY_UPGRADE, RESEARCH
+from .engine.regulation import assess_ledger
+from .engine.rigs import PUMP, campaign_lines, queued_job
+from .models import Tile
+from .state import (
+    HUB_BUILD_COST,
+    HUB_MAX_LEVEL,
+    HUB_UPGRADE_COST,
+    MAX_PUMP_LEVEL,
+    PUMP_UPGRADE_COST,
+    REFINERY_BUILD_COST,
+    REFINERY_UPGRADE_COST,
+    RESEARCH_COST,
+    SURVEY_COST,
+    GameState,
+)
+
+
+@dataclass
+class ButtonState:
+    text: str
+    enabled: bool
+
+
+@dataclass
+class PanelViewModel:
+    stored_oil: int
+    net_assets: int
+    stats_text: str
+    progress: float
+    competitor_text: str
+    contract_text: str
+    project_text: str
+    has_pumps: bool
+    buttons: dict[str, ButtonState] = field(default_factory=dict)
+
+
+@dataclass
+class TileViewModel:
+    text: str
+    buttons: dict[str, ButtonState] = field(default_factory=dict)
+
+
+class ViewModelCache:
+    """Derives panel text and button states once per state revision.
+
+    The cache is keyed on the state object and its ``revision`` counter, so
+    repeated refreshes (selection changes, redraws) reuse the same values
+    until something bumps the revision.
+    """
+
+    def __init__(self) -> None:
+        self._state: GameState | None = None
+        self._revision = -1
+        self._panel: PanelViewModel | None = None
+        self._tile: TileViewModel | None = None
+        self._tile_source: Tile | None = None
+
+    def invalidate(self) -> None:
+        self._state = None
+        self._panel = None
+        self._tile = None
+
+    def _sync(self, state: GameState) -> None:
+        # Identity check, not id(): a new state may reuse a freed object's id.
+        if state is not self._state or state.revision != self._revision:
+            self._state = state
+            self._revision = state.revision
+            self._panel = None
+            self._tile = None
+
+    def panel(self, state: GameState) -> PanelViewModel:
+        self._sync(state)
+        if self._panel is None:
+            self._panel = build_panel(state)
+        return self._panel
+
+    def tile(self, state: GameState, tile: Tile | None) -> TileViewModel:
+        self._sync(state)
+        if self._tile is None or tile is not self._tile_source:
+            self._tile = build_tile(state, tile)
+            self._tile_source = tile
+        return self._tile
+
+
+def storage_by_owner(state: GameState) -> dict[str, int]:
+    totals: dict[str, int] = {}
+    for tile in state.tiles:
+        if tile.owner is not None and tile.storage:
+            totals[tile.owner] = totals.get(tile.owner, 0) + tile.storage
+    return totals
+
+
+def net_assets(state: GameState, stored_oil: int) -> int:
+    return (
+        state.cash
+        + stored_oil * state.price
+        + state.petrol_storage * state.petrol_price
+        - state.loan_balance
+    )
+
+
+def build_panel(state: GameState) -> PanelViewModel:
+    stored_oil = storage_by_owner(state).get("player", 0)
+    stats_text = (
+        f"Scenario: {state.scenario.name}\n"
+        f"Day: {state.day}/{state.scenario.max_days}\n"
+        f"Cash: ${state.cash:,}\n"
+        f"Oil Price: ${state.price}/barrel\n"
+        f"Petrol Price: ${state.petrol_price}/barrel\n"
+        f"Stored Oil: {stored_oil} barrels\n"
+        f"Stored Petrol: {state.petrol_storage} barrels\n"
+        f"Refinery: {'Online' if state.refinery.active else 'Offline'} "
+        f"(Cap {state.refinery.capacity})\n"
+        f"Research Level: {state.research_level}\n"
+        f"Transport Hub: {state.transport_hub.level}/{HUB_MAX_LEVEL}\n"
+        f"Demand Index: {state.market_demand}\n"
+        f"Loan Balance: ${state.loan_balance:,}\n"
+        f"Taxes Accrued: ${assess_ledger(state.revenue_ledger).total + state.tax_arrears:,}\n"
+        f"Event: {state.event_message or 'None'}"
+    )
+
+    competitor_lines = ["Competitors:"]
+    for competitor in state.competitors:
+        competitor_lines.append(f"- {competitor.name}: ${competitor.cash:,}")
+
+    if not state.contracts:
+        contract_text = "Contracts: None"
+    else:
+        contract_lines = ["Contracts:"]
+        for contract in state.contracts:
+            contract_lines.append(
+                f"- {contract.name}: {contract.delivered}/{contract.volume} ({contract.days_left(state.day)}d)"
+            )
+        contract_text = "\n".join(contract_lines)
+
+    if not state.projects:
+        project_text = "Projects: None"
+    else:
+        project_lines = ["Projects:"]
+        for project in state.projects:
+            project_lines.append(
+                f"- {project.name}: {project.progress(state.day):.0%} ({project.days_left(state.day)}d left)"
+            )
+        project_text = "\n".join(project_lines)
+    if state.drilling_jobs:
+        project_text += "\n" + "\n".join(["Drilling:", *campaign_lines(state)])
+
+    hub = state.transport_hub
+    building = {project.kind for project in state.projects}
+    buttons = {
+        "refinery": ButtonState(
+            f"Build Refinery (${REFINERY_BUILD_COST})", state.refinery.level == 0 and REFINERY not in building
+        ),
+        "upgrade_refinery": ButtonState(
+            f"Upgrade Refinery (${REFINERY_UPGRADE_COST})",
+            state.refinery.active and REFINERY_UPGRADE not in building,
+        ),
+        "research": ButtonState(
+            f"Research Efficiency (${RESEARCH_COST})", state.cash >= RESEARCH_COST and RESEARCH not in building
+        ),
+        "hub": ButtonState(f"Build Transport Hub (${HUB_BUILD_COST})", not hub.active and HUB not in building),
+        "upgrade_hub": ButtonState(
+            f"Upgrade Transport Hub (${HUB_UPGRADE_COST})",
+            hub.active and hub.level < HUB_MAX_LEVEL and HUB_UPGRADE not in building,
+        ),
+        "trade": ButtonState("Trade Market", stored_oil > 0 or state.petrol_storage > 0),
+        "order_book": ButtonState("Order Book", stored_oil > 0 or state.petrol_storage > 0),
+        "sell": ButtonState("Sell Oil", stored_oil > 0),
+        "sell_petrol": ButtonState("Sell Petrol", state.petrol_storage > 0),
+    }
+
+    return PanelViewModel(
+        stored_oil=stored_oil,
+        net_assets=net_assets(state, stored_oil),
+        stats_text=stats_text,
+        progress=(state.day / state.scenario.max_days) * 100,
+        competitor_text="\n".join(competitor_lines),
+        contract_text=contract_text,
+        project_text=project_text,
+        has_pumps=any(tile.has_pump for tile in state.tiles),
+        buttons=buttons,
+    )
+
+
+def build_tile(state: GameState, tile: Tile | None) -> TileViewModel:
+    scenario = state.scenario
+    is_player_tile = tile is not None and tile.owner == "player"
+    buttons = {
+        "buy": ButtonState(f"Buy Land (${scenario.land_cost})", tile is not None and tile.owner is None),
+        "survey": ButtonState(f"Survey (${SURVEY_COST})", is_player_tile),
+        "drill": ButtonState(
+            f"Drill Well (${scenario.drill_cost})",
+            is_player_tile and not tile.drilled and queued_job(state, tile) is None,
+        ),
+        "pump": ButtonState(
+            f"Build Pump (${scenario.pump_cost})",
+            is_player_tile
+            and tile.drilled
+            and not tile.has_pump
+            and not tile.depleted
+            and queued_job(state, tile, PUMP) is None,
+        ),
+        "upgrade": ButtonState(
+            f"Upgrade Pump (${PUMP_UPGRADE_COST})",
+            is_player_tile and tile.has_pump and tile.pump_level < MAX_PUMP_LEVEL,
+        ),
+        "storage": ButtonState(f"Add Storage (${scenario.storage_cost})", is_player_tile),
+        "pipeline": ButtonState(
+            f"Lay Pipeline (${PIPE_SEGMENT_COST})", is_player_tile and not is_connected(state, tile)
+        ),
+    }
+
+    if tile is None:
+        return TileViewModel(text="Select a tile to inspect.", buttons=buttons)
+
+    reserve_text = "Unknown" if not tile.drilled else max(tile.reserve, 0)
+    survey_text = "None"
+    if tile.survey_low is not None and tile.survey_high is not None:
+        survey_text = f"{tile.survey_low}-{tile.survey_high}"
+    pump_text = f"Level {tile.pump_level}" if tile.has_pump else "None"
+    text = (
+        f"Selected Tile ({tile.row + 1}, {tile.col + 1})\n"
+        f"Owner: {tile.owner or 'Unowned'}\n"
+        f"Survey: {survey_text}\n"
+        f"Drilled: {'Yes' if tile.drilled else 'No'}\n"
+        f"Pump: {pump_text}\n"
+        f"Reserve: {reserve_text}\n"
+        f"Storage: {tile.storage}/{tile.capacity} barrels"
+    )
+    if is_player_tile and tile.has_pump:
+        outlook = outlook_cache(state).outlook(state, tile)
+        text += f"\n{outlook.summary()}"
+    if is_player_tile:
+        option, cost = tile_route(state, tile)
+        pipe = "connected" if is_connected(state, tile) else "not connected"
+        text += f"\nPipeline: {pipe}\nShips by: {option.name} (${cost:.2f}/bbl)"
+    return TileViewModel(text=text, buttons=buttons)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable, Iterator
+
+from .models import Tile
+
+CHUNK_SIZE = 32
+# Maps above this many tiles are materialized chunk by chunk.
+EAGER_TILE_LIMIT = 250_000
+
+# Builds the row-major tiles of one window: (row, col, height, width).
+ChunkBuilder = Callable[[int, int, int, int], list[Tile]]
+
+
+def is_touched(tile: Tile) -> bool:
+    """Whether play has changed a tile from what the generator produces."""
+    return (
+        tile.owner is not None
+        or tile.drilled
+        or tile.survey_low is not None
+        or tile.storage > 0
+    )
+
+
+class ChunkedTiles:
+    """Tile store for very large maps that only holds materialized chunks.
+
+    This is deliberately not a list: it is never the full row-major grid,
+    so callers cannot index it by position. Iterating yields the tiles
+    generated so far, which always includes every owned, surveyed or
+    drilled tile; untouched tiles elsewhere are identical to what the
+    generator would produce, so day-to-day systems that scan the store see
+    everything that matters. ``tile_at`` generates a tile's chunk on first
+    access and ``release_idle`` drops chunks nobody has touched.
+    """
+
+    def __init__(self, size: int, build: ChunkBuilder, chunk_size: int = CHUNK_SIZE) -> None:
+        self.size = size
+        self.chunk_size = chunk_size
+        self._build = build
+        self._chunks: dict[tuple[int, int], list[Tile]] = {}
+        self._tiles: list[Tile] = []
+
+    def __iter__(self) -> Iterator[Tile]:
+        return iter(self._tiles)
+
+    def __len__(self) -> int:
+        """Tiles currently held, not the size of the map."""
+        return len(self._tiles)
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self._chunks)
+
+    def tile_at(self, row: int, col: int) -> Tile | None:
+        if not (0 <= row < self.size and 0 <= col < self.size):
+            return None
+        size = self.chunk_size
+        key = (row // size, col // size)
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            chunk = self._materialize(key)
+        top, left = key[0] * size, key[1] * size
+        width = min(size, self.size - left)
+        return chunk[(row - top) * width + (col - left)]
+
+    def release_idle(self) -> int:
+        """Drop chunks with no touched tile; returns how many were released."""
+        idle = [key for key, chunk in self._chunks.items() if not any(map(is_touched, chunk))]
+        for key in idle:
+            del self._chunks[key]
+        if idle:
+            self._tiles = [tile for chunk in self._chunks.values() for tile in chunk]
+        return len(idle)
+
+    def touched_tiles(self) -> list[Tile]:
+        return [tile for tile in self._tiles if is_touched(tile)]
+
+    def restore(self, tiles: Iterable[Tile]) -> None:
+        """Overlay saved tiles onto freshly generated chunks."""
+        size = self.chunk_size
+        for tile in tiles:
+            key = (tile.row // size, tile.col // size)
+            chunk = self._chunks.get(key) or self._materialize(key)
+            top, left = key[0] * size, key[1] * size
+            width = min(size, self.size - left)
+            chunk[(tile.row - top) * width + (tile.col - left)] = tile
+        self._tiles = [tile for chunk in self._chunks.values() for tile in chunk]
+
+    def _materialize(self, key: tuple[int, int]) -> list[Tile]:
+        size = self.chunk_size
+        top, left = key[0] * size, key[1] * size
+        chunk = self._build(top, left, min(size, self.size - top), min(size, self.size - left))
+        self._chunks[key] = chunk
+        self._tiles.extend(chunk)
+        return chunk
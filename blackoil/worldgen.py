@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import math
+
+NOISE_OCTAVES = 4
+NOISE_PERSISTENCE = 0.5
+NOISE_CONTRAST = 1.8
+RATE_FIELD_SALT = 0x9E3779B9
+RATE_RESERVE_SHARE = 0.6
+_MASK = 0xFFFFFFFF
+
+
+def value_noise(
+    width: int,
+    height: int,
+    seed: int,
+    period: float,
+    octaves: int = NOISE_OCTAVES,
+    persistence: float = NOISE_PERSISTENCE,
+    origin: tuple[int, int] = (0, 0),
+    scale: float = 1.0,
+    bias: float = 0.0,
+) -> list[list[float]]:
+    """Multi-octave value noise, one list of floats per row.
+
+    Each octave is a coarse lattice of random values smoothly interpolated
+    across the grid. Interpolation is separable: lattice rows are first
+    expanded to full width, then every output row is one blend of two
+    expanded rows, so the per-cell work is a single list comprehension.
+
+    Lattice values are hashed from their coordinates rather than drawn in
+    sequence, so any window (``origin`` is its top-left row and column)
+    matches the same cells of a full-map field exactly. ``scale`` and
+    ``bias`` are folded into the octave sums to save a pass over the grid.
+    """
+    origin_row, origin_col = origin
+    rows = [[bias] * width for _ in range(height)]
+    amplitude = scale
+    for octave in range(max(1, octaves)):
+        period = max(1.0, period)
+        offset_x = _hash(seed, octave, -1, 0) * period + origin_col
+        offset_y = _hash(seed, octave, 0, -1) * period + origin_row
+        first_x = math.floor(offset_x / period)
+        first_y = math.floor(offset_y / period)
+        cells_x = math.floor((width - 1 + offset_x) / period) - first_x + 2
+        cells_y = math.floor((height - 1 + offset_y) / period) - first_y + 2
+        lattice = [
+            [_hash(seed, octave, first_x + i, first_y + j) for i in range(cells_x)] for j in range(cells_y)
+        ]
+
+        columns = [_lerp_point((x + offset_x) / period, first_x) for x in range(width)]
+        expanded = [
+            [amplitude * (line[i] + (line[i + 1] - line[i]) * t) for i, t in columns] for line in lattice
+        ]
+        for y in range(height):
+            j, s = _lerp_point((y + offset_y) / period, first_y)
+            upper = expanded[j]
+            lower = expanded[j + 1]
+            rows[y] = [total + a + (b - a) * s for total, a, b in zip(rows[y], upper, lower)]
+
+        amplitude *= persistence
+        period /= 2
+    return rows
+
+
+def field_period(size: int) -> float:
+    """Coarsest noise period: roughly a third of the map, so reservoirs show
+    up as a few connected trends rather than per-tile static."""
+    return max(2.0, size / 3)
+
+
+def reservoir_field(
+    width: int,
+    height: int,
+    seed: int,
+    octaves: int = NOISE_OCTAVES,
+    period: float | None = None,
+    origin: tuple[int, int] = (0, 0),
+) -> list[list[float]]:
+    """Spatially correlated field clamped to [0, 1].
+
+    Noise is centred on its mean and scaled by a fixed contrast instead of
+    stretched to the observed range, so a window of a map and the full map
+    agree on every shared cell.
+    """
+    if period is None:
+        period = field_period(max(width, height))
+    total = sum(NOISE_PERSISTENCE**octave for octave in range(max(1, octaves)))
+    scale = NOISE_CONTRAST / total
+    bias = 0.5 - total / 2 * scale
+    rows = value_noise(width, height, seed, period, octaves, origin=origin, scale=scale, bias=bias)
+    return [[0.0 if value < 0.0 else 1.0 if value > 1.0 else value for value in row] for row in rows]
+
+
+def tile_fields(
+    size: int,
+    seed: int,
+    window: tuple[int, int, int, int] | None = None,
+) -> tuple[list[float], list[float]]:
+    """Row-major reserve and output-rate fields in [0, 1].
+
+    ``window`` is ``(row, col, height, width)`` within a ``size`` square map
+    and defaults to the whole map. Output rate follows the reserve trend
+    with its own texture mixed in, so rich areas tend to flow well without
+    every good tile being identical.
+    """
+    row, col, height, width = window if window is not None else (0, 0, size, size)
+    period = field_period(size)
+    reserves = reservoir_field(width, height, seed, period=period, origin=(row, col))
+    texture = reservoir_field(width, height, seed ^ RATE_FIELD_SALT, period=period, origin=(row, col))
+    share = RATE_RESERVE_SHARE
+    reserve_values = [value for line in reserves for value in line]
+    rate_values = [
+        share * value + (1 - share) * other
+        for reserve_row, texture_row in zip(reserves, texture)
+        for value, other in zip(reserve_row, texture_row)
+    ]
+    return reserve_values, rate_values
+
+
+def _lerp_point(position: float, first: int) -> tuple[int, float]:
+    index = math.floor(position)
+    t = position - index
+    return index - first, t * t * (3 - 2 * t)
+
+
+def _hash(seed: int, octave: int, x: int, y: int) -> float:
+    # Integer avalanche hash mapped to [0, 1); cheap enough for lattice points.
+    h = (x * 0x27D4EB2D ^ y * 0x165667B1 ^ seed * 0x9E3779B1 ^ octave * 0x85EBCA77) & _MASK
+    h ^= h >> 15
+    h = (h * 0x2C1B3C6D) & _MASK
+    h ^= h >> 12
+    h = (h * 0x297A2D39) & _MASK
+    h ^= h >> 15
+    return h / 4294967296
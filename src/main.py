@@ -1,5 +1,5 @@
-from blackoil.ui_tk import launch
+from blackoil.cli import main
 
 
 if __name__ == "__main__":
-    launch()
+    raise SystemExit(main(["play"]))